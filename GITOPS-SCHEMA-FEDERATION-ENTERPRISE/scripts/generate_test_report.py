@@ -9,9 +9,17 @@ including compatibility matrices, test results, and visualizations.
 import json
 import sys
 import os
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from types import ModuleType
+from typing import Dict, Iterator, List, Any, Optional, Set
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Try to import from project
 try:
@@ -25,237 +33,192 @@ except ImportError:
     COMPATIBILITY_TRANSITIONS = []
 
 
-class TestReportGenerator:
-    """Generate comprehensive test reports in HTML format."""
-
-    def __init__(self, output_dir: str = "test-reports"):
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-
-    def generate_html_report(
-        self,
-        test_results: Optional[Dict] = None,
-        compatibility_data: Optional[List] = None
-    ) -> str:
-        """Generate comprehensive HTML report."""
-
-        if compatibility_data is None:
-            compatibility_data = COMPATIBILITY_TRANSITIONS
-
-        html = self._build_html_template(test_results, compatibility_data)
-
-        output_file = self.output_dir / "compatibility-report.html"
-        with open(output_file, 'w') as f:
-            f.write(html)
-
-        return str(output_file)
-
-    def _build_html_template(
-        self,
-        test_results: Optional[Dict],
-        compatibility_data: List
-    ) -> str:
-        """Build complete HTML report template."""
-
-        # Build transition matrix
-        modes = [
-            "NONE",
-            "BACKWARD",
-            "BACKWARD_TRANSITIVE",
-            "FORWARD",
-            "FORWARD_TRANSITIVE",
-            "FULL",
-            "FULL_TRANSITIVE"
-        ]
-
-        # Create matrix lookup
-        matrix = {}
-        for from_mode in modes:
-            matrix[from_mode] = {}
-            for to_mode in modes:
-                if from_mode == to_mode:
-                    matrix[from_mode][to_mode] = "N/A"
-                else:
-                    # Find in compatibility data
-                    transition = next(
-                        (t for t in compatibility_data
-                         if t[0] == from_mode and t[1] == to_mode),
-                        None
-                    )
-                    if transition:
-                        matrix[from_mode][to_mode] = transition[2]  # risk_level
-                    else:
-                        matrix[from_mode][to_mode] = "UNKNOWN"
-
-        # Count statistics
-        stats = {
-            "SAFE": 0,
-            "RISKY": 0,
-            "DANGEROUS": 0,
-            "N/A": 0
-        }
-
-        for from_mode in modes:
-            for to_mode in modes:
-                risk = matrix[from_mode][to_mode]
-                stats[risk] = stats.get(risk, 0) + 1
-
-        # Build HTML
-        html = f"""<!DOCTYPE html>
+# Compatibility modes, in matrix row/column order
+_MODES = (
+    "NONE",
+    "BACKWARD",
+    "BACKWARD_TRANSITIVE",
+    "FORWARD",
+    "FORWARD_TRANSITIVE",
+    "FULL",
+    "FULL_TRANSITIVE"
+)
+
+# Symbol shown next to each risk level in the transition matrix
+_RISK_SYMBOL = {
+    "SAFE": "✅",
+    "RISKY": "⚠️",
+    "DANGEROUS": "🔴",
+    "N/A": "⏺️",
+    "UNKNOWN": "❓"
+}
+
+# CSS class used for each risk level in the matrix and transition list
+_CSS_CLASS = {
+    "SAFE": "safe",
+    "RISKY": "risky",
+    "DANGEROUS": "dangerous",
+    "N/A": "na",
+    "UNKNOWN": "unknown"
+}
+
+# Static report markup, defined once at import. Only the placeholders in
+# _HTML_SUMMARY and _HTML_TRANSITION_ITEM are filled in per report.
+_HTML_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Schema Compatibility Test Report</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.6;
             color: #333;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             padding: 20px;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
             background: white;
             border-radius: 10px;
             box-shadow: 0 10px 40px rgba(0,0,0,0.2);
             overflow: hidden;
-        }}
+        }
 
-        header {{
+        header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 40px;
             text-align: center;
-        }}
+        }
 
-        header h1 {{
+        header h1 {
             font-size: 2.5em;
             margin-bottom: 10px;
-        }}
+        }
 
-        header .subtitle {{
+        header .subtitle {
             font-size: 1.2em;
             opacity: 0.9;
-        }}
+        }
 
-        .stats {{
+        .stats {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             padding: 40px;
             background: #f8f9fa;
-        }}
+        }
 
-        .stat-card {{
+        .stat-card {
             background: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 8px rgba(0,0,0,0.1);
             text-align: center;
-        }}
+        }
 
-        .stat-card .number {{
+        .stat-card .number {
             font-size: 3em;
             font-weight: bold;
             margin-bottom: 10px;
-        }}
+        }
 
-        .stat-card .label {{
+        .stat-card .label {
             font-size: 1.1em;
             color: #666;
             text-transform: uppercase;
             letter-spacing: 1px;
-        }}
+        }
 
-        .stat-card.safe .number {{ color: #28a745; }}
-        .stat-card.risky .number {{ color: #ffc107; }}
-        .stat-card.dangerous .number {{ color: #dc3545; }}
-        .stat-card.na .number {{ color: #6c757d; }}
+        .stat-card.safe .number { color: #28a745; }
+        .stat-card.risky .number { color: #ffc107; }
+        .stat-card.dangerous .number { color: #dc3545; }
+        .stat-card.na .number { color: #6c757d; }
 
-        .content {{
+        .content {
             padding: 40px;
-        }}
+        }
 
-        h2 {{
+        h2 {
             color: #667eea;
             margin: 30px 0 20px 0;
             padding-bottom: 10px;
             border-bottom: 2px solid #667eea;
-        }}
+        }
 
-        .matrix-container {{
+        .matrix-container {
             overflow-x: auto;
             margin: 20px 0;
-        }}
+        }
 
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 20px 0;
             font-size: 0.9em;
-        }}
+        }
 
-        th, td {{
+        th, td {
             padding: 12px;
             text-align: center;
             border: 1px solid #ddd;
-        }}
+        }
 
-        th {{
+        th {
             background: #667eea;
             color: white;
             font-weight: bold;
             position: sticky;
             top: 0;
-        }}
+        }
 
-        th.row-header {{
+        th.row-header {
             background: #764ba2;
             text-align: left;
-        }}
+        }
 
-        td.safe {{
+        td.safe {
             background: #d4edda;
             color: #155724;
             font-weight: bold;
-        }}
+        }
 
-        td.risky {{
+        td.risky {
             background: #fff3cd;
             color: #856404;
             font-weight: bold;
-        }}
+        }
 
-        td.dangerous {{
+        td.dangerous {
             background: #f8d7da;
             color: #721c24;
             font-weight: bold;
-        }}
+        }
 
-        td.na {{
+        td.na {
             background: #e9ecef;
             color: #495057;
-        }}
+        }
 
-        .legend {{
+        .legend {
             display: flex;
             gap: 20px;
             justify-content: center;
             margin: 30px 0;
             flex-wrap: wrap;
-        }}
+        }
 
-        .legend-item {{
+        .legend-item {
             display: flex;
             align-items: center;
             gap: 10px;
@@ -263,97 +226,99 @@ class TestReportGenerator:
             background: white;
             border-radius: 5px;
             box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }}
+        }
 
-        .legend-box {{
+        .legend-box {
             width: 20px;
             height: 20px;
             border-radius: 3px;
-        }}
+        }
 
-        .legend-box.safe {{ background: #d4edda; }}
-        .legend-box.risky {{ background: #fff3cd; }}
-        .legend-box.dangerous {{ background: #f8d7da; }}
-        .legend-box.na {{ background: #e9ecef; }}
+        .legend-box.safe { background: #d4edda; }
+        .legend-box.risky { background: #fff3cd; }
+        .legend-box.dangerous { background: #f8d7da; }
+        .legend-box.na { background: #e9ecef; }
 
-        .transitions-list {{
+        .transitions-list {
             margin: 20px 0;
-        }}
+        }
 
-        .transition-item {{
+        .transition-item {
             background: white;
             padding: 15px;
             margin: 10px 0;
             border-left: 4px solid #667eea;
             border-radius: 5px;
             box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }}
+        }
 
-        .transition-item.safe {{ border-left-color: #28a745; }}
-        .transition-item.risky {{ border-left-color: #ffc107; }}
-        .transition-item.dangerous {{ border-left-color: #dc3545; }}
+        .transition-item.safe { border-left-color: #28a745; }
+        .transition-item.risky { border-left-color: #ffc107; }
+        .transition-item.dangerous { border-left-color: #dc3545; }
 
-        .transition-header {{
+        .transition-header {
             font-weight: bold;
             margin-bottom: 5px;
-        }}
+        }
 
-        .transition-description {{
+        .transition-description {
             color: #666;
             font-size: 0.95em;
-        }}
+        }
 
-        .badge {{
+        .badge {
             display: inline-block;
             padding: 4px 12px;
             border-radius: 12px;
             font-size: 0.85em;
             font-weight: bold;
             margin-left: 10px;
-        }}
+        }
 
-        .badge.safe {{ background: #28a745; color: white; }}
-        .badge.risky {{ background: #ffc107; color: #333; }}
-        .badge.dangerous {{ background: #dc3545; color: white; }}
+        .badge.safe { background: #28a745; color: white; }
+        .badge.risky { background: #ffc107; color: #333; }
+        .badge.dangerous { background: #dc3545; color: white; }
 
-        footer {{
+        footer {
             background: #f8f9fa;
             padding: 30px;
             text-align: center;
             color: #666;
             border-top: 1px solid #ddd;
-        }}
+        }
 
-        @media print {{
-            body {{ background: white; padding: 0; }}
-            .container {{ box-shadow: none; }}
-            header {{ background: #667eea; }}
-        }}
+        @media print {
+            body { background: white; padding: 0; }
+            .container { box-shadow: none; }
+            header { background: #667eea; }
+        }
     </style>
 </head>
 <body>
     <div class="container">
-        <header>
+"""
+
+_HTML_SUMMARY = """        <header>
             <h1>📊 Schema Compatibility Test Report</h1>
             <div class="subtitle">Complete Analysis of Compatibility Mode Transitions</div>
-            <div style="margin-top: 20px; opacity: 0.8;">Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</div>
+            <div style="margin-top: 20px; opacity: 0.8;">Generated: {generated_at}</div>
         </header>
 
         <div class="stats">
             <div class="stat-card safe">
-                <div class="number">{stats.get('SAFE', 0)}</div>
+                <div class="number">{safe}</div>
                 <div class="label">Safe Transitions</div>
             </div>
             <div class="stat-card risky">
-                <div class="number">{stats.get('RISKY', 0)}</div>
+                <div class="number">{risky}</div>
                 <div class="label">Risky Transitions</div>
             </div>
             <div class="stat-card dangerous">
-                <div class="number">{stats.get('DANGEROUS', 0)}</div>
+                <div class="number">{dangerous}</div>
                 <div class="label">Dangerous Transitions</div>
             </div>
             <div class="stat-card na">
-                <div class="number">{len(modes)}</div>
+                <div class="number">{mode_count}</div>
                 <div class="label">Compatibility Modes</div>
             </div>
         </div>
@@ -385,30 +350,15 @@ class TestReportGenerator:
                     <thead>
                         <tr>
                             <th class="row-header">From \\ To</th>
-                            {''.join(f'<th>{mode}</th>' for mode in modes)}
+                            {mode_headers}
                         </tr>
                     </thead>
                     <tbody>
 """
 
-        # Add matrix rows
-        for from_mode in modes:
-            html += f"                        <tr>\n"
-            html += f"                            <th class=\"row-header\">{from_mode}</th>\n"
-            for to_mode in modes:
-                risk = matrix[from_mode][to_mode]
-                css_class = risk.lower()
-                symbol = {
-                    "SAFE": "✅",
-                    "RISKY": "⚠️",
-                    "DANGEROUS": "🔴",
-                    "N/A": "⏺️",
-                    "UNKNOWN": "❓"
-                }.get(risk, "?")
-                html += f"                            <td class=\"{css_class}\">{symbol} {risk}</td>\n"
-            html += f"                        </tr>\n"
-
-        html += """                    </tbody>
+_MODE_HEADERS = ''.join(f'<th>{mode}</th>' for mode in _MODES)
+
+_HTML_DETAILS_START = """                    </tbody>
                 </table>
             </div>
 
@@ -416,14 +366,11 @@ class TestReportGenerator:
             <div class="transitions-list">
 """
 
-        # Add transition details
-        for from_mode, to_mode, risk_level, requires_validation, description in compatibility_data:
-            validation_text = "✓ Validation required" if requires_validation else "○ No validation needed"
-            html += f"""
-                <div class="transition-item {risk_level.lower()}">
+_HTML_TRANSITION_ITEM = """
+                <div class="transition-item {css_class}">
                     <div class="transition-header">
                         {from_mode} → {to_mode}
-                        <span class="badge {risk_level.lower()}">{risk_level}</span>
+                        <span class="badge {css_class}">{risk_level}</span>
                     </div>
                     <div class="transition-description">
                         {description}<br>
@@ -432,7 +379,7 @@ class TestReportGenerator:
                 </div>
 """
 
-        html += """
+_HTML_FOOTER = """
             </div>
         </div>
 
@@ -448,7 +395,117 @@ class TestReportGenerator:
 </html>
 """
 
-        return html
+
+# Output directories already created by this process
+_MADE_DIRS: Set[Path] = set()
+
+
+class TestReportGenerator:
+    """Generate comprehensive test reports in HTML format."""
+
+    def __init__(self, output_dir: str = "test-reports"):
+        self.output_dir = Path(output_dir)
+        if self.output_dir not in _MADE_DIRS:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            _MADE_DIRS.add(self.output_dir)
+
+    def generate_html_report(
+        self,
+        test_results: Optional[Dict] = None,
+        compatibility_data: Optional[List] = None
+    ) -> str:
+        """Generate comprehensive HTML report."""
+
+        if compatibility_data is None:
+            compatibility_data = COMPATIBILITY_TRANSITIONS
+
+        output_file = self.output_dir / "compatibility-report.html"
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.writelines(self._iter_html(test_results, compatibility_data))
+
+        return str(output_file)
+
+    def _build_html_template(
+        self,
+        test_results: Optional[Dict],
+        compatibility_data: List
+    ) -> str:
+        """Build complete HTML report template."""
+        return "".join(self._iter_html(test_results, compatibility_data))
+
+    def _iter_html(
+        self,
+        test_results: Optional[Dict],
+        compatibility_data: List
+    ) -> Iterator[str]:
+        """Yield the HTML report in order, one section or row at a time."""
+
+        modes = _MODES
+        generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        # Index risk levels by (from_mode, to_mode) once
+        lookup = {(t[0], t[1]): t[2] for t in compatibility_data}
+
+        # Create matrix lookup and count statistics in the same pass
+        stats = {
+            "SAFE": 0,
+            "RISKY": 0,
+            "DANGEROUS": 0,
+            "N/A": 0,
+            "UNKNOWN": 0
+        }
+
+        matrix: Dict[str, Dict[str, Any]] = {}
+        for from_mode in modes:
+            matrix[from_mode] = {}
+            for to_mode in modes:
+                if from_mode == to_mode:
+                    risk = "N/A"
+                else:
+                    risk = lookup.get((from_mode, to_mode), "UNKNOWN")
+                matrix[from_mode][to_mode] = risk
+                stats[risk] = stats.get(risk, 0) + 1
+
+        # Build HTML
+        yield _HTML_HEAD
+        yield _HTML_SUMMARY.format(
+            generated_at=generated_at,
+            safe=stats.get('SAFE', 0),
+            risky=stats.get('RISKY', 0),
+            dangerous=stats.get('DANGEROUS', 0),
+            mode_count=len(modes),
+            mode_headers=_MODE_HEADERS
+        )
+
+        # Add matrix rows
+        for from_mode in modes:
+            row = matrix[from_mode]
+            yield (
+                "                        <tr>\n"
+                f"                            <th class=\"row-header\">{from_mode}</th>\n"
+                + "".join(
+                    f"                            <td class=\"{_CSS_CLASS.get(risk, 'unknown')}\">"
+                    f"{_RISK_SYMBOL.get(risk, '?')} {risk}</td>\n"
+                    for risk in (row[to_mode] for to_mode in modes)
+                )
+                + "                        </tr>\n"
+            )
+
+        yield _HTML_DETAILS_START
+
+        # Add transition details
+        for from_mode, to_mode, risk_level, requires_validation, description in compatibility_data:
+            validation_text = "✓ Validation required" if requires_validation else "○ No validation needed"
+            yield _HTML_TRANSITION_ITEM.format(
+                from_mode=from_mode,
+                to_mode=to_mode,
+                risk_level=risk_level,
+                css_class=_CSS_CLASS.get(risk_level, "unknown"),
+                description=description,
+                validation_text=validation_text
+            )
+
+        yield _HTML_FOOTER
 
     def generate_json_report(self, compatibility_data: Optional[List] = None) -> str:
         """Generate JSON report."""
@@ -473,28 +530,24 @@ class TestReportGenerator:
         }
 
         output_file = self.output_dir / "compatibility-report.json"
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            output_file.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            output_file.write_text(json.dumps(report, indent=2), encoding='utf-8')
 
         return str(output_file)
 
     def _calculate_statistics(self, compatibility_data: List) -> Dict:
         """Calculate statistics from compatibility data."""
 
+        by_risk_level = {"SAFE": 0, "RISKY": 0, "DANGEROUS": 0}
+        by_risk_level.update(Counter(t[2] for t in compatibility_data))
+
         stats = {
             "total": len(compatibility_data),
-            "by_risk_level": {
-                "SAFE": 0,
-                "RISKY": 0,
-                "DANGEROUS": 0
-            },
-            "requiring_validation": 0
-        }
-
-        for _, _, risk_level, requires_validation, _ in compatibility_data:
-            stats["by_risk_level"][risk_level] = stats["by_risk_level"].get(risk_level, 0) + 1
-            if requires_validation:
-                stats["requiring_validation"] += 1
+            "by_risk_level": by_risk_level,
+            "requiring_validation": sum(1 for t in compatibility_data if t[3])
+        }
 
         return stats
 
@@ -2,14 +2,18 @@
 FastAPI application for multi-backend schema registry.
 """
 
+import asyncio
 import logging
 import os
+import re
 from contextlib import asynccontextmanager
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import yaml
+from cachetools import TTLCache
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
 from ..core import (
@@ -18,10 +22,9 @@ from ..core import (
     RegistryConfig,
     RegistryType,
     SchemaFormat,
-    get_plugin_registry
+    get_plugin_registry,
+    to_json
 )
-from ..plugins.confluent import ConfluentSchemaRegistryPlugin
-from ..plugins.unity_catalog import UnityCatalogPlugin
 
 
 # Configure logging
@@ -32,9 +35,25 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# CSafeLoader is only defined when PyYAML was built against libyaml
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Matches "${VAR_NAME}" placeholders in config values
+_ENV_RE = re.compile(r"^\$\{([^}]+)\}$")
+
+# Enum members by upper-case name, for validating request parameters
+_MODE_BY_NAME = {m.name: m for m in CompatibilityMode}
+_FMT_BY_NAME = {f.name: f for f in SchemaFormat}
+
+
 # Global orchestrator instance
 orchestrator: Optional[MultiBackendOrchestrator] = None
 
+# Serialized find-schema responses by subject; a short TTL absorbs bursts of
+# identical lookups (e.g. during rolling deploys) without serving stale data
+# for long
+_find_cache: TTLCache = TTLCache(maxsize=1024, ttl=10)
+
 
 # Pydantic models for API
 class RegistryInfo(BaseModel):
@@ -50,6 +69,12 @@ class HealthCheckResponse(BaseModel):
     response_time_ms: float
 
 
+class RegisterSchemaRequest(BaseModel):
+    schema_content: str
+    schema_format: str
+    metadata: Optional[Dict[str, Any]] = None
+
+
 class CompatibilityCheckRequest(BaseModel):
     subject: str
     schema_content: str
@@ -73,6 +98,22 @@ class BulkCheckRequest(BaseModel):
     registry_ids: List[str]
     target_mode: str
     subject_filter: Optional[str] = None
+    subject_pattern: Optional[str] = None
+
+
+def _check_pattern(pattern: Optional[str]):
+    """Reject subject patterns that are not valid regular expressions."""
+    if pattern is None:
+        return
+    try:
+        re.compile(pattern)
+    except re.error as e:
+        raise HTTPException(status_code=400, detail=f"Invalid subject pattern: {e}")
+
+
+def _json_response(obj) -> Response:
+    """Serialize models straight to a JSON response, skipping to_dict()."""
+    return Response(content=to_json(obj), media_type="application/json")
 
 
 # Lifecycle management
@@ -81,6 +122,11 @@ async def lifespan(app: FastAPI):
     """Manage application lifecycle."""
     global orchestrator
 
+    # Plugin modules are imported here rather than at module level so that
+    # worker processes only pay for them once the app actually starts
+    from ..plugins.confluent import ConfluentSchemaRegistryPlugin
+    from ..plugins.unity_catalog import UnityCatalogPlugin
+
     # Startup
     logger.info("Starting multi-backend schema registry API...")
 
@@ -98,37 +144,39 @@ async def lifespan(app: FastAPI):
     config_path = os.getenv("REGISTRY_CONFIG", "config/registries.yaml")
     if os.path.exists(config_path):
         with open(config_path, 'r') as f:
-            config_data = yaml.safe_load(f)
+            config_data = yaml.load(f, Loader=_SafeLoader)
 
         # Add registries from config
         for registry_config in config_data.get("registries", []):
-            if registry_config.get("enabled", True):
-                try:
-                    # Expand environment variables
-                    for key in ["username", "password", "token"]:
-                        if key in registry_config.get("auth", {}):
-                            value = registry_config["auth"][key]
-                            if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-                                env_var = value[2:-1]
-                                registry_config["auth"][key] = os.getenv(env_var, "")
-
-                    config = RegistryConfig(
-                        id=registry_config["id"],
-                        type=RegistryType[registry_config["type"].upper()],
-                        url=registry_config["url"],
-                        auth=registry_config.get("auth", {}),
-                        ssl_config=registry_config.get("ssl_config", {}),
-                        timeout=registry_config.get("timeout", 30),
-                        max_retries=registry_config.get("max_retries", 3),
-                        metadata=registry_config.get("metadata", {}),
-                        enabled=registry_config.get("enabled", True)
-                    )
-
-                    orchestrator.add_registry(config)
-                    logger.info(f"Added registry: {config.id}")
-
-                except Exception as e:
-                    logger.error(f"Failed to add registry {registry_config.get('id')}: {e}")
+            if not registry_config.get("enabled", True):
+                continue
+
+            try:
+                # Expand environment variables
+                auth = registry_config.get("auth", {})
+                for key, value in auth.items():
+                    if isinstance(value, str):
+                        match = _ENV_RE.match(value)
+                        if match:
+                            auth[key] = os.getenv(match.group(1), "")
+
+                config = RegistryConfig(
+                    id=registry_config["id"],
+                    type=RegistryType[registry_config["type"].upper()],
+                    url=registry_config["url"],
+                    auth=auth,
+                    ssl_config=registry_config.get("ssl_config", {}),
+                    timeout=registry_config.get("timeout", 30),
+                    max_retries=registry_config.get("max_retries", 3),
+                    pool_size=registry_config.get("pool_size", 32),
+                    metadata=registry_config.get("metadata", {})
+                )
+
+                orchestrator.add_registry(config)
+                logger.info(f"Added registry: {config.id}")
+
+            except Exception as e:
+                logger.error(f"Failed to add registry {registry_config.get('id')}: {e}")
 
     logger.info("Application startup complete")
 
@@ -145,7 +193,8 @@ app = FastAPI(
     title="Multi-Backend Schema Registry API",
     description="Unified API for managing schemas across multiple registry backends",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -190,11 +239,8 @@ async def check_all_health():
     if not orchestrator:
         raise HTTPException(status_code=503, detail="Orchestrator not initialized")
 
-    health_statuses = orchestrator.health_check_all()
-    return {
-        registry_id: status.to_dict()
-        for registry_id, status in health_statuses.items()
-    }
+    health_statuses = await asyncio.to_thread(orchestrator.health_check_all)
+    return _json_response(health_statuses)
 
 
 # ===== Schema Operations =====
@@ -205,28 +251,83 @@ async def find_schema_across_registries(subject: str):
     if not orchestrator:
         raise HTTPException(status_code=503, detail="Orchestrator not initialized")
 
-    schemas = orchestrator.find_schema_across_registries(subject)
+    body = _find_cache.get(subject)
+    if body is None:
+        schemas = orchestrator.find_schema_across_registries(subject)
+        body = _find_cache[subject] = to_json(schemas)
 
-    return {
-        registry_id: schema.to_dict()
-        for registry_id, schema in schemas.items()
-    }
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/v1/registries/{registry_id}/subjects")
-async def list_subjects(registry_id: str, prefix: Optional[str] = None):
+async def list_subjects(
+    registry_id: str,
+    prefix: Optional[str] = None,
+    pattern: Optional[str] = None
+):
     """List all subjects in a registry."""
     if not orchestrator:
         raise HTTPException(status_code=503, detail="Orchestrator not initialized")
 
+    _check_pattern(pattern)
+
     registry = orchestrator.get_registry(registry_id)
     if not registry:
         raise HTTPException(status_code=404, detail=f"Registry {registry_id} not found")
 
-    subjects = registry.list_subjects(prefix=prefix)
+    subjects = registry.list_subjects(prefix=prefix, pattern=pattern)
     return {"subjects": subjects}
 
 
+@app.post("/api/v1/registries/{registry_id}/subjects/{subject}/versions")
+async def register_schema(registry_id: str, subject: str, request: RegisterSchemaRequest):
+    """Register a new schema version under a subject."""
+    if not orchestrator:
+        raise HTTPException(status_code=503, detail="Orchestrator not initialized")
+
+    if not orchestrator.get_registry(registry_id):
+        raise HTTPException(status_code=404, detail=f"Registry {registry_id} not found")
+
+    schema_format = _FMT_BY_NAME.get(request.schema_format.upper())
+    if schema_format is None:
+        raise HTTPException(status_code=400, detail=f"Invalid schema format: {request.schema_format}")
+
+    try:
+        schema = orchestrator.register_schema(
+            registry_id,
+            subject,
+            request.schema_content,
+            schema_format,
+            request.metadata
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        # The write may have been applied even if the request failed
+        _find_cache.pop(subject, None)
+
+    return _json_response(schema)
+
+
+@app.delete("/api/v1/registries/{registry_id}/subjects/{subject}/versions/{version}")
+async def delete_schema_version(registry_id: str, subject: str, version: int):
+    """Delete a schema version."""
+    if not orchestrator:
+        raise HTTPException(status_code=503, detail="Orchestrator not initialized")
+
+    if not orchestrator.get_registry(registry_id):
+        raise HTTPException(status_code=404, detail=f"Registry {registry_id} not found")
+
+    try:
+        success = orchestrator.delete_schema_version(registry_id, subject, version)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Subject {subject} version {version} not found")
+    finally:
+        _find_cache.pop(subject, None)
+
+    return {"success": success, "registry_id": registry_id, "subject": subject, "version": version}
+
+
 # ===== Compatibility Operations =====
 
 @app.post("/api/v1/registries/{registry_id}/compatibility/check", response_model=CompatibilityCheckResponse)
@@ -239,9 +340,8 @@ async def check_compatibility(registry_id: str, request: CompatibilityCheckReque
     if not registry:
         raise HTTPException(status_code=404, detail=f"Registry {registry_id} not found")
 
-    try:
-        schema_format = SchemaFormat[request.schema_format.upper()]
-    except KeyError:
+    schema_format = _FMT_BY_NAME.get(request.schema_format.upper())
+    if schema_format is None:
         raise HTTPException(status_code=400, detail=f"Invalid schema format: {request.schema_format}")
 
     result = registry.check_compatibility(
@@ -278,9 +378,8 @@ async def set_compatibility_mode(registry_id: str, request: SetCompatibilityRequ
     if not registry:
         raise HTTPException(status_code=404, detail=f"Registry {registry_id} not found")
 
-    try:
-        mode = CompatibilityMode[request.mode.upper()]
-    except KeyError:
+    mode = _MODE_BY_NAME.get(request.mode.upper())
+    if mode is None:
         raise HTTPException(status_code=400, detail=f"Invalid compatibility mode: {request.mode}")
 
     success = registry.set_compatibility_mode(mode, subject=request.subject)
@@ -310,39 +409,68 @@ async def bulk_check_compatibility(request: BulkCheckRequest):
     if not orchestrator:
         raise HTTPException(status_code=503, detail="Orchestrator not initialized")
 
-    try:
-        target_mode = CompatibilityMode[request.target_mode.upper()]
-    except KeyError:
+    target_mode = _MODE_BY_NAME.get(request.target_mode.upper())
+    if target_mode is None:
         raise HTTPException(status_code=400, detail=f"Invalid compatibility mode: {request.target_mode}")
 
-    result = orchestrator.bulk_check_compatibility(
+    _check_pattern(request.subject_pattern)
+
+    result = await orchestrator.bulk_check_compatibility_async(
         registry_ids=request.registry_ids,
         target_mode=target_mode,
-        subject_filter=request.subject_filter
+        subject_filter=request.subject_filter,
+        subject_pattern=request.subject_pattern
     )
 
-    return result.to_dict()
+    return _json_response(result)
+
+
+@app.post("/api/v1/bulk/check-compatibility/stream")
+async def stream_bulk_check_compatibility(request: BulkCheckRequest):
+    """Check compatibility for multiple subjects, streaming results as NDJSON."""
+    if not orchestrator:
+        raise HTTPException(status_code=503, detail="Orchestrator not initialized")
+
+    target_mode = _MODE_BY_NAME.get(request.target_mode.upper())
+    if target_mode is None:
+        raise HTTPException(status_code=400, detail=f"Invalid compatibility mode: {request.target_mode}")
+
+    _check_pattern(request.subject_pattern)
+
+    async def lines():
+        async for entry in orchestrator.iter_bulk_check_compatibility(
+            registry_ids=request.registry_ids,
+            target_mode=target_mode,
+            subject_filter=request.subject_filter,
+            subject_pattern=request.subject_pattern
+        ):
+            yield to_json(entry) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @app.post("/api/v1/bulk/set-compatibility")
 async def bulk_set_compatibility(
     mode: str,
     registry_ids: List[str],
-    subject_filter: Optional[str] = None
+    subject_filter: Optional[str] = None,
+    subject_pattern: Optional[str] = None
 ):
     """Set compatibility mode for multiple subjects."""
     if not orchestrator:
         raise HTTPException(status_code=503, detail="Orchestrator not initialized")
 
-    try:
-        compat_mode = CompatibilityMode[mode.upper()]
-    except KeyError:
+    compat_mode = _MODE_BY_NAME.get(mode.upper())
+    if compat_mode is None:
         raise HTTPException(status_code=400, detail=f"Invalid compatibility mode: {mode}")
 
+    _check_pattern(subject_pattern)
+
     results = orchestrator.bulk_set_compatibility(
         registry_ids=registry_ids,
         mode=compat_mode,
-        subject_filter=subject_filter
+        subject_filter=subject_filter,
+        subject_pattern=subject_pattern
     )
 
     return results
@@ -364,10 +492,13 @@ async def root():
 if __name__ == "__main__":
     import uvicorn
 
+    # Reload is for local development only (DEV=1); production scales
+    # out with WORKERS instead of restarting on file changes
     uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
+        "src.api.main:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        reload=os.getenv("DEV") == "1",
+        workers=int(os.getenv("WORKERS", "1")),
         log_level="info"
     )
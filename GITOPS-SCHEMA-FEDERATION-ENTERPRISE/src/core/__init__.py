@@ -11,10 +11,12 @@ from .models import (
     RegistryType,
     Schema,
     SchemaFormat,
-    BulkCheckResult
+    BulkCheckResult,
+    schema_hash,
+    to_json
 )
 from .orchestrator import MultiBackendOrchestrator
-from .plugin_registry import PluginRegistry, get_plugin_registry
+from .plugin_registry import PluginRegistry, get_plugin_registry, register_plugin_for
 
 __all__ = [
     # Interfaces
@@ -30,9 +32,12 @@ __all__ = [
     "Schema",
     "SchemaFormat",
     "BulkCheckResult",
+    "schema_hash",
+    "to_json",
     # Orchestrator
     "MultiBackendOrchestrator",
     # Plugin Registry
     "PluginRegistry",
     "get_plugin_registry",
+    "register_plugin_for",
 ]
@@ -0,0 +1,32 @@
+"""
+Canonical form for schema definitions.
+
+Registries return the same schema with different whitespace and key order
+depending on how it was registered. Hashing the canonical form lets those
+copies be recognized as identical.
+"""
+
+import orjson
+
+
+def canonicalize(schema_content: str) -> str:
+    """
+    Return the canonical form of a schema definition.
+
+    JSON-based schemas (Avro, JSON Schema, Iceberg) are re-serialized
+    compactly with sorted object keys; array order, such as record field
+    order, is preserved since it is significant. Anything that is not JSON
+    (e.g. Protobuf IDL) is returned with surrounding whitespace stripped.
+
+    Args:
+        schema_content: Schema definition
+
+    Returns:
+        Canonical schema text
+    """
+    try:
+        parsed = orjson.loads(schema_content)
+    except orjson.JSONDecodeError:
+        return schema_content.strip()
+
+    return orjson.dumps(parsed, option=orjson.OPT_SORT_KEYS).decode()
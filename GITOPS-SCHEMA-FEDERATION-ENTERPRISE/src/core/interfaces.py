@@ -4,7 +4,7 @@ All plugins must implement these interfaces.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import ClassVar, Dict, Iterator, List, Optional, Any, Protocol, Union
 
 from .models import (
     CompatibilityMode,
@@ -21,8 +21,18 @@ class ISchemaRegistry(ABC):
     """
     Abstract interface for all schema registry backends.
     All plugins must implement this interface to ensure compatibility.
+
+    Plugins declare the registry type they handle as the registry_type
+    class attribute, usually via @register_plugin_for, so it can be read
+    without creating an instance.
     """
 
+    registry_type: ClassVar[RegistryType]
+
+    # Lets plugins declare __slots__ of their own; subclasses that don't
+    # still get a __dict__ as usual
+    __slots__ = ("config",)
+
     def __init__(self, config: RegistryConfig):
         """
         Initialize the plugin with configuration.
@@ -133,22 +143,74 @@ class ISchemaRegistry(ABC):
         """
         pass
 
+    def get_latest_schemas(
+        self,
+        subjects: List[str]
+    ) -> Dict[str, Union[Schema, Exception]]:
+        """
+        Get the latest version of several schemas.
+
+        The default implementation fetches subjects one at a time. Backends
+        that can issue the requests concurrently should override it.
+
+        Args:
+            subjects: Subject names
+
+        Returns:
+            Dict mapping each subject to its Schema, or to the exception
+            raised while fetching it
+        """
+        results: Dict[str, Union[Schema, Exception]] = {}
+        for subject in subjects:
+            try:
+                results[subject] = self.get_latest_schema(subject)
+            except Exception as e:
+                results[subject] = e
+        return results
+
     @abstractmethod
     def list_subjects(
         self,
-        prefix: Optional[str] = None
+        prefix: Optional[str] = None,
+        pattern: Optional[str] = None
     ) -> List[str]:
         """
-        List all subjects, optionally filtered by prefix.
+        List all subjects, optionally filtered by prefix and/or pattern.
+
+        Backends should push the prefix into the server query where the
+        API supports it.
 
         Args:
             prefix: Optional prefix filter
+            pattern: Optional regular expression; only subjects it matches
+                (re.search) are returned
 
         Returns:
             List of subject names
         """
         pass
 
+    def iter_subjects(
+        self,
+        prefix: Optional[str] = None,
+        pattern: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Iterate over subjects, with the same filters as list_subjects.
+
+        The default implementation wraps list_subjects. Backends that can
+        parse the listing incrementally should override it so callers can
+        start work before the whole response has arrived.
+
+        Args:
+            prefix: Optional prefix filter
+            pattern: Optional regular expression filter
+
+        Returns:
+            Iterator of subject names
+        """
+        return iter(self.list_subjects(prefix=prefix, pattern=pattern))
+
     @abstractmethod
     def list_versions(self, subject: str) -> List[int]:
         """
@@ -165,6 +227,27 @@ class ISchemaRegistry(ABC):
         """
         pass
 
+    def get_all_versions(self, subject: str) -> List[Schema]:
+        """
+        Get every version of a schema, oldest first.
+
+        The default implementation fetches versions one at a time. Backends
+        that can return all versions in a single call should override it.
+
+        Args:
+            subject: Subject name
+
+        Returns:
+            List of Schema objects ordered by version
+
+        Raises:
+            KeyError: If subject not found
+        """
+        return [
+            self.get_schema_by_subject_version(subject, version)
+            for version in self.list_versions(subject)
+        ]
+
     @abstractmethod
     def delete_schema_version(
         self,
@@ -186,6 +269,18 @@ class ISchemaRegistry(ABC):
         """
         pass
 
+    def clear_schema_cache(self, subject: Optional[str] = None):
+        """
+        Drop any schemas the plugin has cached locally.
+
+        The default implementation does nothing; plugins that cache
+        lookups should override it.
+
+        Args:
+            subject: Only drop entries for this subject (all if None)
+        """
+        pass
+
     # ===== Compatibility Operations =====
 
     @abstractmethod
@@ -323,13 +418,15 @@ class ISchemaRegistry(ABC):
         pass
 
 
-class ICompatibilityChecker(ABC):
+class ICompatibilityChecker(Protocol):
     """
     Interface for compatibility checking logic.
     Each registry may have different compatibility rules.
+
+    Structural: any object with these methods satisfies it, no
+    subclassing required.
     """
 
-    @abstractmethod
     def check_backward_compatibility(
         self,
         new_schema: Schema,
@@ -347,7 +444,6 @@ class ICompatibilityChecker(ABC):
         """
         pass
 
-    @abstractmethod
     def check_forward_compatibility(
         self,
         new_schema: Schema,
@@ -365,7 +461,6 @@ class ICompatibilityChecker(ABC):
         """
         pass
 
-    @abstractmethod
     def check_full_compatibility(
         self,
         new_schema: Schema,
@@ -383,7 +478,6 @@ class ICompatibilityChecker(ABC):
         """
         pass
 
-    @abstractmethod
     def check_transitive_compatibility(
         self,
         new_schema: Schema,
@@ -404,12 +498,13 @@ class ICompatibilityChecker(ABC):
         pass
 
 
-class ISchemaTransformer(ABC):
+class ISchemaTransformer(Protocol):
     """
     Interface for transforming schemas between formats.
+
+    Structural, like ICompatibilityChecker.
     """
 
-    @abstractmethod
     def can_transform(
         self,
         source_format: SchemaFormat,
@@ -427,7 +522,6 @@ class ISchemaTransformer(ABC):
         """
         pass
 
-    @abstractmethod
     def transform(
         self,
         schema: Schema,
@@ -450,7 +544,6 @@ class ISchemaTransformer(ABC):
         """
         pass
 
-    @abstractmethod
     def get_transformation_rules(
         self,
         source_format: SchemaFormat,
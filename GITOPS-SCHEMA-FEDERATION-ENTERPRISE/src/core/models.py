@@ -2,11 +2,17 @@
 Core data models for multi-backend schema registry system.
 """
 
+import hashlib
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+import orjson
+
+from .canonical import canonicalize
+
 
 class RegistryType(Enum):
     """Supported schema registry types."""
@@ -58,7 +64,21 @@ class CompatibilityMode(Enum):
     FULL_TRANSITIVE = "FULL_TRANSITIVE"
 
 
-@dataclass
+# Value string of each mode, for building responses in tight loops
+_COMPAT_MODE_VALUE: Dict[CompatibilityMode, str] = {m: m.value for m in CompatibilityMode}
+
+
+def schema_hash(schema_content: str) -> str:
+    """
+    Return a short, stable digest of a schema definition.
+
+    Identical content always hashes the same, so the digest can key caches
+    and detect unchanged versions without comparing full documents.
+    """
+    return hashlib.blake2b(schema_content.encode(), digest_size=16).hexdigest()
+
+
+@dataclass(slots=True, frozen=True)
 class Schema:
     """
     Unified schema representation across all registry types.
@@ -72,6 +92,29 @@ class Schema:
     metadata: Dict[str, Any] = field(default_factory=dict)
     created_at: Optional[datetime] = None
     created_by: Optional[str] = None
+    # Filled in by content_hash on first use; orjson skips underscored fields
+    _content_hash: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Every version of a subject repeats the same strings; share one copy
+        object.__setattr__(self, "subject", sys.intern(self.subject))
+        if self.created_by is not None:
+            object.__setattr__(self, "created_by", sys.intern(self.created_by))
+
+    @property
+    def content_hash(self) -> str:
+        """
+        Digest of the canonical schema content.
+
+        Formatting-only differences between versions hash the same. Computed
+        on first access, since only dedupe and compatibility short-circuits
+        need it.
+        """
+        content_hash = self._content_hash
+        if content_hash is None:
+            content_hash = schema_hash(canonicalize(self.schema_content))
+            object.__setattr__(self, "_content_hash", content_hash)
+        return content_hash
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -88,7 +131,7 @@ class Schema:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CompatibilityResult:
     """
     Result of a compatibility check operation.
@@ -108,7 +151,7 @@ class CompatibilityResult:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RegistryConfig:
     """
     Configuration for a schema registry instance.
@@ -122,6 +165,10 @@ class RegistryConfig:
     max_retries: int = 3
     metadata: Dict[str, Any] = field(default_factory=dict)
     enabled: bool = True
+    pool_size: int = 32
+
+    def __post_init__(self):
+        object.__setattr__(self, "id", sys.intern(self.id))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -134,11 +181,12 @@ class RegistryConfig:
             "timeout": self.timeout,
             "max_retries": self.max_retries,
             "metadata": self.metadata,
-            "enabled": self.enabled
+            "enabled": self.enabled,
+            "pool_size": self.pool_size
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HealthStatus:
     """
     Health status of a schema registry.
@@ -160,7 +208,7 @@ class HealthStatus:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BulkCheckResult:
     """
     Result of a bulk compatibility check operation.
@@ -182,3 +230,39 @@ class BulkCheckResult:
             "duration_seconds": self.duration_seconds,
             "results": self.results
         }
+
+    def to_arrow(self):
+        """
+        Convert per-subject results to a columnar pyarrow.Table.
+
+        Useful for summarizing large result sets with vectorized
+        pyarrow.compute kernels. Requires the optional pyarrow dependency.
+
+        Returns:
+            pyarrow.Table with registry_id, subject, is_compatible,
+            messages and errors columns
+        """
+        try:
+            import pyarrow as pa  # type: ignore[import-not-found]
+        except ImportError as e:
+            raise ImportError("BulkCheckResult.to_arrow() requires pyarrow") from e
+
+        results = self.results
+        return pa.table({
+            "registry_id": pa.array([r["registry_id"] for r in results], pa.string()),
+            "subject": pa.array([r["subject"] for r in results], pa.string()),
+            "is_compatible": pa.array([r["is_compatible"] for r in results], pa.bool_()),
+            "messages": pa.array([r["messages"] for r in results], pa.list_(pa.string())),
+            "errors": pa.array([r["errors"] for r in results], pa.list_(pa.string()))
+        })
+
+
+def to_json(obj: Any) -> bytes:
+    """
+    Serialize models, or dicts/lists of models, to JSON bytes.
+
+    Produces the same data as the models' to_dict(), but orjson walks the
+    dataclasses, enums and datetimes natively instead of building
+    intermediate dicts in Python.
+    """
+    return orjson.dumps(obj)
@@ -3,18 +3,32 @@ Multi-backend orchestrator for coordinating operations across registries.
 """
 
 import asyncio
+import functools
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Dict, List, Optional
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import ModuleType
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from cachetools import TTLCache
+
+uvloop: Optional[ModuleType]
+try:
+    import uvloop
+except ImportError:  # not installed, or unsupported platform (Windows)
+    uvloop = None
 
 from .interfaces import ISchemaRegistry
 from .models import (
+    _COMPAT_MODE_VALUE,
     BulkCheckResult,
     CompatibilityMode,
     CompatibilityResult,
     HealthStatus,
     RegistryConfig,
-    Schema
+    Schema,
+    SchemaFormat
 )
 from .plugin_registry import PluginRegistry
 
@@ -22,6 +36,52 @@ from .plugin_registry import PluginRegistry
 logger = logging.getLogger(__name__)
 
 
+# Runs the async bulk paths from synchronous callers; uvloop's loop is
+# faster when available (uvicorn[standard] already installs it)
+_run = getattr(uvloop, "run", asyncio.run)
+
+
+# Bulk checks started but not yet consumed, so memory stays bounded however
+# many subjects a listing returns
+_MAX_PENDING_CHECKS = 256
+
+
+# Orchestrators currently holding the shared executor
+_executor_users = 0
+_executor_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide executor for blocking backend calls.
+
+    Backend calls are I/O bound, so the default allows several threads per
+    core; GSR_IO_THREADS overrides the size.
+    """
+    workers = int(os.getenv("GSR_IO_THREADS", "0")) or min(32, (os.cpu_count() or 1) * 4)
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gsr-io")
+
+
+# Registry methods that query_all may dispatch to
+_QUERY_OPERATIONS = (
+    "get_registry_type",
+    "get_supported_formats",
+    "get_schema_by_id",
+    "get_schema_by_subject_version",
+    "get_latest_schema",
+    "get_all_versions",
+    "list_subjects",
+    "list_versions",
+    "check_compatibility",
+    "get_compatibility_mode",
+    "get_all_compatibility_modes",
+    "discover_schemas",
+    "health_check",
+    "get_metadata"
+)
+
+
 class MultiBackendOrchestrator:
     """
     Orchestrates operations across multiple schema registry backends.
@@ -36,7 +96,22 @@ class MultiBackendOrchestrator:
         """
         self.plugin_registry = plugin_registry
         self.active_registries: Dict[str, ISchemaRegistry] = {}
-        self.executor = ThreadPoolExecutor(max_workers=10)
+        self._method_tables: Dict[str, Dict[str, Any]] = {}
+        self._registry_meta: Dict[str, Dict[str, Any]] = {}
+        global _executor_users
+        with _executor_lock:
+            self.executor = _shared_executor()
+            _executor_users += 1
+        self._shut_down = False
+
+        # Read-through caches for registry lookups. Schemas looked up by ID
+        # never change, so they are kept longer than version lists and
+        # "latest" pointers, which move whenever a version is added.
+        self._schema_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+        self._versions_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+        self._latest_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+        self._cache_lock = threading.Lock()
+        self._inflight: Dict[Tuple, Future] = {}
 
         logger.info("Multi-backend orchestrator initialized")
 
@@ -55,6 +130,14 @@ class MultiBackendOrchestrator:
             instance_id=config.id
         )
         self.active_registries[config.id] = instance
+        self._method_tables[config.id] = {
+            name: getattr(instance, name) for name in _QUERY_OPERATIONS
+        }
+        # Type and formats are fixed per plugin, so resolve them once
+        self._registry_meta[config.id] = {
+            "type": instance.get_registry_type().value,
+            "supported_formats": tuple(f.value for f in instance.get_supported_formats())
+        }
 
         logger.info(f"Added registry: {config.id} ({config.type.value})")
 
@@ -77,16 +160,14 @@ class MultiBackendOrchestrator:
         Returns:
             List of registry information dicts
         """
-        registries = []
-
-        for instance_id, registry in self.active_registries.items():
-            registries.append({
+        return [
+            {
                 "id": instance_id,
-                "type": registry.get_registry_type().value,
-                "supported_formats": [f.value for f in registry.get_supported_formats()]
-            })
-
-        return registries
+                "type": meta["type"],
+                "supported_formats": list(meta["supported_formats"])
+            }
+            for instance_id, meta in self._registry_meta.items()
+        ]
 
     def remove_registry(self, instance_id: str):
         """
@@ -97,8 +178,178 @@ class MultiBackendOrchestrator:
         """
         if instance_id in self.active_registries:
             del self.active_registries[instance_id]
+            del self._method_tables[instance_id]
+            del self._registry_meta[instance_id]
+            self._purge_cache(lambda key: key[0] == instance_id)
             logger.info(f"Removed registry: {instance_id}")
 
+    # ===== Schema Writes =====
+
+    def register_schema(
+        self,
+        instance_id: str,
+        subject: str,
+        schema_content: str,
+        schema_format: SchemaFormat,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Schema:
+        """
+        Register a new schema version in a registry.
+
+        Cached lookups for the subject are dropped afterwards, so the new
+        version is visible to the next read.
+
+        Args:
+            instance_id: Registry instance ID
+            subject: Subject name
+            schema_content: Schema definition
+            schema_format: Format of the schema
+            metadata: Optional metadata
+
+        Returns:
+            Schema object with assigned ID and version
+
+        Raises:
+            KeyError: If the registry is not found
+        """
+        registry = self.active_registries[instance_id]
+        try:
+            return registry.register_schema(subject, schema_content, schema_format, metadata)
+        finally:
+            # A failed request may still have been applied by the registry
+            self.invalidate_subject(subject)
+
+    def delete_schema_version(self, instance_id: str, subject: str, version: int) -> bool:
+        """
+        Delete a schema version from a registry.
+
+        Cached lookups for the subject are dropped afterwards.
+
+        Args:
+            instance_id: Registry instance ID
+            subject: Subject name
+            version: Version number
+
+        Returns:
+            True if deleted successfully
+
+        Raises:
+            KeyError: If the registry, subject or version is not found
+        """
+        registry = self.active_registries[instance_id]
+        try:
+            return registry.delete_schema_version(subject, version)
+        finally:
+            self.invalidate_subject(subject)
+
+    # ===== Cached Lookups =====
+
+    def get_schema_by_id(self, instance_id: str, schema_id: int) -> Schema:
+        """
+        Get a schema by global ID from a registry, using the schema cache.
+
+        Args:
+            instance_id: Registry instance ID
+            schema_id: Global schema ID
+
+        Returns:
+            Schema object
+
+        Raises:
+            KeyError: If the registry or schema ID is not found
+        """
+        return self._cached_call(
+            self._schema_cache,
+            (instance_id, schema_id),
+            lambda: self.active_registries[instance_id].get_schema_by_id(schema_id)
+        )
+
+    def invalidate_subject(self, subject: str):
+        """
+        Drop all cached lookups for a subject.
+
+        Call this after writing to a subject (e.g. registering or deleting a
+        version) so the next read goes back to the registry.
+
+        Args:
+            subject: Subject name
+        """
+        self._purge_cache(lambda key: len(key) > 1 and key[1] == subject)
+
+    def _purge_cache(self, predicate):
+        """
+        Remove every cache entry whose key matches predicate.
+
+        Loads in flight for a matching key are detached as well, so they
+        can't store a value read before the purge; the next miss starts a
+        fresh load.
+        """
+        with self._cache_lock:
+            for cache in (self._schema_cache, self._versions_cache, self._latest_cache):
+                for key in [k for k in cache.keys() if predicate(k)]:
+                    cache.pop(key, None)
+            for flight_key in [k for k in self._inflight if predicate(k[1])]:
+                del self._inflight[flight_key]
+
+    def _cached_call(self, cache: TTLCache, key: Tuple, loader: Callable[[], Any]) -> Any:
+        """
+        Return cache[key], calling loader() to fill it on a miss.
+
+        Concurrent misses for the same key are coalesced (single-flight):
+        the first caller runs loader() while the others wait for its result
+        or exception, so a burst of requests for a cold entry costs one
+        backend call.
+        """
+        # Caches share key shapes, so in-flight loads are tagged by cache
+        flight_key = (id(cache), key)
+
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                return value
+
+            pending = self._inflight.get(flight_key)
+            if pending is None:
+                flight: Future = Future()
+                self._inflight[flight_key] = flight
+
+        if pending is not None:
+            return pending.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._cache_lock:
+                if self._inflight.get(flight_key) is flight:
+                    del self._inflight[flight_key]
+            flight.set_exception(e)
+            raise
+
+        with self._cache_lock:
+            # A purge while loading detaches the flight; its value may
+            # predate a write, so it is returned but not cached
+            if self._inflight.get(flight_key) is flight:
+                cache[key] = value
+                del self._inflight[flight_key]
+        flight.set_result(value)
+        return value
+
+    def _cached_get_all_versions(self, instance_id: str, subject: str) -> List[Schema]:
+        """Get all versions of a subject, using the versions cache."""
+        return self._cached_call(
+            self._versions_cache,
+            (instance_id, subject),
+            lambda: self.active_registries[instance_id].get_all_versions(subject)
+        )
+
+    def _cached_get_latest_schema(self, instance_id: str, subject: str) -> Schema:
+        """Get the latest schema of a subject, using the latest-schema cache."""
+        return self._cached_call(
+            self._latest_cache,
+            (instance_id, subject),
+            lambda: self.active_registries[instance_id].get_latest_schema(subject)
+        )
+
     # ===== Cross-Registry Operations =====
 
     def query_all(
@@ -110,7 +361,8 @@ class MultiBackendOrchestrator:
         Execute an operation across all active registries.
 
         Args:
-            operation: Method name to call on each registry
+            operation: Method name to call on each registry (one of the
+                read operations in _QUERY_OPERATIONS)
             **kwargs: Arguments to pass to the method
 
         Returns:
@@ -118,9 +370,16 @@ class MultiBackendOrchestrator:
         """
         results = {}
 
-        for instance_id, registry in self.active_registries.items():
+        for instance_id, methods in self._method_tables.items():
+            method = methods.get(operation)
+            if method is None:
+                results[instance_id] = {
+                    "status": "error",
+                    "error": f"Unsupported operation: {operation}"
+                }
+                continue
+
             try:
-                method = getattr(registry, operation)
                 result = method(**kwargs)
                 results[instance_id] = {
                     "status": "success",
@@ -150,13 +409,15 @@ class MultiBackendOrchestrator:
         """
         results = {}
 
-        for instance_id, registry in self.active_registries.items():
-            try:
-                schema = registry.get_latest_schema(subject)
-                results[instance_id] = schema
-            except Exception as e:
-                logger.debug(f"Schema not found in {instance_id}: {e}")
+        outcomes = self._fan_out(
+            lambda instance_id, _: self._cached_get_latest_schema(instance_id, subject)
+        )
+        for instance_id, outcome in outcomes.items():
+            if isinstance(outcome, Exception):
+                logger.debug(f"Schema not found in {instance_id}: {outcome}")
                 # Schema not found in this registry
+                continue
+            results[instance_id] = outcome
 
         return results
 
@@ -167,24 +428,26 @@ class MultiBackendOrchestrator:
         Returns:
             Dict mapping instance_id to compatibility info
         """
-        results = {}
+        results: Dict[str, Dict[str, Any]] = {}
 
-        for instance_id, registry in self.active_registries.items():
-            try:
-                global_mode = registry.get_compatibility_mode()
-                subject_modes = registry.get_all_compatibility_modes()
+        def get_modes(instance_id: str, registry: ISchemaRegistry):
+            return registry.get_compatibility_mode(), registry.get_all_compatibility_modes()
 
+        for instance_id, outcome in self._fan_out(get_modes).items():
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to get compatibility for {instance_id}: {outcome}")
                 results[instance_id] = {
-                    "global": global_mode.value,
-                    "subjects": {
-                        k: v.value for k, v in subject_modes.items()
-                    }
+                    "error": str(outcome)
                 }
-            except Exception as e:
-                logger.error(f"Failed to get compatibility for {instance_id}: {e}")
-                results[instance_id] = {
-                    "error": str(e)
+                continue
+
+            global_mode, subject_modes = outcome
+            results[instance_id] = {
+                "global": _COMPAT_MODE_VALUE[global_mode],
+                "subjects": {
+                    k: _COMPAT_MODE_VALUE[v] for k, v in subject_modes.items()
                 }
+            }
 
         return results
 
@@ -197,19 +460,43 @@ class MultiBackendOrchestrator:
         """
         results = {}
 
-        for instance_id, registry in self.active_registries.items():
-            try:
-                health = registry.health_check()
-                results[instance_id] = health
-            except Exception as e:
-                logger.error(f"Health check failed for {instance_id}: {e}")
-                results[instance_id] = HealthStatus(
+        outcomes = self._fan_out(lambda _, registry: registry.health_check())
+        for instance_id, outcome in outcomes.items():
+            if isinstance(outcome, Exception):
+                logger.error(f"Health check failed for {instance_id}: {outcome}")
+                outcome = HealthStatus(
                     healthy=False,
                     status_code=0,
-                    message=f"Health check exception: {str(e)}",
+                    message=f"Health check exception: {str(outcome)}",
                     response_time_ms=0,
-                    metadata={"error": str(e)}
+                    metadata={"error": str(outcome)}
                 )
+            results[instance_id] = outcome
+
+        return results
+
+    def _fan_out(self, call) -> Dict[str, Any]:
+        """
+        Run call(instance_id, registry) for every active registry in parallel.
+
+        Args:
+            call: Callable taking (instance_id, registry)
+
+        Returns:
+            Dict mapping instance_id to the call's return value, or to the
+            exception it raised
+        """
+        futures = {
+            instance_id: self.executor.submit(call, instance_id, registry)
+            for instance_id, registry in list(self.active_registries.items())
+        }
+
+        results = {}
+        for instance_id, future in futures.items():
+            try:
+                results[instance_id] = future.result()
+            except Exception as e:
+                results[instance_id] = e
 
         return results
 
@@ -219,87 +506,81 @@ class MultiBackendOrchestrator:
         self,
         registry_ids: List[str],
         target_mode: CompatibilityMode,
-        subject_filter: Optional[str] = None
+        subject_filter: Optional[str] = None,
+        subject_pattern: Optional[str] = None
     ) -> BulkCheckResult:
         """
         Check compatibility for multiple subjects across registries.
 
+        Synchronous wrapper around bulk_check_compatibility_async; must not
+        be called from a running event loop.
+
         Args:
             registry_ids: List of registry instance IDs
             target_mode: Target compatibility mode to check for
             subject_filter: Optional subject prefix filter
+            subject_pattern: Optional regular expression subjects must match
 
         Returns:
             BulkCheckResult with aggregated results
         """
-        import time as time_module
-
-        start_time = time_module.time()
-
-        all_results = []
-        compatible_count = 0
-        incompatible_count = 0
-        error_count = 0
-        total_checked = 0
-
-        for registry_id in registry_ids:
-            registry = self.active_registries.get(registry_id)
-            if not registry:
-                logger.warning(f"Registry {registry_id} not found")
-                continue
+        return _run(
+            self.bulk_check_compatibility_async(
+                registry_ids=registry_ids,
+                target_mode=target_mode,
+                subject_filter=subject_filter,
+                subject_pattern=subject_pattern
+            )
+        )
 
-            try:
-                # List subjects
-                subjects = registry.list_subjects(prefix=subject_filter)
-
-                # Check each subject in parallel
-                futures = {}
-                for subject in subjects:
-                    future = self.executor.submit(
-                        self._check_single_subject,
-                        registry,
-                        subject,
-                        target_mode
-                    )
-                    futures[future] = (registry_id, subject)
+    async def bulk_check_compatibility_async(
+        self,
+        registry_ids: List[str],
+        target_mode: CompatibilityMode,
+        subject_filter: Optional[str] = None,
+        subject_pattern: Optional[str] = None
+    ) -> BulkCheckResult:
+        """
+        Check compatibility for multiple subjects across registries.
 
-                # Collect results
-                for future in as_completed(futures):
-                    registry_id, subject = futures[future]
-                    total_checked += 1
+        Subject checks run concurrently, up to _MAX_PENDING_CHECKS at a
+        time, and start while subjects are still being listed. Backend calls
+        are blocking and run on the orchestrator's executor.
 
-                    try:
-                        result = future.result()
+        Args:
+            registry_ids: List of registry instance IDs
+            target_mode: Target compatibility mode to check for
+            subject_filter: Optional subject prefix filter
+            subject_pattern: Optional regular expression subjects must match
 
-                        result_dict = {
-                            "registry_id": registry_id,
-                            "subject": subject,
-                            "is_compatible": result.is_compatible,
-                            "messages": result.messages,
-                            "errors": result.errors
-                        }
+        Returns:
+            BulkCheckResult with aggregated results
+        """
+        import time as time_module
 
-                        all_results.append(result_dict)
+        start_time = time_module.time()
 
-                        if result.is_compatible:
-                            compatible_count += 1
-                        else:
-                            incompatible_count += 1
+        all_results = []
+        listing_errors = 0
+        check_errors = 0
+
+        async for registry_id, subject, outcome in self._iter_check_outcomes(
+            registry_ids, target_mode, subject_filter, subject_pattern
+        ):
+            if subject is None:
+                # Listing the registry's subjects failed
+                listing_errors += 1
+                continue
 
-                    except Exception as e:
-                        logger.error(f"Check failed for {subject} in {registry_id}: {e}")
-                        error_count += 1
-                        all_results.append({
-                            "registry_id": registry_id,
-                            "subject": subject,
-                            "is_compatible": False,
-                            "messages": [],
-                            "errors": [str(e)]
-                        })
+            all_results.append(self._result_entry(registry_id, subject, outcome))
+            check_errors += isinstance(outcome, Exception)
 
-            except Exception as e:
-                logger.error(f"Failed to check registry {registry_id}: {e}")
-                error_count += 1
+        # Failed checks are reported as not compatible, so they are
+        # subtracted rather than counted as incompatible
+        total_checked = len(all_results)
+        compatible_count = sum(bool(r["is_compatible"]) for r in all_results)
+        incompatible_count = total_checked - compatible_count - check_errors
+        error_count = listing_errors + check_errors
 
         duration = time_module.time() - start_time
 
@@ -312,11 +593,41 @@ class MultiBackendOrchestrator:
             results=all_results
         )
 
+    async def iter_bulk_check_compatibility(
+        self,
+        registry_ids: List[str],
+        target_mode: CompatibilityMode,
+        subject_filter: Optional[str] = None,
+        subject_pattern: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Check compatibility for multiple subjects, yielding results as they finish.
+
+        Yields the same per-subject dicts as BulkCheckResult.results, in
+        completion order, without holding the whole result set in memory.
+        Registries whose subjects cannot be listed are logged and skipped.
+
+        Args:
+            registry_ids: List of registry instance IDs
+            target_mode: Target compatibility mode to check for
+            subject_filter: Optional subject prefix filter
+            subject_pattern: Optional regular expression subjects must match
+
+        Yields:
+            Per-subject result dicts
+        """
+        async for registry_id, subject, outcome in self._iter_check_outcomes(
+            registry_ids, target_mode, subject_filter, subject_pattern
+        ):
+            if subject is not None:
+                yield self._result_entry(registry_id, subject, outcome)
+
     def bulk_set_compatibility(
         self,
         registry_ids: List[str],
         mode: CompatibilityMode,
-        subject_filter: Optional[str] = None
+        subject_filter: Optional[str] = None,
+        subject_pattern: Optional[str] = None
     ) -> Dict[str, Dict[str, str]]:
         """
         Set compatibility mode for multiple subjects across registries.
@@ -325,6 +636,7 @@ class MultiBackendOrchestrator:
             registry_ids: List of registry instance IDs
             mode: Compatibility mode to set
             subject_filter: Optional subject prefix filter
+            subject_pattern: Optional regular expression subjects must match
 
         Returns:
             Dict mapping registry_id to dict of subject: status
@@ -340,9 +652,12 @@ class MultiBackendOrchestrator:
             registry_results = {}
 
             try:
-                if subject_filter:
+                if subject_filter or subject_pattern:
                     # Set for filtered subjects
-                    subjects = registry.list_subjects(prefix=subject_filter)
+                    subjects = registry.list_subjects(
+                        prefix=subject_filter,
+                        pattern=subject_pattern
+                    )
 
                     for subject in subjects:
                         try:
@@ -371,7 +686,7 @@ class MultiBackendOrchestrator:
 
     def _check_single_subject(
         self,
-        registry: ISchemaRegistry,
+        registry_id: str,
         subject: str,
         target_mode: CompatibilityMode
     ) -> CompatibilityResult:
@@ -381,7 +696,7 @@ class MultiBackendOrchestrator:
         This checks if the subject's schemas are compatible with the target mode.
 
         Args:
-            registry: Registry instance
+            registry_id: Registry instance ID
             subject: Subject name
             target_mode: Target compatibility mode
 
@@ -389,10 +704,12 @@ class MultiBackendOrchestrator:
             CompatibilityResult
         """
         try:
-            # Get all versions
-            versions = registry.list_versions(subject)
+            registry = self.active_registries[registry_id]
 
-            if len(versions) < 2:
+            # Get all versions in one call
+            schemas = self._cached_get_all_versions(registry_id, subject)
+
+            if len(schemas) < 2:
                 # Only one version - always compatible
                 return CompatibilityResult(
                     is_compatible=True,
@@ -401,14 +718,23 @@ class MultiBackendOrchestrator:
                     errors=[]
                 )
 
-            # Get latest version
-            latest = registry.get_schema_by_subject_version(subject, versions[-1])
+            latest = schemas[-1]
 
-            # Check compatibility with all previous versions
+            # Check compatibility with all previous versions. A version with
+            # the same content as the latest, or as one already checked,
+            # cannot change the outcome, so it is skipped.
             all_compatible = True
             messages = []
+            seen_hashes = {latest.content_hash}
+            skipped = 0
+
+            for previous in schemas[:-1]:
+                if previous.content_hash in seen_hashes:
+                    skipped += 1
+                    continue
+                seen_hashes.add(previous.content_hash)
 
-            for version in versions[:-1]:
+                version = previous.version
                 try:
                     result = registry.check_compatibility(
                         subject=subject,
@@ -425,6 +751,9 @@ class MultiBackendOrchestrator:
                     all_compatible = False
                     messages.append(f"Check failed for version {version}: {str(e)}")
 
+            if skipped:
+                logger.debug(f"Skipped {skipped} duplicate version(s) of {subject} in {registry_id}")
+
             return CompatibilityResult(
                 is_compatible=all_compatible,
                 messages=messages if messages else ["All versions compatible"],
@@ -440,7 +769,155 @@ class MultiBackendOrchestrator:
                 errors=[str(e)]
             )
 
+    async def _iter_check_outcomes(
+        self,
+        registry_ids: List[str],
+        target_mode: CompatibilityMode,
+        subject_filter: Optional[str],
+        subject_pattern: Optional[str]
+    ) -> AsyncIterator[Tuple[str, Optional[str], Any]]:
+        """
+        Run subject checks concurrently and yield outcomes as they complete.
+
+        Outcomes are yielded while subjects are still being listed. At most
+        _MAX_PENDING_CHECKS checks are running or waiting to be consumed;
+        listing pauses until the consumer catches up.
+
+        Yields (registry_id, subject, outcome) tuples where outcome is the
+        CompatibilityResult or the exception raised by the check. A subject
+        of None means listing that registry's subjects failed; outcome is
+        then that exception.
+        """
+        loop = asyncio.get_running_loop()
+
+        # Finished checks, plus listing failures and a final None from the lister
+        outcomes: asyncio.Queue = asyncio.Queue()
+        # Checks started but not yet handed to the consumer; the listing
+        # thread waits for a slot before starting each one
+        slots = threading.Semaphore(_MAX_PENDING_CHECKS)
+        stopped = threading.Event()
+        running: Set[asyncio.Future] = set()
+        started = 0
+
+        async def check(registry_id: str, subject: str):
+            outcome: Union[CompatibilityResult, Exception]
+            try:
+                outcome = await loop.run_in_executor(
+                    self.executor,
+                    self._check_single_subject,
+                    registry_id,
+                    subject,
+                    target_mode
+                )
+            except Exception as e:
+                logger.error(f"Check failed for {subject} in {registry_id}: {e}")
+                outcome = e
+            outcomes.put_nowait((registry_id, subject, outcome))
+
+        def start_check(registry_id: str, subject: str):
+            nonlocal started
+            started += 1
+            task = asyncio.ensure_future(check(registry_id, subject))
+            running.add(task)
+            task.add_done_callback(running.discard)
+
+        def feed_subjects(registry_id: str, registry: ISchemaRegistry):
+            # Runs on the executor; each check starts as soon as its subject
+            # has been parsed, overlapping the listing download with checks
+            subjects = registry.iter_subjects(prefix=subject_filter, pattern=subject_pattern)
+            for subject in subjects:
+                slots.acquire()
+                if stopped.is_set():
+                    return
+                loop.call_soon_threadsafe(start_check, registry_id, subject)
+
+        async def list_subjects():
+            try:
+                for registry_id in registry_ids:
+                    registry = self.active_registries.get(registry_id)
+                    if not registry:
+                        logger.warning(f"Registry {registry_id} not found")
+                        continue
+
+                    try:
+                        await loop.run_in_executor(
+                            self.executor,
+                            feed_subjects,
+                            registry_id,
+                            registry
+                        )
+                    except Exception as e:
+                        logger.error(f"Failed to check registry {registry_id}: {e}")
+                        outcomes.put_nowait((registry_id, None, e))
+            finally:
+                # Checks scheduled by feed_subjects have started by now,
+                # since loop callbacks run in FIFO order
+                outcomes.put_nowait(None)
+
+        lister = asyncio.ensure_future(list_subjects())
+        listing_done = False
+        delivered = 0
+
+        try:
+            while not (listing_done and delivered == started):
+                item = await outcomes.get()
+                if item is None:
+                    listing_done = True
+                    continue
+
+                yield item
+
+                if item[1] is not None:
+                    delivered += 1
+                    slots.release()
+
+        finally:
+            # Stop waiting on checks the consumer no longer wants, and wake
+            # a listing thread blocked on a slot so it can see the stop
+            stopped.set()
+            slots.release()
+            lister.cancel()
+            for task in list(running):
+                task.cancel()
+
+    @staticmethod
+    def _result_entry(registry_id: str, subject: str, outcome: Any) -> Dict[str, Any]:
+        """Build the per-subject result dict reported by bulk checks."""
+        if isinstance(outcome, Exception):
+            return {
+                "registry_id": registry_id,
+                "subject": subject,
+                "is_compatible": False,
+                "messages": [],
+                "errors": [str(outcome)]
+            }
+
+        return {
+            "registry_id": registry_id,
+            "subject": subject,
+            "is_compatible": outcome.is_compatible,
+            "messages": outcome.messages,
+            "errors": outcome.errors
+        }
+
     def shutdown(self):
-        """Shutdown the orchestrator and cleanup resources."""
-        self.executor.shutdown(wait=True)
+        """
+        Shutdown the orchestrator and cleanup resources.
+
+        The shared executor is only shut down when the last orchestrator
+        using it shuts down.
+        """
+        global _executor_users
+        with _executor_lock:
+            if self._shut_down:
+                return
+            self._shut_down = True
+            _executor_users -= 1
+            last_user = _executor_users == 0
+            if last_user:
+                # The next orchestrator gets a fresh pool
+                _shared_executor.cache_clear()
+
+        if last_user:
+            self.executor.shutdown(wait=True)
         logger.info("Orchestrator shutdown complete")
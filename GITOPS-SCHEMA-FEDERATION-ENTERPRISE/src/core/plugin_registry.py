@@ -2,16 +2,48 @@
 Plugin registry for managing schema registry plugins.
 """
 
+import hashlib
 import importlib
 import logging
 from typing import Dict, List, Optional, Type
 
+import orjson
+
 from .interfaces import ISchemaRegistry
 from .models import RegistryConfig, RegistryType
 
 
 logger = logging.getLogger(__name__)
 
+# Plugin classes declared with @register_plugin_for, in import order
+_PLUGIN_DECL: Dict[Type[ISchemaRegistry], RegistryType] = {}
+
+
+def register_plugin_for(registry_type: RegistryType):
+    """
+    Class decorator declaring the registry type a plugin handles.
+
+    Sets the class's registry_type attribute and records the class so
+    PluginRegistry.load_plugin_from_module can find it without scanning
+    the module.
+
+    Args:
+        registry_type: Type of registry the decorated class handles
+
+    Raises:
+        ValueError: If the decorated class doesn't implement ISchemaRegistry
+    """
+    def decorator(plugin_class: Type[ISchemaRegistry]) -> Type[ISchemaRegistry]:
+        if not issubclass(plugin_class, ISchemaRegistry):
+            raise ValueError(
+                f"Plugin {plugin_class} must implement ISchemaRegistry"
+            )
+        plugin_class.registry_type = registry_type
+        _PLUGIN_DECL[plugin_class] = registry_type
+        return plugin_class
+
+    return decorator
+
 
 class PluginRegistry:
     """
@@ -19,10 +51,16 @@ class PluginRegistry:
     Supports dynamic plugin loading and management.
     """
 
+    __slots__ = ("_plugins", "_instances", "_instances_by_key", "_module_cache")
+
     def __init__(self):
         """Initialize the plugin registry."""
         self._plugins: Dict[RegistryType, Type[ISchemaRegistry]] = {}
         self._instances: Dict[str, ISchemaRegistry] = {}
+        # Instances from get_or_create_instance, by config identity
+        self._instances_by_key: Dict[str, ISchemaRegistry] = {}
+        # Plugin class resolved from each module path already loaded
+        self._module_cache: Dict[str, Type[ISchemaRegistry]] = {}
         logger.info("Plugin registry initialized")
 
     def register_plugin(
@@ -45,13 +83,34 @@ class PluginRegistry:
                 f"Plugin {plugin_class} must implement ISchemaRegistry"
             )
 
+        self._register_plugin_unchecked(registry_type, plugin_class)
+
+    def _register_plugin_unchecked(
+        self,
+        registry_type: RegistryType,
+        plugin_class: Type[ISchemaRegistry]
+    ):
+        """
+        Register a plugin class without validating it.
+
+        Callers must already have verified that plugin_class is an
+        ISchemaRegistry subclass.
+        """
         self._plugins[registry_type] = plugin_class
-        logger.info(f"Registered plugin for {registry_type.value}")
+        logger.info("Registered plugin for %s", registry_type.value)
 
     def load_plugin_from_module(self, module_path: str):
         """
         Dynamically load a plugin from a Python module.
 
+        The module's PLUGIN_CLASS attribute is used when present, then any
+        class the module (or, for a package, its submodules) declared with
+        @register_plugin_for. Otherwise the names in __all__ (or, failing
+        that, every attribute) are searched for an ISchemaRegistry
+        implementation. The registry type is read from the class's
+        registry_type attribute. Repeat loads of
+        the same module path reuse the class resolved the first time.
+
         Args:
             module_path: Python import path (e.g., "plugins.confluent.plugin")
 
@@ -59,33 +118,79 @@ class PluginRegistry:
             ImportError: If module cannot be loaded
             ValueError: If no valid plugin found in module
         """
+        # Cached classes were validated when first loaded
+        plugin_class = self._module_cache.get(module_path)
+        if plugin_class is not None:
+            self._register_plugin_unchecked(plugin_class.registry_type, plugin_class)
+            return
+
         try:
             module = importlib.import_module(module_path)
 
-            # Look for a class implementing ISchemaRegistry
-            plugin_found = False
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (
-                    isinstance(attr, type) and
-                    issubclass(attr, ISchemaRegistry) and
-                    attr is not ISchemaRegistry
-                ):
-                    instance = attr.__new__(attr)  # Create temporary instance
-                    registry_type = instance.get_registry_type()
-                    self.register_plugin(registry_type, attr)
-                    plugin_found = True
-                    break
-
-            if not plugin_found:
+            plugin_class = getattr(module, "PLUGIN_CLASS", None)
+            if plugin_class is None:
+                plugin_class = (
+                    self._find_declared_plugin(module) or
+                    self._find_plugin_class(module)
+                )
+            elif not issubclass(plugin_class, ISchemaRegistry):
+                raise ValueError(
+                    f"Plugin {plugin_class} must implement ISchemaRegistry"
+                )
+
+            if plugin_class is None:
                 raise ValueError(
                     f"No ISchemaRegistry implementation found in {module_path}"
                 )
 
+            # Both lookups above only yield ISchemaRegistry subclasses
+            self._register_plugin_unchecked(plugin_class.registry_type, plugin_class)
+            self._module_cache[module_path] = plugin_class
+
         except Exception as e:
-            logger.error(f"Failed to load plugin from {module_path}: {e}")
+            logger.error("Failed to load plugin from %s: %s", module_path, e)
             raise
 
+    @staticmethod
+    def _find_declared_plugin(module) -> Optional[Type[ISchemaRegistry]]:
+        """
+        Find a class the module declared with @register_plugin_for.
+
+        Args:
+            module: Imported plugin module
+
+        Returns:
+            Plugin class, or None if the module didn't declare one
+        """
+        name = module.__name__
+        for plugin_class in _PLUGIN_DECL:
+            owner = plugin_class.__module__
+            if owner == name or owner.startswith(name + "."):
+                return plugin_class
+        return None
+
+    @staticmethod
+    def _find_plugin_class(module) -> Optional[Type[ISchemaRegistry]]:
+        """
+        Search a module's public names for an ISchemaRegistry implementation.
+
+        Args:
+            module: Imported plugin module
+
+        Returns:
+            Plugin class, or None if the module doesn't define one
+        """
+        for attr_name in getattr(module, "__all__", None) or dir(module):
+            attr = getattr(module, attr_name)
+            if (
+                isinstance(attr, type) and
+                issubclass(attr, ISchemaRegistry) and
+                attr is not ISchemaRegistry and
+                hasattr(attr, "registry_type")
+            ):
+                return attr
+        return None
+
     def create_instance(
         self,
         config: RegistryConfig,
@@ -117,13 +222,37 @@ class PluginRegistry:
         if instance_id:
             self._instances[instance_id] = instance
             logger.info(
-                f"Created instance '{instance_id}' for {config.type.value}"
+                "Created instance '%s' for %s", instance_id, config.type.value
             )
         else:
-            logger.info(f"Created anonymous instance for {config.type.value}")
+            logger.info("Created anonymous instance for %s", config.type.value)
 
         return instance
 
+    def get_or_create_instance(self, config: RegistryConfig) -> ISchemaRegistry:
+        """
+        Get the instance for a registry endpoint, creating it on first use.
+
+        Configs that agree on every setting affecting plugin behaviour
+        (everything except id and enabled) share one instance, so
+        equivalent configs don't each build their own HTTP session.
+
+        Args:
+            config: Configuration for the registry
+
+        Returns:
+            Configured registry instance
+
+        Raises:
+            ValueError: If no plugin registered for registry type
+        """
+        key = _config_key(config)
+        instance = self._instances_by_key.get(key)
+        if instance is None:
+            instance = self.create_instance(config)
+            self._instances_by_key[key] = instance
+        return instance
+
     def get_instance(self, instance_id: str) -> Optional[ISchemaRegistry]:
         """
         Get a previously created instance by ID.
@@ -163,7 +292,7 @@ class PluginRegistry:
         """
         if registry_type in self._plugins:
             del self._plugins[registry_type]
-            logger.info(f"Unregistered plugin for {registry_type.value}")
+            logger.info("Unregistered plugin for %s", registry_type.value)
 
     def remove_instance(self, instance_id: str):
         """
@@ -174,13 +303,50 @@ class PluginRegistry:
         """
         if instance_id in self._instances:
             del self._instances[instance_id]
-            logger.info(f"Removed instance '{instance_id}'")
+            logger.info("Removed instance '%s'", instance_id)
 
     def clear_instances(self):
         """Remove all registry instances."""
         self._instances.clear()
+        self._instances_by_key.clear()
         logger.info("Cleared all registry instances")
 
+    def clear_schema_cache(self, subject: Optional[str] = None):
+        """
+        Drop cached schemas on every registry instance.
+
+        Args:
+            subject: Only drop entries for this subject (all if None)
+        """
+        instances = {
+            id(instance): instance
+            for instance in (
+                *self._instances.values(),
+                *self._instances_by_key.values()
+            )
+        }
+        for instance in instances.values():
+            instance.clear_schema_cache(subject)
+
+
+def _config_key(config: RegistryConfig) -> str:
+    """Digest of every config field that affects how a plugin behaves."""
+    identity = orjson.dumps(
+        {
+            "type": config.type.value,
+            "url": config.url,
+            "auth": config.auth,
+            "ssl_config": config.ssl_config,
+            "timeout": config.timeout,
+            "max_retries": config.max_retries,
+            "pool_size": config.pool_size,
+            "metadata": config.metadata
+        },
+        option=orjson.OPT_SORT_KEYS,
+        default=str
+    )
+    return hashlib.blake2b(identity, digest_size=16).hexdigest()
+
 
 # Global plugin registry instance
 _global_registry = PluginRegistry()
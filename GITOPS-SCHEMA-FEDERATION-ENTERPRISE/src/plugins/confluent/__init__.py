@@ -2,6 +2,7 @@
 Confluent Schema Registry plugin.
 """
 
+from .async_plugin import AsyncConfluentSchemaRegistryPlugin
 from .plugin import ConfluentSchemaRegistryPlugin
 
-__all__ = ["ConfluentSchemaRegistryPlugin"]
+__all__ = ["AsyncConfluentSchemaRegistryPlugin", "ConfluentSchemaRegistryPlugin"]
@@ -0,0 +1,219 @@
+"""
+Asynchronous Confluent Schema Registry client.
+
+Covers the read paths that fan out to every subject (discovery and
+compatibility listings), where many requests in flight over one
+connection pool beat a thread per request.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+from ...core.models import (
+    CompatibilityMode,
+    RegistryConfig,
+    RegistryType,
+    Schema,
+    SchemaFormat
+)
+from .plugin import _CONFLUENT_TO_FORMAT, _RETRY_STATUS_FORCELIST
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds before the first status-based retry, doubling on each further one
+# (the synchronous plugin's urllib3 backoff_factor)
+_RETRY_BACKOFF = 1.0
+
+
+class AsyncConfluentSchemaRegistryPlugin:
+    """
+    Async counterpart of ConfluentSchemaRegistryPlugin for read operations.
+
+    Use as an async context manager, or call aclose() when done:
+
+        async with AsyncConfluentSchemaRegistryPlugin(config) as registry:
+            schemas = await registry.discover_schemas()
+    """
+
+    registry_type = RegistryType.CONFLUENT
+
+    def __init__(
+        self,
+        config: RegistryConfig,
+        max_connections: int = 64,
+        max_keepalive_connections: int = 32,
+        transport: Optional[Any] = None
+    ):
+        """
+        Initialize the async Confluent SR client.
+
+        Args:
+            config: Registry configuration
+            max_connections: Upper bound on concurrent connections
+            max_keepalive_connections: Idle connections kept for reuse
+            transport: httpx transport to use instead of the default
+                connection pool (e.g. httpx.MockTransport in tests)
+        """
+        import httpx
+
+        self.config = config
+        self.base_url = config.url.rstrip('/')
+        self._http_error = httpx.HTTPStatusError
+
+        auth = None
+        if config.auth.get("username") and config.auth.get("password"):
+            auth = (config.auth["username"], config.auth["password"])
+
+        verify: Any = True
+        if not config.ssl_config.get("verify", True):
+            verify = False
+        elif config.ssl_config.get("cert_path"):
+            verify = config.ssl_config["cert_path"]
+
+        # Transport retries cover connection failures only; _get_json retries
+        # 429/5xx responses. httpx ignores client limits when a transport is
+        # given, so they go on the transport
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                retries=config.max_retries,
+                verify=verify,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections
+                )
+            )
+
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            auth=auth,
+            verify=verify,
+            timeout=config.timeout,
+            headers={"Content-Type": "application/vnd.schemaregistry.v1+json"},
+            transport=transport
+        )
+        logger.info("Initialized async Confluent SR client: %s", self.base_url)
+
+    async def __aenter__(self) -> "AsyncConfluentSchemaRegistryPlugin":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.client.aclose()
+
+    async def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        GET a registry path and decode the JSON response.
+
+        Throttled (429) and server error responses are retried up to
+        config.max_retries times with exponential backoff, honouring a
+        Retry-After header in seconds, like the synchronous plugin's session.
+        """
+        for attempt in range(self.config.max_retries + 1):
+            response = await self.client.get(path, params=params)
+            if (response.status_code not in _RETRY_STATUS_FORCELIST
+                    or attempt == self.config.max_retries):
+                break
+
+            retry_after = response.headers.get("Retry-After", "")
+            delay = float(retry_after) if retry_after.isdigit() else _RETRY_BACKOFF * 2 ** attempt
+            logger.debug("Retrying %s after %s in %.1fs", path, response.status_code, delay)
+            await asyncio.sleep(delay)
+
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    # ===== Schema Operations =====
+
+    async def list_subjects(self, prefix: Optional[str] = None) -> List[str]:
+        """List all subjects, optionally filtered by prefix."""
+        params = {"subjectPrefix": prefix} if prefix else None
+        subjects = await self._get_json("/subjects", params=params)
+
+        # Registries without subjectPrefix support return every subject
+        if prefix:
+            subjects = [s for s in subjects if s.startswith(prefix)]
+        return subjects
+
+    async def get_schema_by_subject_version(
+        self,
+        subject: str,
+        version: Any
+    ) -> Schema:
+        """Get specific version of a schema."""
+        try:
+            data = await self._get_json(f"/subjects/{subject}/versions/{version}")
+        except self._http_error as e:
+            if e.response.status_code == 404:
+                raise KeyError(f"Subject {subject} version {version} not found")
+            raise
+
+        return Schema(
+            id=data.get("id"),
+            subject=data.get("subject", subject),
+            version=data.get("version", version),
+            schema_format=_CONFLUENT_TO_FORMAT.get(
+                data.get("schemaType", "AVRO"), SchemaFormat.AVRO
+            ),
+            schema_content=data["schema"],
+            metadata={},
+            registry_type=self.registry_type
+        )
+
+    async def get_latest_schema(self, subject: str) -> Schema:
+        """Get the latest version of a schema."""
+        return await self.get_schema_by_subject_version(subject, "latest")
+
+    async def discover_schemas(self, namespace: Optional[str] = None) -> List[Schema]:
+        """Fetch the latest schema of every subject concurrently."""
+        subjects = await self.list_subjects(prefix=namespace)
+        results = await asyncio.gather(
+            *(self.get_latest_schema(subject) for subject in subjects),
+            return_exceptions=True
+        )
+
+        schemas = []
+        for subject, result in zip(subjects, results):
+            if isinstance(result, BaseException):
+                logger.warning("Failed to get schema for %s: %s", subject, result)
+            else:
+                schemas.append(result)
+        return schemas
+
+    # ===== Compatibility Operations =====
+
+    async def get_compatibility_mode(
+        self,
+        subject: Optional[str] = None
+    ) -> CompatibilityMode:
+        """Get compatibility mode, falling back to global for subjects without one."""
+        path = f"/config/{subject}" if subject else "/config"
+
+        try:
+            data = await self._get_json(path)
+        except self._http_error as e:
+            if e.response.status_code == 404 and subject:
+                return await self.get_compatibility_mode()
+            raise
+
+        return CompatibilityMode[data.get("compatibilityLevel", "BACKWARD")]
+
+    async def get_all_compatibility_modes(self) -> Dict[str, CompatibilityMode]:
+        """Get the effective compatibility mode of every subject concurrently."""
+        subjects = await self.list_subjects()
+        results = await asyncio.gather(
+            *(self.get_compatibility_mode(subject) for subject in subjects),
+            return_exceptions=True
+        )
+
+        return {
+            subject: mode
+            for subject, mode in zip(subjects, results)
+            if not isinstance(mode, BaseException)
+        }
@@ -2,15 +2,22 @@
 Confluent Schema Registry plugin implementation.
 """
 
+import base64
+import hashlib
 import logging
+import re
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import ijson  # type: ignore[import-untyped]
+import orjson
+from cachetools import LRUCache, TTLCache
 
 from ...core.interfaces import ISchemaRegistry
+from ...core.plugin_registry import register_plugin_for
 from ...core.models import (
     CompatibilityMode,
     CompatibilityResult,
@@ -24,7 +31,154 @@ from ...core.models import (
 
 logger = logging.getLogger(__name__)
 
+_FORMAT_TO_CONFLUENT: Dict[SchemaFormat, str] = {
+    SchemaFormat.AVRO: "AVRO",
+    SchemaFormat.PROTOBUF: "PROTOBUF",
+    SchemaFormat.JSON_SCHEMA: "JSON"
+}
+_CONFLUENT_TO_FORMAT: Dict[str, SchemaFormat] = {
+    confluent_type: schema_format
+    for schema_format, confluent_type in _FORMAT_TO_CONFLUENT.items()
+}
+_SUPPORTED_FORMATS = frozenset(_FORMAT_TO_CONFLUENT)
+
+# Concurrent per-subject requests in discovery, capped by the HTTP pool size
+_MAX_PARALLEL_REQUESTS = 16
+
+# Registered versions never change; "latest" does, so it is only kept briefly
+_SCHEMA_CACHE_SIZE = 1024
+_LATEST_CACHE_SIZE = 512
+_LATEST_CACHE_TTL = 30
+
+# GET /schemas returns at most schema.search.max.limit entries per request
+# (1000 by default), so listings are fetched in pages of that size
+_SCHEMAS_PAGE_SIZE = 1000
+
+# Compatibility modes reported alongside check results
+_MODE_CACHE_SIZE = 1024
+_MODE_CACHE_TTL = 60
+
+# Sessions shared by every plugin instance that talks to the same endpoint
+# with the same TLS, retry settings and credentials. Credentials are part of
+# the key because a session's cookie jar (e.g. load-balancer stickiness or
+# registry session cookies) must not be sent on behalf of another identity.
+_SESSION_POOL: Dict[Tuple[Any, ...], Any] = {}
+_SESSION_POOL_LOCK = threading.Lock()
+
+# Retry policies are immutable, so one per retry count serves every session
+_RETRY_ALLOWED_METHODS = frozenset(
+    ["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"]
+)
+_RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+_retry_by_params: Dict[int, Any] = {}
+
+
+def _shared_session(config: RegistryConfig):
+    """
+    Get the pooled requests.Session for a registry endpoint.
+
+    Args:
+        config: Registry configuration
+
+    Returns:
+        requests.Session, created and configured on first use
+    """
+    verify: Any = True
+    if not config.ssl_config.get("verify", True):
+        verify = False
+    elif config.ssl_config.get("cert_path"):
+        verify = config.ssl_config["cert_path"]
+
+    # Digest rather than the raw secret, so the key can't leak it
+    identity = hashlib.blake2b(
+        f"{config.auth.get('username', '')}:{config.auth.get('password', '')}".encode(),
+        digest_size=16
+    ).hexdigest()
+
+    pool_size = config.pool_size or 32
+    parsed = urlsplit(config.url)
+    key = (
+        parsed.scheme,
+        parsed.hostname,
+        parsed.port,
+        verify,
+        config.max_retries,
+        pool_size,
+        identity
+    )
+
+    with _SESSION_POOL_LOCK:
+        session = _SESSION_POOL.get(key)
+        if session is None:
+            session = _build_session(config.max_retries, pool_size, verify)
+            _SESSION_POOL[key] = session
+        return session
+
+
+class _BasicAuth:
+    """
+    requests auth callable that sets a Basic Authorization header.
+
+    The header is encoded once, rather than on every request as with an
+    (username, password) tuple.
+    """
+
+    __slots__ = ("_header",)
+
+    def __init__(self, username: str, password: str):
+        token = base64.b64encode(f"{username}:{password}".encode("latin1"))
+        self._header = f"Basic {token.decode('ascii')}"
+
+    def __call__(self, request):
+        request.headers["Authorization"] = self._header
+        return request
+
+
+def _build_session(max_retries: int, pool_size: int, verify: Any):
+    """
+    Create a requests.Session with retries and a sized connection pool.
+
+    Called with _SESSION_POOL_LOCK held.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 
+    session = requests.Session()
+
+    # Configure retries
+    retry_strategy = _retry_by_params.get(max_retries)
+    if retry_strategy is None:
+        retry_strategy = Retry(
+            total=max_retries,
+            backoff_factor=1,
+            status_forcelist=_RETRY_STATUS_FORCELIST,
+            allowed_methods=_RETRY_ALLOWED_METHODS
+        )
+        _retry_by_params[max_retries] = retry_strategy
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        pool_block=False
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    # Configure headers
+    session.headers.update({
+        "Content-Type": "application/vnd.schemaregistry.v1+json",
+        "Connection": "keep-alive",
+        "Accept-Encoding": "gzip, deflate"
+    })
+
+    # Configure SSL
+    session.verify = verify
+
+    return session
+
+
+@register_plugin_for(RegistryType.CONFLUENT)
 class ConfluentSchemaRegistryPlugin(ISchemaRegistry):
     """
     Plugin for Confluent Schema Registry.
@@ -35,6 +189,24 @@ class ConfluentSchemaRegistryPlugin(ISchemaRegistry):
     - Subject-level and global configuration
     """
 
+    __slots__ = (
+        "base_url",
+        "_u_subjects",
+        "_u_schemas",
+        "_u_schema_ids",
+        "_u_config",
+        "_u_compatibility",
+        "session",
+        "timeout",
+        "_auth",
+        "_req_exc",
+        "_max_workers",
+        "_schema_cache",
+        "_latest_cache",
+        "_mode_cache",
+        "_cache_lock"
+    )
+
     def __init__(self, config: RegistryConfig):
         """
         Initialize Confluent SR plugin.
@@ -42,55 +214,52 @@ class ConfluentSchemaRegistryPlugin(ISchemaRegistry):
         Args:
             config: Registry configuration
         """
+        # Deferred so listing or loading other plugins doesn't pay for it
+        import requests
+
         super().__init__(config)
         self.base_url = config.url.rstrip('/')
-
-        # Create session with retry logic
-        self.session = requests.Session()
-
-        # Configure retries
-        retry_strategy = Retry(
-            total=config.max_retries,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-
-        # Configure authentication
+        # Fixed URL prefixes, built once rather than per request
+        self._u_subjects = f"{self.base_url}/subjects"
+        self._u_schemas = f"{self.base_url}/schemas"
+        self._u_schema_ids = f"{self.base_url}/schemas/ids/"
+        self._u_config = f"{self.base_url}/config"
+        self._u_compatibility = f"{self.base_url}/compatibility/subjects"
+        self._req_exc = requests.exceptions
+
+        # Connection pool shared with other instances for the same endpoint
+        # and credentials
+        self.session = _shared_session(config)
+        self._max_workers = min(_MAX_PARALLEL_REQUESTS, config.pool_size or 32)
+
+        # Configure authentication (per request, since the session is shared)
+        self._auth = None
         if config.auth.get("username") and config.auth.get("password"):
-            self.session.auth = (
+            self._auth = _BasicAuth(
                 config.auth["username"],
                 config.auth["password"]
             )
 
-        # Configure headers
-        self.session.headers.update({
-            "Content-Type": "application/vnd.schemaregistry.v1+json"
-        })
+        self.timeout = config.timeout
 
-        # Configure SSL
-        if not config.ssl_config.get("verify", True):
-            self.session.verify = False
-        elif config.ssl_config.get("cert_path"):
-            self.session.verify = config.ssl_config["cert_path"]
+        # Schemas by ID and by (subject, version)
+        self._schema_cache: LRUCache = LRUCache(maxsize=_SCHEMA_CACHE_SIZE)
+        self._latest_cache: TTLCache = TTLCache(
+            maxsize=_LATEST_CACHE_SIZE,
+            ttl=_LATEST_CACHE_TTL
+        )
+        self._mode_cache: TTLCache = TTLCache(maxsize=_MODE_CACHE_SIZE, ttl=_MODE_CACHE_TTL)
+        self._cache_lock = threading.Lock()
 
-        self.timeout = config.timeout
-        logger.info(f"Initialized Confluent SR plugin: {self.base_url}")
+        logger.info("Initialized Confluent SR plugin: %s", self.base_url)
 
     def get_registry_type(self) -> RegistryType:
         """Return registry type."""
-        return RegistryType.CONFLUENT
+        return self.registry_type
 
     def get_supported_formats(self) -> List[SchemaFormat]:
         """Return supported formats."""
-        return [
-            SchemaFormat.AVRO,
-            SchemaFormat.PROTOBUF,
-            SchemaFormat.JSON_SCHEMA
-        ]
+        return list(_FORMAT_TO_CONFLUENT)
 
     # ===== Schema CRUD Operations =====
 
@@ -102,12 +271,12 @@ class ConfluentSchemaRegistryPlugin(ISchemaRegistry):
         metadata: Optional[Dict[str, Any]] = None
     ) -> Schema:
         """Register schema in Confluent SR."""
-        if schema_format not in self.get_supported_formats():
+        if schema_format not in _SUPPORTED_FORMATS:
             raise ValueError(
                 f"Format {schema_format.value} not supported by Confluent SR"
             )
 
-        url = f"{self.base_url}/subjects/{subject}/versions"
+        url = f"{self._u_subjects}/{subject}/versions"
 
         payload = {
             "schema": schema_content,
@@ -115,14 +284,8 @@ class ConfluentSchemaRegistryPlugin(ISchemaRegistry):
         }
 
         try:
-            response = self.session.post(
-                url,
-                json=payload,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-
-            data = response.json()
+            data = self._post_json(url, payload)
+            self.clear_schema_cache(subject)
 
             return Schema(
                 id=data.get("id"),
@@ -134,19 +297,26 @@ class ConfluentSchemaRegistryPlugin(ISchemaRegistry):
                 registry_type=self.get_registry_type()
             )
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to register schema: {e}")
+        except self._req_exc.RequestException as e:
+            logger.error("Failed to register schema: %s", e)
             raise
 
     def get_schema_by_id(self, schema_id: int) -> Schema:
         """Get schema by global ID."""
-        url = f"{self.base_url}/schemas/ids/{schema_id}"
+        with self._cache_lock:
+            schema = self._schema_cache.get(schema_id)
+        if schema is None:
+            schema = self._fetch_schema_by_id(schema_id)
+            with self._cache_lock:
+                self._schema_cache[schema_id] = schema
+        return schema
+
+    def _fetch_schema_by_id(self, schema_id: int) -> Schema:
+        """Fetch a schema by global ID, bypassing the cache."""
+        url = self._u_schema_ids + str(schema_id)
 
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-
-            data = response.json()
+            data = self._get_json(url)
 
             return Schema(
                 id=schema_id,
@@ -160,7 +330,7 @@ class ConfluentSchemaRegistryPlugin(ISchemaRegistry):
                 registry_type=self.get_registry_type()
             )
 
-        except requests.exceptions.HTTPError as e:
+        except self._req_exc.HTTPError as e:
             if e.response.status_code == 404:
                 raise KeyError(f"Schema ID {schema_id} not found")
             raise
@@ -171,13 +341,27 @@ class ConfluentSchemaRegistryPlugin(ISchemaRegistry):
         version: int
     ) -> Schema:
         """Get specific version of a schema."""
-        url = f"{self.base_url}/subjects/{subject}/versions/{version}"
+        cache = self._latest_cache if version == "latest" else self._schema_cache
+        key = (subject, version)
+
+        with self._cache_lock:
+            schema = cache.get(key)
+        if schema is None:
+            schema = self._fetch_schema_by_subject_version(subject, version)
+            with self._cache_lock:
+                cache[key] = schema
+        return schema
+
+    def _fetch_schema_by_subject_version(
+        self,
+        subject: str,
+        version: int
+    ) -> Schema:
+        """Fetch a specific version of a schema, bypassing the cache."""
+        url = f"{self._u_subjects}/{subject}/versions/{version}"
 
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-
-            data = response.json()
+            data = self._get_json(url)
 
             return Schema(
                 id=data.get("id"),
@@ -191,67 +375,143 @@ class ConfluentSchemaRegistryPlugin(ISchemaRegistry):
                 registry_type=self.get_registry_type()
             )
 
-        except requests.exceptions.HTTPError as e:
+        except self._req_exc.HTTPError as e:
             if e.response.status_code == 404:
                 raise KeyError(f"Subject {subject} version {version} not found")
             raise
 
     def get_latest_schema(self, subject: str) -> Schema:
-        """Get the latest version of a schema."""
-        return self.get_schema_by_subject_version(subject, "latest")
+        """
+        Get the latest version of a schema.
+
+        Resolves the latest version number through the small
+        GET /subjects/{subject}/versions listing and then fetches that
+        numbered version, which is served from the schema cache when it
+        hasn't changed since the last call.
+        """
+        key = (subject, "latest")
+
+        with self._cache_lock:
+            schema = self._latest_cache.get(key)
+        if schema is None:
+            versions = self.list_versions(subject)
+            if not versions:
+                raise KeyError(f"Subject {subject} not found")
+
+            schema = self.get_schema_by_subject_version(subject, max(versions))
+            with self._cache_lock:
+                self._latest_cache[key] = schema
+        return schema
 
     def list_subjects(
         self,
-        prefix: Optional[str] = None
+        prefix: Optional[str] = None,
+        pattern: Optional[str] = None
     ) -> List[str]:
         """List all subjects."""
-        url = f"{self.base_url}/subjects"
-
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
+            return list(self.iter_subjects(prefix=prefix, pattern=pattern))
 
-            subjects = response.json()
-
-            if prefix:
-                subjects = [s for s in subjects if s.startswith(prefix)]
+        except self._req_exc.RequestException as e:
+            logger.error("Failed to list subjects: %s", e)
+            raise
 
-            return subjects
+    def iter_subjects(
+        self,
+        prefix: Optional[str] = None,
+        pattern: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream subjects as the listing response is parsed.
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to list subjects: {e}")
-            raise
+        Only matching subjects are materialized, so peak memory stays flat
+        on registries with very large listings.
+        """
+        url = self._u_subjects
+        params = {"subjectPrefix": prefix} if prefix else None
+        regex = re.compile(pattern) if pattern else None
+
+        response = self.session.get(
+            url,
+            params=params,
+            stream=True,
+            auth=self._auth,
+            timeout=self.timeout
+        )
+        try:
+            response.raise_for_status()
+            response.raw.decode_content = True
+
+            for subject in ijson.items(response.raw, "item"):
+                # Registries without subjectPrefix support return every subject
+                if prefix and not subject.startswith(prefix):
+                    continue
+                if regex and not regex.search(subject):
+                    continue
+                yield subject
+        finally:
+            response.close()
 
     def list_versions(self, subject: str) -> List[int]:
         """List all versions for a subject."""
-        url = f"{self.base_url}/subjects/{subject}/versions"
+        url = f"{self._u_subjects}/{subject}/versions"
 
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-
-            return response.json()
+            return self._get_json(url)
 
-        except requests.exceptions.HTTPError as e:
+        except self._req_exc.HTTPError as e:
             if e.response.status_code == 404:
                 raise KeyError(f"Subject {subject} not found")
             raise
 
+    def get_all_versions(self, subject: str) -> List[Schema]:
+        """
+        Get every version of a schema from one paged listing.
+
+        Uses GET /schemas?subjectPrefix=..., falling back to per-version
+        requests on registries that predate that endpoint. The prefix also
+        matches longer subject names, so every page is read before the
+        subject's versions are picked out.
+        """
+        params = {"subjectPrefix": subject, "latestOnly": "false"}
+
+        try:
+            entries = self._get_schema_pages(params)
+
+        except self._req_exc.HTTPError as e:
+            if e.response.status_code == 404:
+                return super().get_all_versions(subject)
+            raise
+
+        schemas = [
+            self._schema_from_response(data)
+            # subjectPrefix also matches longer subject names
+            for data in entries
+            if data.get("subject") == subject
+        ]
+
+        if not schemas:
+            raise KeyError(f"Subject {subject} not found")
+
+        schemas.sort(key=lambda schema: schema.version)
+        return schemas
+
     def delete_schema_version(
         self,
         subject: str,
         version: int
     ) -> bool:
         """Delete a specific schema version."""
-        url = f"{self.base_url}/subjects/{subject}/versions/{version}"
+        url = f"{self._u_subjects}/{subject}/versions/{version}"
 
         try:
-            response = self.session.delete(url, timeout=self.timeout)
+            response = self.session.delete(url, auth=self._auth, timeout=self.timeout)
             response.raise_for_status()
+            self.clear_schema_cache(subject)
 
             return True
 
-        except requests.exceptions.HTTPError as e:
+        except self._req_exc.HTTPError as e:
             if e.response.status_code == 404:
                 raise KeyError(f"Subject {subject} version {version} not found")
             raise
@@ -267,7 +527,7 @@ class ConfluentSchemaRegistryPlugin(ISchemaRegistry):
     ) -> CompatibilityResult:
         """Check compatibility with Confluent SR."""
         version_path = f"/{version}" if version else "/latest"
-        url = f"{self.base_url}/compatibility/subjects/{subject}/versions{version_path}"
+        url = f"{self._u_compatibility}/{subject}/versions{version_path}"
 
         payload = {
             "schema": schema_content,
@@ -275,24 +535,17 @@ class ConfluentSchemaRegistryPlugin(ISchemaRegistry):
         }
 
         try:
-            response = self.session.post(
-                url,
-                json=payload,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-
-            data = response.json()
+            data = self._post_json(url, payload)
 
             return CompatibilityResult(
                 is_compatible=data.get("is_compatible", False),
                 messages=data.get("messages", []),
-                compatibility_level=self.get_compatibility_mode(subject),
+                compatibility_level=self._cached_get_compatibility_mode(subject),
                 errors=[]
             )
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Compatibility check failed: {e}")
+        except self._req_exc.RequestException as e:
+            logger.error("Compatibility check failed: %s", e)
             return CompatibilityResult(
                 is_compatible=False,
                 messages=[],
@@ -305,26 +558,44 @@ class ConfluentSchemaRegistryPlugin(ISchemaRegistry):
         subject: Optional[str] = None
     ) -> CompatibilityMode:
         """Get compatibility mode."""
+        mode = self._fetch_compatibility_mode(subject)
+        if mode is None:
+            # Subject has no custom config, return global
+            return self.get_compatibility_mode()
+        return mode
+
+    def _cached_get_compatibility_mode(
+        self,
+        subject: Optional[str] = None
+    ) -> CompatibilityMode:
+        """Get compatibility mode, reusing a recent lookup when available."""
+        with self._cache_lock:
+            mode = self._mode_cache.get(subject)
+        if mode is None:
+            mode = self.get_compatibility_mode(subject)
+            with self._cache_lock:
+                self._mode_cache[subject] = mode
+        return mode
+
+    def _fetch_compatibility_mode(
+        self,
+        subject: Optional[str] = None
+    ) -> Optional[CompatibilityMode]:
+        """Get a compatibility mode, or None if the subject has no override."""
         if subject:
-            url = f"{self.base_url}/config/{subject}"
+            url = f"{self._u_config}/{subject}"
         else:
-            url = f"{self.base_url}/config"
+            url = self._u_config
 
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-
-            data = response.json()
+            data = self._get_json(url)
             mode_str = data.get("compatibilityLevel", "BACKWARD")
 
             return CompatibilityMode[mode_str]
 
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                # Subject has no custom config, return global
-                if subject:
-                    return self.get_compatibility_mode()
-                raise
+        except self._req_exc.HTTPError as e:
+            if e.response.status_code == 404 and subject:
+                return None
             raise
 
     def set_compatibility_mode(
@@ -334,45 +605,52 @@ class ConfluentSchemaRegistryPlugin(ISchemaRegistry):
     ) -> bool:
         """Set compatibility mode."""
         if subject:
-            url = f"{self.base_url}/config/{subject}"
+            url = f"{self._u_config}/{subject}"
         else:
-            url = f"{self.base_url}/config"
+            url = self._u_config
 
         payload = {"compatibility": mode.value}
 
         try:
-            response = self.session.put(
-                url,
-                json=payload,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
+            self._put_json(url, payload)
+
+            # Subjects without an override follow the global mode
+            with self._cache_lock:
+                if subject:
+                    self._mode_cache.pop(subject, None)
+                else:
+                    self._mode_cache.clear()
 
             return True
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to set compatibility mode: {e}")
+        except self._req_exc.RequestException as e:
+            logger.error("Failed to set compatibility mode: %s", e)
             return False
 
     def get_all_compatibility_modes(self) -> Dict[str, CompatibilityMode]:
         """Get subject-specific compatibility overrides."""
-        modes = {}
+        def fetch_mode(subject: str) -> Tuple[str, Optional[CompatibilityMode]]:
+            try:
+                # Subjects without an override inherit the global mode,
+                # which is fetched once up front rather than per subject
+                return subject, self._fetch_compatibility_mode(subject) or global_mode
+            except Exception:
+                # Skip subjects whose config can't be read
+                return subject, None
 
         try:
-            subjects = self.list_subjects()
+            global_mode = self.get_compatibility_mode()
 
-            for subject in subjects:
-                try:
-                    mode = self.get_compatibility_mode(subject)
-                    modes[subject] = mode
-                except:
-                    # Skip subjects with no custom config
-                    pass
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                results = executor.map(fetch_mode, self.iter_subjects())
 
-            return modes
+                return {
+                    subject: mode for subject, mode in results
+                    if mode is not None
+                }
 
         except Exception as e:
-            logger.error(f"Failed to get all compatibility modes: {e}")
+            logger.error("Failed to get all compatibility modes: %s", e)
             return {}
 
     # ===== Schema Discovery =====
@@ -382,34 +660,77 @@ class ConfluentSchemaRegistryPlugin(ISchemaRegistry):
         namespace: Optional[str] = None,
         filters: Optional[Dict[str, Any]] = None
     ) -> List[Schema]:
-        """Discover all schemas."""
-        schemas = []
+        """
+        Discover all schemas.
 
+        Uses GET /schemas?latestOnly=true, paged, falling back to one
+        request per subject on registries that predate that endpoint.
+        """
         try:
-            subjects = self.list_subjects(prefix=namespace)
-
-            for subject in subjects:
-                try:
-                    schema = self.get_latest_schema(subject)
-                    schemas.append(schema)
-                except Exception as e:
-                    logger.warning(f"Failed to get schema for {subject}: {e}")
+            schemas = self._bulk_fetch_latest(namespace)
+        except Exception as e:
+            logger.error("Schema discovery failed: %s", e)
+            return []
 
+        if schemas is not None:
             return schemas
 
+        def fetch_latest(subject: str) -> Optional[Schema]:
+            try:
+                return self.get_latest_schema(subject)
+            except Exception as e:
+                logger.warning("Failed to get schema for %s: %s", subject, e)
+                return None
+
+        try:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                fetched = executor.map(
+                    fetch_latest,
+                    self.iter_subjects(prefix=namespace)
+                )
+
+                return [schema for schema in fetched if schema is not None]
+
         except Exception as e:
-            logger.error(f"Schema discovery failed: {e}")
+            logger.error("Schema discovery failed: %s", e)
             return []
 
+    def _bulk_fetch_latest(self, prefix: Optional[str] = None) -> Optional[List[Schema]]:
+        """
+        Fetch the latest version of every subject from GET /schemas.
+
+        Args:
+            prefix: Optional subject prefix filter
+
+        Returns:
+            List of latest schemas, or None if the registry doesn't
+            support GET /schemas
+        """
+        params = {"latestOnly": "true", "subjectPrefix": prefix or ""}
+
+        try:
+            entries = self._get_schema_pages(params)
+
+        except self._req_exc.HTTPError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+        return [
+            self._schema_from_response(data)
+            for data in entries
+            if not prefix or data.get("subject", "").startswith(prefix)
+        ]
+
     # ===== Health & Status =====
 
     def health_check(self) -> HealthStatus:
         """Check health of Confluent SR."""
-        url = f"{self.base_url}/subjects"
+        url = self._u_subjects
 
         start_time = time.time()
         try:
-            response = self.session.get(url, timeout=self.timeout)
+            response = self.session.get(url, auth=self._auth, timeout=self.timeout)
             response_time = (time.time() - start_time) * 1000
 
             response.raise_for_status()
@@ -425,7 +746,7 @@ class ConfluentSchemaRegistryPlugin(ISchemaRegistry):
                 }
             )
 
-        except requests.exceptions.RequestException as e:
+        except self._req_exc.RequestException as e:
             response_time = (time.time() - start_time) * 1000
 
             return HealthStatus(
@@ -460,22 +781,103 @@ class ConfluentSchemaRegistryPlugin(ISchemaRegistry):
         logger.warning("Confluent SR doesn't support metadata updates natively")
         return False
 
+    # ===== Cache Management =====
+
+    def clear_schema_cache(self, subject: Optional[str] = None):
+        """
+        Drop cached schemas.
+
+        Args:
+            subject: Only drop entries for this subject (all if None)
+        """
+        with self._cache_lock:
+            if subject is None:
+                self._schema_cache.clear()
+                self._latest_cache.clear()
+                return
+
+            for cache in (self._schema_cache, self._latest_cache):
+                for key in [k for k in cache if isinstance(k, tuple) and k[0] == subject]:
+                    del cache[key]
+
     # ===== Helper Methods =====
 
-    def _map_format_to_confluent(self, format: SchemaFormat) -> str:
+    def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET a URL and decode the JSON response."""
+        response = self.session.get(
+            url,
+            params=params,
+            auth=self._auth,
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def _get_schema_pages(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        GET /schemas page by page until a short page ends the listing.
+
+        Args:
+            params: Query parameters other than offset and limit
+
+        Returns:
+            Entries of every page, in order
+        """
+        entries: List[Dict[str, Any]] = []
+
+        while True:
+            page = self._get_json(
+                self._u_schemas,
+                params={**params, "offset": len(entries), "limit": _SCHEMAS_PAGE_SIZE}
+            )
+            entries.extend(page)
+
+            # A short page is the last one; a longer one comes from a registry
+            # that ignores offset/limit and returned everything at once
+            if len(page) != _SCHEMAS_PAGE_SIZE:
+                return entries
+
+    def _post_json(self, url: str, payload: Dict[str, Any]) -> Any:
+        """POST a JSON payload and decode the JSON response."""
+        response = self.session.post(
+            url,
+            data=orjson.dumps(payload),
+            auth=self._auth,
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def _put_json(self, url: str, payload: Dict[str, Any]) -> None:
+        """PUT a JSON payload."""
+        response = self.session.put(
+            url,
+            data=orjson.dumps(payload),
+            auth=self._auth,
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+
+    def _schema_from_response(self, data: Dict[str, Any]) -> Schema:
+        """Build a Schema from an entry of a GET /schemas response."""
+        return Schema(
+            id=data.get("id"),
+            subject=data["subject"],
+            version=data["version"],
+            schema_format=self._map_confluent_to_format(
+                data.get("schemaType", "AVRO")
+            ),
+            schema_content=data["schema"],
+            metadata={},
+            registry_type=self.get_registry_type()
+        )
+
+    @staticmethod
+    def _map_format_to_confluent(format: SchemaFormat) -> str:
         """Map SchemaFormat to Confluent schema type."""
-        mapping = {
-            SchemaFormat.AVRO: "AVRO",
-            SchemaFormat.PROTOBUF: "PROTOBUF",
-            SchemaFormat.JSON_SCHEMA: "JSON"
-        }
-        return mapping.get(format, "AVRO")
+        return _FORMAT_TO_CONFLUENT.get(format, "AVRO")
 
-    def _map_confluent_to_format(self, confluent_type: str) -> SchemaFormat:
+    @staticmethod
+    def _map_confluent_to_format(confluent_type: str) -> SchemaFormat:
         """Map Confluent schema type to SchemaFormat."""
-        mapping = {
-            "AVRO": SchemaFormat.AVRO,
-            "PROTOBUF": SchemaFormat.PROTOBUF,
-            "JSON": SchemaFormat.JSON_SCHEMA
-        }
-        return mapping.get(confluent_type, SchemaFormat.AVRO)
+        return _CONFLUENT_TO_FORMAT.get(confluent_type, SchemaFormat.AVRO)
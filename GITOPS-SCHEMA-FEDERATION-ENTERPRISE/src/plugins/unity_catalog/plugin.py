@@ -2,16 +2,27 @@
 Unity Catalog (Databricks) plugin implementation.
 """
 
-import json
+import asyncio
+import importlib.util
 import logging
+import re
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import ijson  # type: ignore[import-untyped]
+import msgspec
+import orjson
 import requests
+from cachetools import TTLCache
 from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 
+from ...core.canonical import canonicalize
 from ...core.interfaces import ISchemaRegistry
+from ...core.plugin_registry import register_plugin_for
 from ...core.models import (
     CompatibilityMode,
     CompatibilityResult,
@@ -19,13 +30,105 @@ from ...core.models import (
     RegistryConfig,
     RegistryType,
     Schema,
-    SchemaFormat
+    SchemaFormat,
+    schema_hash
 )
 
 
 logger = logging.getLogger(__name__)
 
-
+# Concurrent per-table requests in discovery, capped by the HTTP pool size
+_MAX_PARALLEL_REQUESTS = 16
+
+# Table schemas and listings are cached briefly, since tables can be
+# altered outside this plugin; override the TTL with metadata "cache_ttl"
+_SCHEMA_CACHE_SIZE = 2048
+_SUBJECTS_CACHE_SIZE = 16
+_DEFAULT_CACHE_TTL = 30
+
+# Iceberg primitive type -> (UC type text, UC type name)
+_ICEBERG_TO_UC: Dict[str, Tuple[str, str]] = {
+    "boolean": ("BOOLEAN", "BOOLEAN"),
+    "int": ("INT", "INT"),
+    "long": ("BIGINT", "LONG"),
+    "float": ("FLOAT", "FLOAT"),
+    "double": ("DOUBLE", "DOUBLE"),
+    "string": ("STRING", "STRING"),
+    "binary": ("BINARY", "BINARY"),
+    "date": ("DATE", "DATE"),
+    "timestamp": ("TIMESTAMP", "TIMESTAMP")
+}
+
+# Iceberg complex type -> (UC type text, UC type name)
+_ICEBERG_COMPLEX_TO_UC: Dict[str, Tuple[str, str]] = {
+    "struct": ("STRUCT", "STRUCT"),
+    "list": ("ARRAY", "ARRAY"),
+    "map": ("MAP", "MAP")
+}
+
+# Fallback for types without a UC equivalent
+_UC_STRING = ("STRING", "STRING")
+
+# UC type name -> Iceberg type
+_UC_TO_ICEBERG: Dict[str, str] = {
+    "BOOLEAN": "boolean",
+    "INT": "int",
+    "LONG": "long",
+    "BIGINT": "long",
+    "FLOAT": "float",
+    "DOUBLE": "double",
+    "STRING": "string",
+    "BINARY": "binary",
+    "DATE": "date",
+    "TIMESTAMP": "timestamp"
+}
+
+# Type changes Iceberg allows without rewriting data
+_SAFE_PROMOTIONS = frozenset({
+    ("int", "long"),
+    ("float", "double"),
+    ("date", "timestamp")
+})
+
+
+class IcebergField(msgspec.Struct):
+    """A top-level field of an Iceberg schema, as read by compatibility checks."""
+
+    id: int
+    name: str
+    type: Any
+    required: bool = False
+    doc: str = ""
+
+
+class IcebergSchema(msgspec.Struct):
+    """An Iceberg struct schema; keys other than fields are ignored."""
+
+    fields: List[IcebergField] = []
+
+
+# Decodes schema JSON straight into the structs, without intermediate dicts
+_ICEBERG_DECODER = msgspec.json.Decoder(IcebergSchema)
+
+
+# Tables requested per page when listing
+_LIST_PAGE_SIZE = 1000
+
+# Parser prefixes of the table fields that make up a subject
+_TABLE_ITEM = "tables.item"
+_TABLE_NAME_FIELDS = {
+    "tables.item.catalog_name": "catalog_name",
+    "tables.item.schema_name": "schema_name",
+    "tables.item.name": "name"
+}
+
+_TABLES_PATH = "/api/2.1/unity-catalog/tables"
+
+# Subjects are "catalog.schema.table"; the table part may contain dots
+_SUBJECT_RE = re.compile(r"^([^.]+)\.([^.]+)\.(.+)$")
+
+
+@register_plugin_for(RegistryType.UNITY_CATALOG)
 class UnityCatalogPlugin(ISchemaRegistry):
     """
     Plugin for Databricks Unity Catalog.
@@ -45,6 +148,7 @@ class UnityCatalogPlugin(ISchemaRegistry):
         """
         super().__init__(config)
         self.base_url = config.url.rstrip('/')
+        self._tables_url = self.base_url + _TABLES_PATH
         self.catalog = config.metadata.get("catalog", "main")
 
         # Create session with retry logic
@@ -56,7 +160,16 @@ class UnityCatalogPlugin(ISchemaRegistry):
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Pooled keep-alive connections are reused across calls, including
+        # the concurrent requests made by discover_schemas
+        pool_size = config.pool_size or 32
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            pool_block=False
+        )
+        self._max_workers = min(_MAX_PARALLEL_REQUESTS, pool_size)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -66,17 +179,34 @@ class UnityCatalogPlugin(ISchemaRegistry):
                 "Authorization": f"Bearer {config.auth['token']}"
             })
 
-        # Configure headers
+        # Configure headers; ACCEPT_ENCODING lists every content encoding
+        # the installed urllib3 can decode (zstd/br when their extras are
+        # installed), so large listings come back compressed
         self.session.headers.update({
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "Connection": "keep-alive"
         })
 
         self.timeout = config.timeout
-        logger.info(f"Initialized Unity Catalog plugin: {self.base_url}")
+
+        # Batched reads go through an async HTTP/2 client when enabled
+        self._async_http = bool(config.metadata.get("async_http", False))
+
+        # Table schemas (with their Iceberg dicts) by (subject, version), listings
+        # by (catalog, prefix) and the last compatibility result per subject with
+        # its content hash
+        cache_ttl = config.metadata.get("cache_ttl", _DEFAULT_CACHE_TTL)
+        self._schema_cache: TTLCache = TTLCache(maxsize=_SCHEMA_CACHE_SIZE, ttl=cache_ttl)
+        self._subjects_cache: TTLCache = TTLCache(maxsize=_SUBJECTS_CACHE_SIZE, ttl=cache_ttl)
+        self._compat_cache: TTLCache = TTLCache(maxsize=_SCHEMA_CACHE_SIZE, ttl=cache_ttl)
+        self._cache_lock = threading.Lock()
+
+        logger.info("Initialized Unity Catalog plugin: %s", self.base_url)
 
     def get_registry_type(self) -> RegistryType:
         """Return registry type."""
-        return RegistryType.UNITY_CATALOG
+        return self.registry_type
 
     def get_supported_formats(self) -> List[SchemaFormat]:
         """Return supported formats."""
@@ -123,11 +253,11 @@ class UnityCatalogPlugin(ISchemaRegistry):
             raise ValueError(f"Unsupported format: {schema_format}")
 
         # Parse Iceberg schema
-        schema_json = json.loads(schema_content)
+        schema_json = orjson.loads(schema_content)
         columns = self._iceberg_to_uc_columns(schema_json)
 
         # Create/update table
-        url = f"{self.base_url}/api/2.1/unity-catalog/tables"
+        url = self._tables_url
 
         payload = {
             "name": table_name,
@@ -142,12 +272,13 @@ class UnityCatalogPlugin(ISchemaRegistry):
         try:
             response = self.session.post(
                 url,
-                json=payload,
+                data=orjson.dumps(payload),
                 timeout=self.timeout
             )
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
+            self.clear_schema_cache(subject)
 
             return Schema(
                 id=None,  # Unity Catalog doesn't use numeric IDs
@@ -167,9 +298,49 @@ class UnityCatalogPlugin(ISchemaRegistry):
             )
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to register schema: {e}")
+            logger.error("Failed to register schema: %s", e)
             raise
 
+    def register_schemas(
+        self,
+        specs: List[Dict[str, Any]]
+    ) -> Dict[str, Union[Schema, Exception]]:
+        """
+        Register several schemas concurrently, e.g. when bootstrapping tables.
+
+        Unity Catalog has no batch create endpoint, so each table is still
+        its own request; they run in parallel over the shared session. A
+        failure is logged and returned without aborting the rest.
+
+        Args:
+            specs: One dict per table with the register_schema arguments:
+                "subject", "schema_content", "schema_format" and optionally
+                "metadata"
+
+        Returns:
+            Dict mapping each subject to its registered Schema, or to the
+            exception raised while registering it
+        """
+        def register(spec: Dict[str, Any]) -> Union[Schema, Exception]:
+            try:
+                return self.register_schema(
+                    spec["subject"],
+                    spec["schema_content"],
+                    spec["schema_format"],
+                    spec.get("metadata")
+                )
+            except Exception as e:
+                logger.warning("Failed to register %s: %s", spec.get("subject"), e)
+                return e
+
+        if not specs:
+            return {}
+
+        workers = min(self._max_workers, len(specs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(register, specs)
+            return {spec["subject"]: result for spec, result in zip(specs, results)}
+
     def get_schema_by_id(self, schema_id: int) -> Schema:
         """
         Get schema by ID.
@@ -193,90 +364,260 @@ class UnityCatalogPlugin(ISchemaRegistry):
         Note: Unity Catalog doesn't version schemas explicitly.
         This returns the current schema.
         """
-        catalog, schema_name, table_name = self._parse_subject(subject)
+        return self._get_schema_raw(subject, version)[0]
 
-        full_name = f"{catalog}.{schema_name}.{table_name}"
-        url = f"{self.base_url}/api/2.1/unity-catalog/tables/{full_name}"
+    def _get_schema_raw(self, subject: str, version: int) -> Tuple[Schema, Dict]:
+        """
+        Get a table schema together with its already-built Iceberg dict.
 
-        try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
+        The dict is shared with the cache and must be treated as read-only.
+        """
+        key = (subject, version)
 
-            data = response.json()
+        with self._cache_lock:
+            entry = self._schema_cache.get(key)
+        if entry is None:
+            entry = self._fetch_schema(subject, version)
+            with self._cache_lock:
+                self._schema_cache[key] = entry
+        return entry
 
-            # Convert UC columns to Iceberg schema
-            schema_content = self._uc_columns_to_iceberg(data.get("columns", []))
+    def _get_latest_schema_raw(self, subject: str) -> Tuple[Schema, Dict]:
+        """Get the latest table schema together with its Iceberg dict."""
+        return self._get_schema_raw(subject, 1)
 
-            return Schema(
-                id=None,
-                subject=subject,
-                version=version,  # Use provided version
-                schema_format=SchemaFormat.ICEBERG,
-                schema_content=json.dumps(schema_content),
-                metadata={
-                    "table_id": data.get("table_id"),
-                    "table_type": data.get("table_type"),
-                    "data_source_format": data.get("data_source_format"),
-                    "storage_location": data.get("storage_location")
-                },
-                registry_type=self.get_registry_type()
-            )
+    def _fetch_schema(self, subject: str, version: int) -> Tuple[Schema, Dict]:
+        """Fetch a table's current schema and Iceberg dict, bypassing the cache."""
+        url = self._table_url(subject)
+
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
                 raise KeyError(f"Table {subject} not found")
             raise
 
+        return self._schema_from_table(subject, version, orjson.loads(response.content))
+
+    def _schema_from_table(
+        self,
+        subject: str,
+        version: int,
+        data: Dict
+    ) -> Tuple[Schema, Dict]:
+        """Build a Schema and its Iceberg dict from a Unity Catalog table response."""
+        # Convert UC columns to Iceberg schema
+        iceberg_schema = self._uc_columns_to_iceberg(data.get("columns", []))
+
+        schema = Schema(
+            id=None,
+            subject=subject,
+            version=version,  # Use provided version
+            schema_format=SchemaFormat.ICEBERG,
+            schema_content=orjson.dumps(iceberg_schema).decode(),
+            metadata={
+                "table_id": data.get("table_id"),
+                "table_type": data.get("table_type"),
+                "data_source_format": data.get("data_source_format"),
+                "storage_location": data.get("storage_location")
+            },
+            registry_type=self.get_registry_type()
+        )
+        return schema, iceberg_schema
+
     def get_latest_schema(self, subject: str) -> Schema:
         """Get the latest version of a table schema."""
-        return self.get_schema_by_subject_version(subject, 1)
+        return self._get_latest_schema_raw(subject)[0]
+
+    def get_latest_schemas(
+        self,
+        subjects: List[str]
+    ) -> Dict[str, Union[Schema, Exception]]:
+        """
+        Get the latest schema of several tables concurrently.
+
+        Args:
+            subjects: Subject names in format "catalog.schema.table"
+
+        Returns:
+            Dict mapping each subject to its Schema, or to the exception
+            raised while fetching it
+        """
+        def fetch_latest(subject: str) -> Union[Schema, Exception]:
+            try:
+                return self.get_latest_schema(subject)
+            except Exception as e:
+                return e
+
+        if not subjects:
+            return {}
+
+        if self._async_http:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # No event loop in this thread, so the batch can run on its own
+                return asyncio.run(self._aget_latest_schemas(subjects))
+
+        workers = min(self._max_workers, len(subjects))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(subjects, executor.map(fetch_latest, subjects)))
+
+    async def _aget_latest_schemas(
+        self,
+        subjects: List[str]
+    ) -> Dict[str, Union[Schema, Exception]]:
+        """Fetch the latest schema of several tables over one async client."""
+        async with self._new_async_client() as client:
+            results = await asyncio.gather(
+                *(self._aget_latest_schema(client, subject) for subject in subjects),
+                return_exceptions=True
+            )
+
+        batch: Dict[str, Union[Schema, Exception]] = {}
+        for subject, result in zip(subjects, results):
+            if isinstance(result, (Schema, Exception)):
+                batch[subject] = result
+            else:
+                # Cancellation and interpreter exits are not per-subject failures
+                raise result
+        return batch
+
+    async def _aget_latest_schema(self, client: Any, subject: str) -> Schema:
+        """Async counterpart of get_latest_schema, sharing its cache."""
+        key = (subject, 1)
+
+        with self._cache_lock:
+            entry = self._schema_cache.get(key)
+        if entry is not None:
+            return entry[0]
+
+        response = await client.get(self._table_url(subject))
+        if response.status_code == 404:
+            raise KeyError(f"Table {subject} not found")
+        response.raise_for_status()
+
+        entry = self._schema_from_table(subject, 1, orjson.loads(response.content))
+        with self._cache_lock:
+            self._schema_cache[key] = entry
+        return entry[0]
+
+    def _new_async_client(self) -> Any:
+        """
+        Build an httpx client for one batch of concurrent reads.
+
+        Over HTTP/2 the whole batch is multiplexed on a single connection;
+        without the h2 package installed the client falls back to pooled
+        HTTP/1.1 connections.
+        """
+        import httpx
+
+        http2 = importlib.util.find_spec("h2") is not None
+
+        # Leave Accept-Encoding to httpx, which decodes a different set of
+        # encodings than urllib3
+        headers = {"Content-Type": "application/json"}
+        if self.config.auth.get("token"):
+            headers["Authorization"] = f"Bearer {self.config.auth['token']}"
+
+        # httpx ignores client limits when a transport is given, so they go
+        # on the transport
+        return httpx.AsyncClient(
+            headers=headers,
+            timeout=self.timeout,
+            transport=httpx.AsyncHTTPTransport(
+                http2=http2,
+                retries=self.config.max_retries,
+                limits=httpx.Limits(max_connections=self.config.pool_size or 32)
+            )
+        )
 
     def list_subjects(
         self,
-        prefix: Optional[str] = None
+        prefix: Optional[str] = None,
+        pattern: Optional[str] = None
     ) -> List[str]:
         """
         List all tables as subjects.
 
         Args:
             prefix: Optional prefix filter (e.g., "catalog.schema.")
+            pattern: Optional regular expression matched against subjects
 
         Returns:
             List of subject names in format "catalog.schema.table"
         """
-        subjects = []
-
-        try:
-            # List all tables in the catalog
-            # Note: This is simplified - in production, you'd iterate through
-            # catalogs -> schemas -> tables
+        key = (self.catalog, prefix)
+
+        with self._cache_lock:
+            subjects = self._subjects_cache.get(key)
+        if subjects is None:
+            try:
+                subjects = self._fetch_subjects(prefix)
+            except requests.exceptions.RequestException as e:
+                logger.error("Failed to list subjects: %s", e)
+                return []
+            with self._cache_lock:
+                self._subjects_cache[key] = subjects
+
+        if pattern:
+            regex = re.compile(pattern)
+            return [s for s in subjects if regex.search(s)]
+        return list(subjects)
+
+    def _fetch_subjects(self, prefix: Optional[str] = None) -> Tuple[str, ...]:
+        """List tables in the catalog as subjects, bypassing the cache."""
+        # List all tables in the catalog
+        # Note: This is simplified - in production, you'd iterate through
+        # catalogs -> schemas -> tables
+
+        url = self._tables_url
+        params = {"catalog_name": self.catalog, "max_results": _LIST_PAGE_SIZE}
+
+        # A prefix that spells out "catalog.schema." names a whole schema,
+        # which the API can filter on directly
+        if prefix and prefix.count(".") >= 2:
+            catalog, schema_name, _ = prefix.split(".", 2)
+            if catalog != self.catalog:
+                return ()
+            params["schema_name"] = schema_name
 
-            url = f"{self.base_url}/api/2.1/unity-catalog/tables"
-            params = {"catalog_name": self.catalog}
+        subjects = []
 
-            response = self.session.get(
+        while True:
+            with self.session.get(
                 url,
                 params=params,
+                stream=True,
                 timeout=self.timeout
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            tables = data.get("tables", [])
-
-            for table in tables:
-                subject = f"{table['catalog_name']}.{table['schema_name']}.{table['name']}"
-
-                if prefix and not subject.startswith(prefix):
-                    continue
-
-                subjects.append(subject)
-
-            return subjects
-
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to list subjects: {e}")
-            return []
+            ) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                page_token = None
+                table: Dict[str, Any] = {}
+
+                # Parse the listing incrementally, keeping only the name
+                # fields of the current table rather than every column
+                for event_prefix, event, value in ijson.parse(response.raw):
+                    field = _TABLE_NAME_FIELDS.get(event_prefix)
+                    if field is not None:
+                        table[field] = value
+                    elif event_prefix == _TABLE_ITEM:
+                        if event == "start_map":
+                            table = {}
+                        elif event == "end_map":
+                            subject = f"{table['catalog_name']}.{table['schema_name']}.{table['name']}"
+
+                            if not prefix or subject.startswith(prefix):
+                                subjects.append(subject)
+                    elif event_prefix == "next_page_token":
+                        page_token = value
+
+            if not page_token:
+                return tuple(subjects)
+            params["page_token"] = page_token
 
     def list_versions(self, subject: str) -> List[int]:
         """
@@ -301,14 +642,12 @@ class UnityCatalogPlugin(ISchemaRegistry):
 
         Note: This deletes the entire table, not just a schema version.
         """
-        catalog, schema_name, table_name = self._parse_subject(subject)
-
-        full_name = f"{catalog}.{schema_name}.{table_name}"
-        url = f"{self.base_url}/api/2.1/unity-catalog/tables/{full_name}"
+        url = self._table_url(subject)
 
         try:
             response = self.session.delete(url, timeout=self.timeout)
             response.raise_for_status()
+            self.clear_schema_cache(subject)
 
             return True
 
@@ -335,26 +674,44 @@ class UnityCatalogPlugin(ISchemaRegistry):
         - Can rename fields (with aliases)
         - Cannot change field types incompatibly
         """
-        try:
-            # Get current schema
-            current_schema = self.get_latest_schema(subject)
-
-            # Parse new schema
-            new_schema_json = json.loads(schema_content)
-            current_schema_json = json.loads(current_schema.schema_content)
+        # Reconcile loops re-check unchanged schemas; reuse the last result
+        # for identical content until the table changes. Schema.content_hash
+        # is taken over the canonical form, so hash the same form here
+        content_hash = schema_hash(canonicalize(schema_content))
+        with self._cache_lock:
+            cached = self._compat_cache.get(subject)
+        if cached is not None and cached[0] == content_hash:
+            return cached[1]
 
-            # Check Iceberg evolution rules
-            is_compatible, messages = self._check_iceberg_evolution(
-                current_schema_json,
-                new_schema_json
-            )
+        try:
+            # Get current schema, with the Iceberg dict it was built from
+            current_schema, current_dict = self._get_latest_schema_raw(subject)
+
+            if current_schema.content_hash == content_hash:
+                # Identical content needs no parsing
+                is_compatible, messages = True, ["Schema evolution is compatible"]
+            else:
+                # Parse the new schema; the current one is converted from its
+                # dict rather than re-parsed from schema_content
+                new_iceberg = _ICEBERG_DECODER.decode(schema_content)
+                current_iceberg = msgspec.convert(current_dict, IcebergSchema)
+
+                # Check Iceberg evolution rules
+                is_compatible, messages = self._check_iceberg_evolution(
+                    current_iceberg,
+                    new_iceberg
+                )
 
-            return CompatibilityResult(
+            result = CompatibilityResult(
                 is_compatible=is_compatible,
                 messages=messages,
                 compatibility_level=CompatibilityMode.BACKWARD,  # Default for Unity Catalog
                 errors=[] if is_compatible else messages
             )
+            with self._cache_lock:
+                self._compat_cache[subject] = (content_hash, result)
+
+            return result
 
         except KeyError:
             # Table doesn't exist yet - any schema is compatible
@@ -365,7 +722,7 @@ class UnityCatalogPlugin(ISchemaRegistry):
                 errors=[]
             )
         except Exception as e:
-            logger.error(f"Compatibility check failed: {e}")
+            logger.error("Compatibility check failed: %s", e)
             return CompatibilityResult(
                 is_compatible=False,
                 messages=[],
@@ -424,24 +781,21 @@ class UnityCatalogPlugin(ISchemaRegistry):
         filters: Optional[Dict[str, Any]] = None
     ) -> List[Schema]:
         """Discover all table schemas."""
-        schemas = []
-
         try:
             subjects = self.list_subjects(prefix=namespace)
-
-            for subject in subjects:
-                try:
-                    schema = self.get_latest_schema(subject)
-                    schemas.append(schema)
-                except Exception as e:
-                    logger.warning(f"Failed to get schema for {subject}: {e}")
-
-            return schemas
-
+            results = self.get_latest_schemas(subjects)
         except Exception as e:
-            logger.error(f"Schema discovery failed: {e}")
+            logger.error("Schema discovery failed: %s", e)
             return []
 
+        schemas = []
+        for subject, result in results.items():
+            if isinstance(result, Exception):
+                logger.warning("Failed to get schema for %s: %s", subject, result)
+            else:
+                schemas.append(result)
+        return schemas
+
     # ===== Health & Status =====
 
     def health_check(self) -> HealthStatus:
@@ -495,10 +849,7 @@ class UnityCatalogPlugin(ISchemaRegistry):
         metadata: Dict[str, Any]
     ) -> bool:
         """Update table properties."""
-        catalog, schema_name, table_name = self._parse_subject(subject)
-
-        full_name = f"{catalog}.{schema_name}.{table_name}"
-        url = f"{self.base_url}/api/2.1/unity-catalog/tables/{full_name}"
+        url = self._table_url(subject)
 
         payload = {
             "properties": metadata
@@ -507,19 +858,59 @@ class UnityCatalogPlugin(ISchemaRegistry):
         try:
             response = self.session.patch(
                 url,
-                json=payload,
+                data=orjson.dumps(payload),
                 timeout=self.timeout
             )
             response.raise_for_status()
+            self.clear_schema_cache(subject)
 
             return True
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to update metadata: {e}")
+            logger.error("Failed to update metadata: %s", e)
             return False
 
+    # ===== Cache Management =====
+
+    def clear_schema_cache(self, subject: Optional[str] = None):
+        """
+        Drop cached table schemas, compatibility results and listings.
+
+        Args:
+            subject: Only drop this table's entries (all if None); listings
+                are always dropped since the table may have been added or
+                removed
+        """
+        with self._cache_lock:
+            self._subjects_cache.clear()
+
+            if subject is None:
+                self._schema_cache.clear()
+                self._compat_cache.clear()
+                return
+
+            self._compat_cache.pop(subject, None)
+            for key in [k for k in self._schema_cache if k[0] == subject]:
+                del self._schema_cache[key]
+
     # ===== Helper Methods =====
 
+    def _table_url(self, subject: str) -> str:
+        """
+        Build the table endpoint URL for a subject.
+
+        The subject already is the table's full name, so it is validated
+        but not split and re-joined.
+
+        Raises:
+            ValueError: If subject format is invalid
+        """
+        if _SUBJECT_RE.match(subject) is None:
+            raise ValueError(
+                f"Subject must be in format catalog.schema.table, got: {subject}"
+            )
+        return self._tables_url + "/" + subject
+
     def _parse_subject(self, subject: str) -> Tuple[str, str, str]:
         """
         Parse subject into catalog, schema, table.
@@ -533,120 +924,67 @@ class UnityCatalogPlugin(ISchemaRegistry):
         Raises:
             ValueError: If subject format is invalid
         """
-        parts = subject.split(".")
-        if len(parts) != 3:
+        match = _SUBJECT_RE.match(subject)
+        if match is None:
             raise ValueError(
                 f"Subject must be in format catalog.schema.table, got: {subject}"
             )
 
-        return parts[0], parts[1], parts[2]
+        catalog, schema, table = match.groups()
+        return catalog, schema, table
 
     def _iceberg_to_uc_columns(self, iceberg_schema: Dict) -> List[Dict]:
         """Convert Iceberg schema to Unity Catalog column format."""
-        columns = []
-
-        for field in iceberg_schema.get("fields", []):
-            column = {
+        resolve = self._iceberg_type_resolve
+        return [
+            {
                 "name": field["name"],
-                "type_text": self._iceberg_type_to_uc_type(field["type"]),
-                "type_name": self._iceberg_type_to_uc_type_name(field["type"]),
+                "type_text": type_text,
+                "type_name": type_name,
                 "position": field.get("id", 0),
                 "nullable": not field.get("required", False),
                 "comment": field.get("doc", "")
             }
-            columns.append(column)
-
-        return columns
+            for field in iceberg_schema.get("fields", [])
+            for type_text, type_name in (resolve(field["type"]),)
+        ]
 
     def _uc_columns_to_iceberg(self, columns: List[Dict]) -> Dict:
         """Convert Unity Catalog columns to Iceberg schema format."""
-        fields = []
-
-        for idx, column in enumerate(columns):
-            field = {
-                "id": column.get("position", idx + 1),
-                "name": column["name"],
-                "type": self._uc_type_to_iceberg_type(column["type_name"]),
-                "required": not column.get("nullable", True),
-                "doc": column.get("comment", "")
-            }
-            fields.append(field)
-
+        to_iceberg = self._uc_type_to_iceberg_type
         return {
             "type": "struct",
-            "fields": fields
+            "fields": [
+                {
+                    "id": column.get("position", idx + 1),
+                    "name": column["name"],
+                    "type": to_iceberg(column["type_name"]),
+                    "required": not column.get("nullable", True),
+                    "doc": column.get("comment", "")
+                }
+                for idx, column in enumerate(columns)
+            ]
         }
 
-    def _iceberg_type_to_uc_type(self, iceberg_type: Any) -> str:
-        """Convert Iceberg type to UC type string."""
+    def _iceberg_type_resolve(self, iceberg_type: Any) -> Tuple[str, str]:
+        """Convert Iceberg type to UC (type text, type name) in one lookup."""
         if isinstance(iceberg_type, str):
-            mapping = {
-                "boolean": "BOOLEAN",
-                "int": "INT",
-                "long": "BIGINT",
-                "float": "FLOAT",
-                "double": "DOUBLE",
-                "string": "STRING",
-                "binary": "BINARY",
-                "date": "DATE",
-                "timestamp": "TIMESTAMP"
-            }
-            return mapping.get(iceberg_type, "STRING")
+            return _ICEBERG_TO_UC.get(iceberg_type, _UC_STRING)
 
         # Handle complex types (struct, list, map)
         if isinstance(iceberg_type, dict):
-            type_name = iceberg_type.get("type")
-            if type_name == "struct":
-                return "STRUCT"
-            elif type_name == "list":
-                return "ARRAY"
-            elif type_name == "map":
-                return "MAP"
-
-        return "STRING"
-
-    def _iceberg_type_to_uc_type_name(self, iceberg_type: Any) -> str:
-        """Get UC type name enum."""
-        type_str = self._iceberg_type_to_uc_type(iceberg_type)
-
-        mapping = {
-            "BOOLEAN": "BOOLEAN",
-            "INT": "INT",
-            "BIGINT": "LONG",
-            "FLOAT": "FLOAT",
-            "DOUBLE": "DOUBLE",
-            "STRING": "STRING",
-            "BINARY": "BINARY",
-            "DATE": "DATE",
-            "TIMESTAMP": "TIMESTAMP",
-            "STRUCT": "STRUCT",
-            "ARRAY": "ARRAY",
-            "MAP": "MAP"
-        }
+            return _ICEBERG_COMPLEX_TO_UC.get(iceberg_type.get("type", ""), _UC_STRING)
 
-        return mapping.get(type_str, "STRING")
+        return _UC_STRING
 
     def _uc_type_to_iceberg_type(self, uc_type: str) -> str:
         """Convert UC type to Iceberg type."""
-        mapping = {
-            "BOOLEAN": "boolean",
-            "INT": "int",
-            "LONG": "long",
-            "BIGINT": "long",
-            "FLOAT": "float",
-            "DOUBLE": "double",
-            "STRING": "string",
-            "BINARY": "binary",
-            "DATE": "date",
-            "TIMESTAMP": "timestamp"
-        }
-
-        return mapping.get(uc_type.upper(), "string")
+        return _UC_TO_ICEBERG.get(uc_type.upper(), "string")
 
     def _check_iceberg_evolution(
         self,
-        old_schema: Dict,
-        new_schema: Dict
+        old_schema: IcebergSchema,
+        new_schema: IcebergSchema
     ) -> Tuple[bool, List[str]]:
         """
         Check Iceberg schema evolution compatibility.
@@ -664,42 +1002,46 @@ class UnityCatalogPlugin(ISchemaRegistry):
         messages = []
         is_compatible = True
 
-        old_fields = {f["id"]: f for f in old_schema.get("fields", [])}
-        new_fields = {f["id"]: f for f in new_schema.get("fields", [])}
+        old_fields = {f.id: f for f in old_schema.fields}
+        new_fields = {f.id: f for f in new_schema.fields}
 
         # Check for removed required fields (breaks backward compat)
         for field_id, field in old_fields.items():
-            if field_id not in new_fields and field.get("required"):
+            if field_id not in new_fields and field.required:
                 is_compatible = False
                 messages.append(
-                    f"Required field '{field['name']}' (id={field_id}) was removed"
+                    f"Required field '{field.name}' (id={field_id}) was removed"
                 )
 
-        # Check for type changes
+        # Check type and nullability changes in one pass over shared fields;
+        # type messages are still reported ahead of nullability messages
+        nullability_messages = []
         for field_id in old_fields.keys() & new_fields.keys():
-            old_type = old_fields[field_id]["type"]
-            new_type = new_fields[field_id]["type"]
+            old_field = old_fields[field_id]
+            new_field = new_fields[field_id]
+
+            # Check for type changes
+            old_type = old_field.type
+            new_type = new_field.type
 
             if old_type != new_type:
                 # Check if type promotion is safe
                 if not self._is_safe_type_promotion(old_type, new_type):
                     is_compatible = False
                     messages.append(
-                        f"Incompatible type change for field '{old_fields[field_id]['name']}': "
+                        f"Incompatible type change for field '{old_field.name}': "
                         f"{old_type} → {new_type}"
                     )
 
-        # Check for nullability changes (nullable -> required)
-        for field_id in old_fields.keys() & new_fields.keys():
-            old_nullable = not old_fields[field_id].get("required", False)
-            new_nullable = not new_fields[field_id].get("required", False)
-
-            if old_nullable and not new_nullable:
+            # Check for nullability changes (nullable -> required)
+            if not old_field.required and new_field.required:
                 is_compatible = False
-                messages.append(
-                    f"Field '{old_fields[field_id]['name']}' changed from nullable to required"
+                nullability_messages.append(
+                    f"Field '{old_field.name}' changed from nullable to required"
                 )
 
+        messages.extend(nullability_messages)
+
         if is_compatible and not messages:
             messages.append("Schema evolution is compatible")
 
@@ -707,10 +1049,4 @@ class UnityCatalogPlugin(ISchemaRegistry):
 
     def _is_safe_type_promotion(self, old_type: str, new_type: str) -> bool:
         """Check if type promotion is safe."""
-        safe_promotions = {
-            ("int", "long"),
-            ("float", "double"),
-            ("date", "timestamp")
-        }
-
-        return (old_type, new_type) in safe_promotions
+        return (old_type, new_type) in _SAFE_PROMOTIONS
@@ -0,0 +1,120 @@
+"""
+Tests for the REST API.
+"""
+
+from unittest import mock
+
+import orjson
+import pytest
+from cachetools import TTLCache
+from fastapi.testclient import TestClient
+
+from src.api import main
+from src.core import MultiBackendOrchestrator, RegistryType, Schema, SchemaFormat
+from src.core.plugin_registry import PluginRegistry
+
+
+def schema_version(subject, version):
+    """Create an Avro schema version of a subject."""
+    return Schema(
+        subject=subject,
+        version=version,
+        schema_format=SchemaFormat.AVRO,
+        schema_content="{}",
+        registry_type=RegistryType.CONFLUENT
+    )
+
+
+def single_version(subject):
+    """Return a one-version history, which checks as compatible."""
+    return [schema_version(subject, 1)]
+
+
+@pytest.fixture
+def registry():
+    """Create a registry double listing two single-version subjects."""
+    registry = mock.Mock()
+    registry.iter_subjects.side_effect = lambda prefix=None, pattern=None: iter(
+        ["orders-value", "users-value"]
+    )
+    registry.get_all_versions.side_effect = single_version
+    return registry
+
+
+@pytest.fixture
+def client(monkeypatch, registry):
+    """Create a test client backed by an orchestrator over the registry double."""
+    orchestrator = MultiBackendOrchestrator(PluginRegistry())
+    orchestrator.active_registries["test"] = registry
+    monkeypatch.setattr(main, "orchestrator", orchestrator)
+    monkeypatch.setattr(main, "_find_cache", TTLCache(maxsize=16, ttl=10))
+    yield TestClient(main.app)
+    orchestrator.shutdown()
+
+
+def test_stream_bulk_check_compatibility(client):
+    """Test the streaming bulk check returns one NDJSON line per subject."""
+    response = client.post("/api/v1/bulk/check-compatibility/stream", json={
+        "registry_ids": ["test", "missing"],
+        "target_mode": "backward"
+    })
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    entries = [orjson.loads(line) for line in response.text.splitlines()]
+    assert sorted(e["subject"] for e in entries) == ["orders-value", "users-value"]
+    assert all(e["registry_id"] == "test" and e["is_compatible"] for e in entries)
+
+
+def test_stream_bulk_check_rejects_unknown_mode(client):
+    """Test an invalid target mode is rejected before streaming starts."""
+    response = client.post("/api/v1/bulk/check-compatibility/stream", json={
+        "registry_ids": ["test"],
+        "target_mode": "SIDEWAYS"
+    })
+
+    assert response.status_code == 400
+
+
+def test_register_schema_invalidates_find_response(client, registry):
+    """Test a find after registering through the API sees the new version."""
+    registry.get_latest_schema.return_value = schema_version("orders-value", 1)
+    assert client.get("/api/v1/schemas/find", params={"subject": "orders-value"}).json() == {
+        "test": mock.ANY
+    }
+
+    registry.register_schema.return_value = schema_version("orders-value", 2)
+    registry.get_latest_schema.return_value = schema_version("orders-value", 2)
+    response = client.post("/api/v1/registries/test/subjects/orders-value/versions", json={
+        "schema_content": "{}",
+        "schema_format": "avro"
+    })
+    found = client.get("/api/v1/schemas/find", params={"subject": "orders-value"}).json()
+
+    assert response.status_code == 200
+    assert response.json()["version"] == 2
+    assert found["test"]["version"] == 2
+
+
+def test_delete_schema_version_invalidates_find_response(client, registry):
+    """Test a find after deleting through the API goes back to the registry."""
+    registry.get_latest_schema.return_value = schema_version("orders-value", 2)
+    client.get("/api/v1/schemas/find", params={"subject": "orders-value"})
+
+    registry.delete_schema_version.return_value = True
+    registry.get_latest_schema.return_value = schema_version("orders-value", 1)
+    response = client.delete("/api/v1/registries/test/subjects/orders-value/versions/2")
+    found = client.get("/api/v1/schemas/find", params={"subject": "orders-value"}).json()
+
+    assert response.json()["success"] is True
+    registry.delete_schema_version.assert_called_once_with("orders-value", 2)
+    assert found["test"]["version"] == 1
+
+
+def test_delete_missing_version_is_not_found(client, registry):
+    """Test deleting an unknown version maps to 404."""
+    registry.delete_schema_version.side_effect = KeyError("orders-value version 9")
+
+    response = client.delete("/api/v1/registries/test/subjects/orders-value/versions/9")
+
+    assert response.status_code == 404
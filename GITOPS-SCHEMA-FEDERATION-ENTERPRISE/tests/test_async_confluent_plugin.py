@@ -0,0 +1,132 @@
+"""
+Tests for the asynchronous Confluent Schema Registry client.
+"""
+
+import httpx
+import pytest
+
+from src.core import CompatibilityMode, RegistryConfig, RegistryType, SchemaFormat
+from src.plugins.confluent import AsyncConfluentSchemaRegistryPlugin
+from src.plugins.confluent import async_plugin
+
+
+# Canned registry: three subjects, one of which fails on every lookup
+SUBJECTS = ["orders-value", "users-value", "broken-value"]
+LATEST = {
+    "orders-value": {"subject": "orders-value", "version": 3, "id": 7, "schema": "{}"},
+    "users-value": {
+        "subject": "users-value",
+        "version": 1,
+        "id": 9,
+        "schemaType": "JSON",
+        "schema": "{}"
+    }
+}
+SUBJECT_MODES = {"orders-value": "FULL"}
+
+
+def registry_handler(request):
+    """Answer registry requests from the canned data above."""
+    path = request.url.path
+    if path == "/subjects":
+        return httpx.Response(200, json=SUBJECTS)
+    if path == "/config":
+        return httpx.Response(200, json={"compatibilityLevel": "BACKWARD"})
+
+    subject = path.split("/")[2]
+    if subject == "broken-value":
+        return httpx.Response(500, json={"message": "internal error"})
+    if path.startswith("/config/"):
+        if subject in SUBJECT_MODES:
+            return httpx.Response(200, json={"compatibilityLevel": SUBJECT_MODES[subject]})
+        return httpx.Response(404, json={"error_code": 40401})
+    return httpx.Response(200, json=LATEST[subject])
+
+
+@pytest.fixture(autouse=True)
+def no_retry_backoff(monkeypatch):
+    """Retry failed responses immediately."""
+    monkeypatch.setattr(async_plugin, "_RETRY_BACKOFF", 0)
+
+
+@pytest.fixture
+def config():
+    """Create test configuration."""
+    return RegistryConfig(
+        id="test-confluent",
+        type=RegistryType.CONFLUENT,
+        url="http://localhost:8081",
+        auth={},
+        timeout=10,
+        max_retries=1
+    )
+
+
+def test_connection_limits_applied_to_transport(config):
+    """Test the connection limits reach the transport's pool."""
+    registry = AsyncConfluentSchemaRegistryPlugin(config, max_connections=3)
+
+    assert registry.client._transport._pool._max_connections == 3
+
+
+@pytest.mark.asyncio
+async def test_discover_schemas(config):
+    """Test discovery returns every subject that could be fetched."""
+    transport = httpx.MockTransport(registry_handler)
+
+    async with AsyncConfluentSchemaRegistryPlugin(config, transport=transport) as registry:
+        schemas = await registry.discover_schemas()
+
+    by_subject = {schema.subject: schema for schema in schemas}
+    assert sorted(by_subject) == ["orders-value", "users-value"]
+    assert by_subject["orders-value"].version == 3
+    assert by_subject["orders-value"].schema_format == SchemaFormat.AVRO
+    assert by_subject["users-value"].schema_format == SchemaFormat.JSON_SCHEMA
+
+
+@pytest.mark.asyncio
+async def test_get_all_compatibility_modes(config):
+    """Test subject modes fall back to global and failing subjects are dropped."""
+    transport = httpx.MockTransport(registry_handler)
+
+    async with AsyncConfluentSchemaRegistryPlugin(config, transport=transport) as registry:
+        modes = await registry.get_all_compatibility_modes()
+
+    assert modes == {
+        "orders-value": CompatibilityMode.FULL,
+        "users-value": CompatibilityMode.BACKWARD
+    }
+
+
+@pytest.mark.asyncio
+async def test_throttled_responses_are_retried(config):
+    """Test a 429 is retried and the next answer is used."""
+    answers = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json=LATEST["orders-value"])
+    ]
+    transport = httpx.MockTransport(lambda request: answers.pop(0))
+
+    async with AsyncConfluentSchemaRegistryPlugin(config, transport=transport) as registry:
+        schema = await registry.get_latest_schema("orders-value")
+
+    assert schema.version == 3
+    assert not answers
+
+
+@pytest.mark.asyncio
+async def test_server_errors_raise_once_retries_run_out(config):
+    """Test a persistent 5xx is retried max_retries times, then raised."""
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        return httpx.Response(503, json={"message": "unavailable"})
+
+    transport = httpx.MockTransport(handler)
+
+    async with AsyncConfluentSchemaRegistryPlugin(config, transport=transport) as registry:
+        with pytest.raises(httpx.HTTPStatusError):
+            await registry.get_latest_schema("orders-value")
+
+    assert len(seen) == config.max_retries + 1
@@ -7,14 +7,34 @@ schema evolution scenarios for each mode.
 
 import pytest
 import json
-from typing import Dict, List, Tuple
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple
 
-# Test schema definitions
+
+def _freeze(obj: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
+
+# Test schema definitions, frozen so they can be shared and memoized by id
 class TestSchemas:
     """Collection of test schemas for compatibility testing."""
 
+    @classmethod
+    def field_names(cls, schema: Mapping) -> frozenset:
+        """Return the field names of a record schema, computed once per schema."""
+        names = _FIELD_NAMES.get(id(schema))
+        if names is None:
+            names = _FIELD_NAMES[id(schema)] = frozenset(_field_index(schema))
+        return names
+
     # Base schema - Version 1
-    BASE_SCHEMA = {
+    BASE_SCHEMA = _freeze({
         "type": "record",
         "name": "User",
         "namespace": "com.example",
@@ -30,10 +50,10 @@ class TestSchemas:
                 "doc": "Username"
             }
         ]
-    }
+    })
 
     # BACKWARD compatible: Adding optional field with default
-    BACKWARD_COMPATIBLE = {
+    BACKWARD_COMPATIBLE = _freeze({
         "type": "record",
         "name": "User",
         "namespace": "com.example",
@@ -47,10 +67,10 @@ class TestSchemas:
                 "doc": "Added with default - BACKWARD compatible"
             }
         ]
-    }
+    })
 
     # FORWARD compatible base (with optional field)
-    FORWARD_BASE = {
+    FORWARD_BASE = _freeze({
         "type": "record",
         "name": "User",
         "namespace": "com.example",
@@ -63,10 +83,10 @@ class TestSchemas:
                 "doc": "Optional field"
             }
         ]
-    }
+    })
 
     # FORWARD compatible: Removing optional field
-    FORWARD_COMPATIBLE = {
+    FORWARD_COMPATIBLE = _freeze({
         "type": "record",
         "name": "User",
         "namespace": "com.example",
@@ -77,10 +97,10 @@ class TestSchemas:
                 "doc": "Removed username - FORWARD compatible if it was optional"
             }
         ]
-    }
+    })
 
     # FULL compatible: Adding optional nullable field
-    FULL_COMPATIBLE = {
+    FULL_COMPATIBLE = _freeze({
         "type": "record",
         "name": "User",
         "namespace": "com.example",
@@ -94,10 +114,10 @@ class TestSchemas:
                 "doc": "Nullable with null default - FULL compatible"
             }
         ]
-    }
+    })
 
     # BREAKING: Changing field type
-    BREAKING_TYPE_CHANGE = {
+    BREAKING_TYPE_CHANGE = _freeze({
         "type": "record",
         "name": "User",
         "namespace": "com.example",
@@ -109,10 +129,10 @@ class TestSchemas:
             },
             {"name": "username", "type": "string"}
         ]
-    }
+    })
 
     # BREAKING: Adding required field
-    BREAKING_REQUIRED_FIELD = {
+    BREAKING_REQUIRED_FIELD = _freeze({
         "type": "record",
         "name": "User",
         "namespace": "com.example",
@@ -125,10 +145,10 @@ class TestSchemas:
                 "doc": "Required field without default - BREAKING!"
             }
         ]
-    }
+    })
 
     # Type widening (BACKWARD compatible)
-    TYPE_WIDENING = {
+    TYPE_WIDENING = _freeze({
         "type": "record",
         "name": "User",
         "namespace": "com.example",
@@ -140,10 +160,10 @@ class TestSchemas:
             },
             {"name": "username", "type": "string"}
         ]
-    }
+    })
 
     # Field rename with alias (FULL compatible)
-    FIELD_RENAME_WITH_ALIAS = {
+    FIELD_RENAME_WITH_ALIAS = _freeze({
         "type": "record",
         "name": "User",
         "namespace": "com.example",
@@ -156,10 +176,10 @@ class TestSchemas:
                 "doc": "Renamed with alias - FULL compatible"
             }
         ]
-    }
+    })
 
     # Complex nested schema
-    NESTED_SCHEMA_V1 = {
+    NESTED_SCHEMA_V1 = _freeze({
         "type": "record",
         "name": "Order",
         "namespace": "com.example",
@@ -177,10 +197,10 @@ class TestSchemas:
                 }
             }
         ]
-    }
+    })
 
     # Complex nested schema - FULL compatible evolution
-    NESTED_SCHEMA_V2 = {
+    NESTED_SCHEMA_V2 = _freeze({
         "type": "record",
         "name": "Order",
         "namespace": "com.example",
@@ -209,7 +229,22 @@ class TestSchemas:
                 "doc": "Order timestamp"
             }
         ]
-    }
+    })
+
+
+# Field name -> field indexes and field name sets by schema identity; the
+# schemas above are class-level constants, so their ids stay valid for the
+# whole run
+_FIELD_INDEXES: Dict[int, Dict[str, Mapping[str, Any]]] = {}
+_FIELD_NAMES: Dict[int, frozenset] = {}
+
+
+def _field_index(schema: Mapping) -> Dict[str, Mapping[str, Any]]:
+    """Return the fields of a record schema keyed by name, built once per schema."""
+    index = _FIELD_INDEXES.get(id(schema))
+    if index is None:
+        index = _FIELD_INDEXES[id(schema)] = {f["name"]: f for f in schema["fields"]}
+    return index
 
 
 # Compatibility transition test cases
@@ -273,13 +308,67 @@ COMPATIBILITY_TRANSITIONS = [
     ("FULL_TRANSITIVE", "FULL", "SAFE", False, "Relaxing transitive requirements"),
 ]
 
+# Transitions keyed by (from_mode, to_mode), for O(1) lookup
+_TRANSITION_INDEX = {(t[0], t[1]): t for t in COMPATIBILITY_TRANSITIONS}
+
+# The table as parallel columns, for counting and filtering by field
+(_FROM_MODES, _TO_MODES, _RISK_LEVELS,
+ _REQUIRES_VALIDATION, _DESCRIPTIONS) = zip(*COMPATIBILITY_TRANSITIONS)
+
+# Readable test ids, one per transition
+_TRANSITION_IDS = [f"{f}->{t}" for f, t in zip(_FROM_MODES, _TO_MODES)]
+
+# Modes and risk levels in display order, with frozensets for membership
+MODES = (
+    "NONE", "BACKWARD", "BACKWARD_TRANSITIVE",
+    "FORWARD", "FORWARD_TRANSITIVE", "FULL", "FULL_TRANSITIVE"
+)
+RISK_LEVELS = ("SAFE", "RISKY", "DANGEROUS")
+VALID_MODES = frozenset(MODES)
+VALID_RISKS = frozenset(RISK_LEVELS)
+
+# Target modes grouped by the direction they check
+_BACKWARD_MODES = frozenset(("BACKWARD", "BACKWARD_TRANSITIVE"))
+_FORWARD_MODES = frozenset(("FORWARD", "FORWARD_TRANSITIVE"))
+
+# Schema pairs to validate before a transition, as (from modes, to modes,
+# pair) rules; the first matching rule applies
+_VALIDATION_RULES = (
+    # Must validate all versions are backward compatible
+    (frozenset(("NONE",)), _BACKWARD_MODES,
+     (TestSchemas.BASE_SCHEMA, TestSchemas.BACKWARD_COMPATIBLE)),
+    # Must validate all versions are forward compatible
+    # (they might not be if optimized for backward only)
+    (frozenset(("BACKWARD",)), _FORWARD_MODES,
+     (TestSchemas.FORWARD_BASE, TestSchemas.FORWARD_COMPATIBLE)),
+    # Must validate both directions for all version combinations
+    (VALID_MODES, frozenset(("FULL_TRANSITIVE",)),
+     (TestSchemas.BASE_SCHEMA, TestSchemas.FULL_COMPATIBLE)),
+)
+
+
+def _expand_validation_rules() -> Dict[Tuple[str, str], Tuple[Mapping, Mapping]]:
+    """Resolve the rules into a (from_mode, to_mode) -> schema pair lookup."""
+    index = {}
+    for from_mode in VALID_MODES:
+        for to_mode in VALID_MODES:
+            for from_modes, to_modes, pair in _VALIDATION_RULES:
+                if from_mode in from_modes and to_mode in to_modes:
+                    index[(from_mode, to_mode)] = pair
+                    break
+    return index
+
+
+_VALIDATION_INDEX = _expand_validation_rules()
+
 
 class TestCompatibilityModeTransitions:
     """Test all compatibility mode transitions."""
 
     @pytest.mark.parametrize(
         "from_mode,to_mode,risk_level,requires_validation,description",
-        COMPATIBILITY_TRANSITIONS
+        COMPATIBILITY_TRANSITIONS,
+        ids=_TRANSITION_IDS
     )
     def test_compatibility_transition(
         self,
@@ -303,20 +392,26 @@ class TestCompatibilityModeTransitions:
         # - Attempt the transition
         # - Verify the expected behavior
 
-        assert from_mode in [
-            "NONE", "BACKWARD", "BACKWARD_TRANSITIVE",
-            "FORWARD", "FORWARD_TRANSITIVE", "FULL", "FULL_TRANSITIVE"
-        ]
-        assert to_mode in [
-            "NONE", "BACKWARD", "BACKWARD_TRANSITIVE",
-            "FORWARD", "FORWARD_TRANSITIVE", "FULL", "FULL_TRANSITIVE"
-        ]
-        assert risk_level in ["SAFE", "RISKY", "DANGEROUS"]
+        assert from_mode in VALID_MODES
+        assert to_mode in VALID_MODES
+        assert risk_level in VALID_RISKS
+
+        # The full table is documented by print_transition_matrix()
 
-        # Log the transition for documentation
-        print(f"\n{from_mode} → {to_mode}: {risk_level}")
-        print(f"  Requires Validation: {requires_validation}")
-        print(f"  Description: {description}")
+    def test_every_transition_listed_once(self):
+        """The table covers each ordered pair of distinct modes exactly once."""
+        assert len(_TRANSITION_INDEX) == len(COMPATIBILITY_TRANSITIONS)
+        assert _TRANSITION_INDEX.keys() == {
+            (from_mode, to_mode)
+            for from_mode in MODES
+            for to_mode in MODES
+            if from_mode != to_mode
+        }
+
+    def test_validation_required_unless_safe(self):
+        """Every transition except the SAFE ones requires validation."""
+        for risk_level, requires_validation in zip(_RISK_LEVELS, _REQUIRES_VALIDATION):
+            assert requires_validation == (risk_level != "SAFE")
 
 
 class TestSchemaEvolutionScenarios:
@@ -335,7 +430,7 @@ class TestSchemaEvolutionScenarios:
         # ✅ V2 can read V1 data (uses default for missing "email")
         # ❌ V1 cannot read V2 data (doesn't know about "email" field)
 
-        assert "email" in [f["name"] for f in v2["fields"]]
+        assert "email" in TestSchemas.field_names(v2)
         assert "default" in v2["fields"][2]  # email field has default
 
     def test_forward_remove_optional_field(self):
@@ -351,8 +446,8 @@ class TestSchemaEvolutionScenarios:
         # ✅ V1 can read V2 data (just doesn't see the username field)
         # ❌ V2 cannot read V1 data (no default for removed field)
 
-        v1_fields = {f["name"] for f in v1["fields"]}
-        v2_fields = {f["name"] for f in v2["fields"]}
+        v1_fields = TestSchemas.field_names(v1)
+        v2_fields = TestSchemas.field_names(v2)
 
         # username was removed
         assert "username" in v1_fields
@@ -373,8 +468,8 @@ class TestSchemaEvolutionScenarios:
         # ✅ V2 can read V1 data (BACKWARD)
         # ✅ V1 can read V2 data (FORWARD)
 
-        email_field = [f for f in v2["fields"] if f["name"] == "email"][0]
-        assert email_field["type"] == ["null", "string"]  # Nullable union
+        email_field = _field_index(v2)["email"]
+        assert email_field["type"] == ("null", "string")  # Nullable union
         assert email_field["default"] is None  # Null default
 
     def test_breaking_type_change(self):
@@ -387,8 +482,8 @@ class TestSchemaEvolutionScenarios:
         v2 = TestSchemas.BREAKING_TYPE_CHANGE
 
         # id field changed from int to string
-        v1_id_type = [f for f in v1["fields"] if f["name"] == "id"][0]["type"]
-        v2_id_type = [f for f in v2["fields"] if f["name"] == "id"][0]["type"]
+        v1_id_type = _field_index(v1)["id"]["type"]
+        v2_id_type = _field_index(v2)["id"]["type"]
 
         assert v1_id_type == "int"
         assert v2_id_type == "string"
@@ -408,7 +503,7 @@ class TestSchemaEvolutionScenarios:
         v1 = TestSchemas.BASE_SCHEMA
         v2 = TestSchemas.BREAKING_REQUIRED_FIELD
 
-        email_field = [f for f in v2["fields"] if f["name"] == "email"][0]
+        email_field = _field_index(v2)["email"]
         assert "default" not in email_field  # No default!
 
         # This is BREAKING:
@@ -426,11 +521,11 @@ class TestSchemaEvolutionScenarios:
         v1 = TestSchemas.BASE_SCHEMA
         v2 = TestSchemas.TYPE_WIDENING
 
-        v1_id_type = [f for f in v1["fields"] if f["name"] == "id"][0]["type"]
-        v2_id_type = [f for f in v2["fields"] if f["name"] == "id"][0]["type"]
+        v1_id_type = _field_index(v1)["id"]["type"]
+        v2_id_type = _field_index(v2)["id"]["type"]
 
         assert v1_id_type == "int"
-        assert v2_id_type == ["int", "long"]  # Union type
+        assert v2_id_type == ("int", "long")  # Union type
 
         # Under BACKWARD mode:
         # ✅ V2 can read V1 data (int is part of union)
@@ -446,8 +541,8 @@ class TestSchemaEvolutionScenarios:
         v1 = TestSchemas.BASE_SCHEMA
         v2 = TestSchemas.FIELD_RENAME_WITH_ALIAS
 
-        v1_field_name = [f for f in v1["fields"] if "username" in f.values()][0]["name"]
-        v2_field = [f for f in v2["fields"] if "user_name" in f.values()][0]
+        v1_field_name = _field_index(v1)["username"]["name"]
+        v2_field = _field_index(v2)["user_name"]
 
         assert v1_field_name == "username"
         assert v2_field["name"] == "user_name"
@@ -471,13 +566,13 @@ class TestSchemaEvolutionScenarios:
         # 1. email field to nested User record (nullable)
         # 2. timestamp field to Order (nullable)
 
-        v2_user_fields = v2["fields"][1]["type"]["fields"]
-        email_field = [f for f in v2_user_fields if f["name"] == "email"][0]
-        assert email_field["type"] == ["null", "string"]
+        v2_user = _field_index(v2)["user"]["type"]
+        email_field = _field_index(v2_user)["email"]
+        assert email_field["type"] == ("null", "string")
         assert email_field["default"] is None
 
-        v2_timestamp = [f for f in v2["fields"] if f["name"] == "timestamp"][0]
-        assert v2_timestamp["type"] == ["null", "long"]
+        v2_timestamp = _field_index(v2)["timestamp"]
+        assert v2_timestamp["type"] == ("null", "long")
         assert v2_timestamp["default"] is None
 
         # Under FULL mode:
@@ -488,7 +583,7 @@ class TestSchemaEvolutionScenarios:
 class TestCompatibilityValidation:
     """Test validation requirements for mode transitions."""
 
-    def get_schemas_to_validate(self, from_mode: str, to_mode: str) -> List[Dict]:
+    def get_schemas_to_validate(self, from_mode: str, to_mode: str) -> List[Tuple[Mapping, Mapping]]:
         """
         Determine which schemas need validation for a given transition.
 
@@ -496,23 +591,8 @@ class TestCompatibilityValidation:
         """
         # Simplification: In real implementation, you would query
         # the schema registry for all versions and test combinations
-
-        schemas_to_test = []
-
-        if from_mode == "NONE" and to_mode in ["BACKWARD", "BACKWARD_TRANSITIVE"]:
-            # Must validate all versions are backward compatible
-            schemas_to_test.append((TestSchemas.BASE_SCHEMA, TestSchemas.BACKWARD_COMPATIBLE))
-
-        elif from_mode == "BACKWARD" and to_mode in ["FORWARD", "FORWARD_TRANSITIVE"]:
-            # Must validate all versions are forward compatible
-            # (they might not be if optimized for backward only)
-            schemas_to_test.append((TestSchemas.FORWARD_BASE, TestSchemas.FORWARD_COMPATIBLE))
-
-        elif to_mode == "FULL_TRANSITIVE":
-            # Must validate both directions for all version combinations
-            schemas_to_test.append((TestSchemas.BASE_SCHEMA, TestSchemas.FULL_COMPATIBLE))
-
-        return schemas_to_test
+        pair = _VALIDATION_INDEX.get((from_mode, to_mode))
+        return [pair] if pair else []
 
     @pytest.mark.parametrize(
         "from_mode,to_mode",
@@ -539,21 +619,24 @@ class TestCompatibilityValidation:
         # 3. Only allow transition if all pass
 
 
+# Matrix cell markers by risk level, and the header's corner label
+_RISK_EMOJI = {
+    "SAFE": "✅",
+    "RISKY": "⚠️",
+    "DANGEROUS": "🔴",
+    "N/A": "⏺️",
+    "?": "❓"
+}
+_MATRIX_CORNER = "From \\ To"
+
+
 def print_transition_matrix():
     """
     Helper function to print the full transition matrix.
 
     Run this to generate documentation output.
     """
-    modes = [
-        "NONE",
-        "BACKWARD",
-        "BACKWARD_TRANSITIVE",
-        "FORWARD",
-        "FORWARD_TRANSITIVE",
-        "FULL",
-        "FULL_TRANSITIVE"
-    ]
+    modes = MODES
 
     # Build matrix
     matrix = {}
@@ -563,39 +646,33 @@ def print_transition_matrix():
             if from_mode == to_mode:
                 matrix[from_mode][to_mode] = "N/A"
             else:
-                # Find in COMPATIBILITY_TRANSITIONS
-                transition = next(
-                    (t for t in COMPATIBILITY_TRANSITIONS
-                     if t[0] == from_mode and t[1] == to_mode),
-                    None
-                )
+                transition = _TRANSITION_INDEX.get((from_mode, to_mode))
                 if transition:
                     matrix[from_mode][to_mode] = transition[2]  # risk_level
                 else:
                     matrix[from_mode][to_mode] = "?"
 
-    # Print matrix
-    print("\nCompatibility Mode Transition Matrix")
-    print("=" * 100)
-    print(f"{'From \\ To':<25}", end="")
-    for mode in modes:
-        print(f"{mode:<15}", end="")
-    print()
-    print("-" * 100)
-
+    # Assemble the output and write it in one call
+    lines = [
+        "",
+        "Compatibility Mode Transition Matrix",
+        "=" * 100,
+        _MATRIX_CORNER.ljust(25) + "".join(f"{mode:<15}" for mode in modes),
+        "-" * 100,
+    ]
     for from_mode in modes:
-        print(f"{from_mode:<25}", end="")
-        for to_mode in modes:
-            risk = matrix[from_mode][to_mode]
-            emoji = {
-                "SAFE": "✅",
-                "RISKY": "⚠️",
-                "DANGEROUS": "🔴",
-                "N/A": "⏺️",
-                "?": "❓"
-            }.get(risk, "?")
-            print(f"{emoji} {risk:<12}", end="")
-        print()
+        row = matrix[from_mode]
+        lines.append(f"{from_mode:<25}" + "".join(
+            f"{_RISK_EMOJI.get(row[to_mode], '?')} {row[to_mode]:<12}"
+            for to_mode in modes
+        ))
+    lines.append("-" * 100)
+    lines.append("  ".join(
+        f"{risk}: {_RISK_LEVELS.count(risk)}"
+        for risk in RISK_LEVELS
+    ))
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
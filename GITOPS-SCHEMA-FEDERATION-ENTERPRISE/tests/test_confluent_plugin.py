@@ -3,7 +3,9 @@ Tests for Confluent Schema Registry plugin.
 """
 
 import pytest
-from unittest.mock import Mock, patch
+import requests
+import responses
+from responses import matchers
 
 from src.core import (
     CompatibilityMode,
@@ -12,24 +14,51 @@ from src.core import (
     SchemaFormat
 )
 from src.plugins.confluent import ConfluentSchemaRegistryPlugin
+from src.plugins.confluent import plugin as confluent_plugin
 
 
-@pytest.fixture
+BASE_URL = "http://localhost:8081"
+
+
+def _mock_json(path, payload, status=200):
+    """Register a JSON response for a GET on the test registry."""
+    responses.add(responses.GET, BASE_URL + path, json=payload, status=status)
+
+
+def _mock_schema_pages(entries, page_size, **params):
+    """Serve entries from GET /schemas in offset/limit pages of page_size."""
+    for offset in range(0, len(entries) + 1, page_size):
+        responses.add(
+            responses.GET,
+            BASE_URL + "/schemas",
+            json=entries[offset:offset + page_size],
+            match=[matchers.query_param_matcher(
+                {**params, "offset": str(offset), "limit": str(page_size)}
+            )]
+        )
+
+
+@pytest.fixture(scope="module")
 def config():
     """Create test configuration."""
     return RegistryConfig(
         id="test-confluent",
         type=RegistryType.CONFLUENT,
-        url="http://localhost:8081",
+        url=BASE_URL,
         auth={},
         timeout=10,
         max_retries=1
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def plugin(config):
-    """Create plugin instance."""
+    """
+    Create plugin instance, shared by the module.
+
+    HTTP calls are patched per test, so only the plugin's caches carry
+    over between tests; no test reads back what another one cached.
+    """
     return ConfluentSchemaRegistryPlugin(config)
 
 
@@ -47,13 +76,26 @@ def test_supported_formats(plugin):
     assert SchemaFormat.JSON_SCHEMA in formats
 
 
-@patch('requests.Session.get')
-def test_list_subjects(mock_get, plugin):
+def test_session_shared_only_with_same_credentials():
+    """Test instances share a session (and cookie jar) only per identity."""
+    def plugin_as(username):
+        return ConfluentSchemaRegistryPlugin(RegistryConfig(
+            id=f"tenant-{username}",
+            type=RegistryType.CONFLUENT,
+            url="http://shared-registry:8081",
+            auth={"username": username, "password": "secret"}
+        ))
+
+    alice, alice_again, bob = plugin_as("alice"), plugin_as("alice"), plugin_as("bob")
+
+    assert alice.session is alice_again.session
+    assert alice.session is not bob.session
+
+
+@responses.activate
+def test_list_subjects(plugin):
     """Test listing subjects."""
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = ["topic1-value", "topic2-value"]
-    mock_get.return_value = mock_response
+    _mock_json("/subjects", ["topic1-value", "topic2-value"])
 
     subjects = plugin.list_subjects()
 
@@ -62,13 +104,75 @@ def test_list_subjects(mock_get, plugin):
     assert len(subjects) == 2
 
 
-@patch('requests.Session.get')
-def test_health_check_success(mock_get, plugin):
+@responses.activate
+def test_get_all_versions(plugin):
+    """Test fetching all versions of a subject in one request."""
+    _mock_json("/schemas", [
+        {"subject": "topic1-value", "version": 2, "id": 12, "schema": "{}"},
+        {"subject": "topic1-value-v2", "version": 1, "id": 20, "schema": "{}"},
+        {"subject": "topic1-value", "version": 1, "id": 11, "schema": "{}"}
+    ])
+
+    schemas = plugin.get_all_versions("topic1-value")
+
+    assert len(responses.calls) == 1
+    assert [s.version for s in schemas] == [1, 2]
+    assert [s.id for s in schemas] == [11, 12]
+
+
+@responses.activate
+def test_get_all_versions_reads_every_page(plugin, monkeypatch):
+    """Test versions listed after other subjects sharing the prefix are kept."""
+    monkeypatch.setattr(confluent_plugin, "_SCHEMAS_PAGE_SIZE", 2)
+    _mock_schema_pages([
+        {"subject": "orders", "version": 1, "id": 1, "schema": "{}"},
+        {"subject": "orders-audit", "version": 1, "id": 2, "schema": "{}"},
+        {"subject": "orders-audit", "version": 2, "id": 3, "schema": "{}"},
+        {"subject": "orders-eu", "version": 1, "id": 4, "schema": "{}"},
+        {"subject": "orders", "version": 2, "id": 5, "schema": "{}"}
+    ], 2, subjectPrefix="orders", latestOnly="false")
+
+    schemas = plugin.get_all_versions("orders")
+
+    assert len(responses.calls) == 3
+    assert [(s.version, s.id) for s in schemas] == [(1, 1), (2, 5)]
+
+
+@responses.activate
+def test_discover_schemas_pages_through_listing(plugin, monkeypatch):
+    """Test bulk discovery keeps requesting pages until a short one."""
+    monkeypatch.setattr(confluent_plugin, "_SCHEMAS_PAGE_SIZE", 2)
+    entries = [
+        {"subject": f"paged-{i}-value", "version": 1, "id": 100 + i, "schema": "{}"}
+        for i in range(5)
+    ]
+    _mock_schema_pages(entries, 2, latestOnly="true", subjectPrefix="paged-")
+
+    schemas = plugin.discover_schemas(namespace="paged-")
+
+    assert len(responses.calls) == 3
+    assert [s.id for s in schemas] == [100, 101, 102, 103, 104]
+
+
+@responses.activate
+def test_discover_schemas_falls_back_without_schemas_endpoint(plugin):
+    """Test registries without GET /schemas are discovered per subject."""
+    _mock_json("/schemas", {"error_code": 404, "message": "Not Found"}, status=404)
+    _mock_json("/subjects", ["legacy-value"])
+    _mock_json("/subjects/legacy-value/versions", [1, 2])
+    _mock_json("/subjects/legacy-value/versions/2", {
+        "subject": "legacy-value", "version": 2, "id": 31, "schema": "{}"
+    })
+
+    schemas = plugin.discover_schemas()
+
+    assert [(s.subject, s.version, s.id) for s in schemas] == [("legacy-value", 2, 31)]
+
+
+@responses.activate
+def test_health_check_success(plugin):
     """Test successful health check."""
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = []
-    mock_get.return_value = mock_response
+    _mock_json("/subjects", [])
 
     health = plugin.health_check()
 
@@ -76,10 +180,14 @@ def test_health_check_success(mock_get, plugin):
     assert health.status_code == 200
 
 
-@patch('requests.Session.get')
-def test_health_check_failure(mock_get, plugin):
+@responses.activate
+def test_health_check_failure(plugin):
     """Test failed health check."""
-    mock_get.side_effect = Exception("Connection refused")
+    responses.add(
+        responses.GET,
+        BASE_URL + "/subjects",
+        body=requests.exceptions.ConnectionError("Connection refused")
+    )
 
     health = plugin.health_check()
 
@@ -0,0 +1,128 @@
+"""
+Tests for the orchestrator's streaming bulk compatibility check.
+"""
+
+import asyncio
+import threading
+from unittest import mock
+
+import pytest
+
+from src.core import CompatibilityMode, MultiBackendOrchestrator, RegistryType, Schema, SchemaFormat
+from src.core import orchestrator as orchestrator_module
+from src.core.plugin_registry import PluginRegistry
+
+
+def single_version(subject):
+    """Return a one-version history, which checks as compatible."""
+    return [Schema(
+        subject=subject,
+        version=1,
+        schema_format=SchemaFormat.AVRO,
+        schema_content="{}",
+        registry_type=RegistryType.CONFLUENT
+    )]
+
+
+@pytest.fixture
+def registry():
+    """Create a registry double whose subjects all have one version."""
+    registry = mock.Mock()
+    registry.get_all_versions.side_effect = single_version
+    return registry
+
+
+@pytest.fixture
+def orchestrator(registry):
+    """Create an orchestrator with the registry double as "test"."""
+    orchestrator = MultiBackendOrchestrator(PluginRegistry())
+    orchestrator.active_registries["test"] = registry
+    yield orchestrator
+    orchestrator.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_results_stream_while_listing(orchestrator, registry):
+    """Test the first result arrives before the listing has finished."""
+    first_delivered = threading.Event()
+    listing_finished = threading.Event()
+
+    def iter_subjects(prefix=None, pattern=None):
+        yield "orders-value"
+        first_delivered.wait(5)
+        yield "users-value"
+        listing_finished.set()
+
+    registry.iter_subjects.side_effect = iter_subjects
+
+    entries = []
+    async for entry in orchestrator.iter_bulk_check_compatibility(
+        ["test"], CompatibilityMode.BACKWARD
+    ):
+        if not entries:
+            assert not listing_finished.is_set()
+            first_delivered.set()
+        entries.append(entry)
+
+    assert sorted(e["subject"] for e in entries) == ["orders-value", "users-value"]
+    assert all(e["is_compatible"] for e in entries)
+
+
+@pytest.mark.asyncio
+async def test_pending_checks_are_bounded(orchestrator, registry, monkeypatch):
+    """Test listing waits for a slow consumer instead of racing ahead."""
+    monkeypatch.setattr(orchestrator_module, "_MAX_PENDING_CHECKS", 2)
+    listed = 0
+
+    def iter_subjects(prefix=None, pattern=None):
+        nonlocal listed
+        for i in range(20):
+            listed += 1
+            yield f"subject-{i}"
+
+    registry.iter_subjects.side_effect = iter_subjects
+
+    delivered = 0
+    async for _ in orchestrator.iter_bulk_check_compatibility(["test"], CompatibilityMode.BACKWARD):
+        delivered += 1
+        # Two pending slots, plus the subject waiting for one
+        assert listed <= delivered + 2 + 1
+        await asyncio.sleep(0.005)
+
+    assert delivered == 20
+
+
+@pytest.mark.asyncio
+async def test_closing_the_stream_stops_listing(orchestrator, registry, monkeypatch):
+    """Test a consumer that stops early releases the listing thread."""
+    monkeypatch.setattr(orchestrator_module, "_MAX_PENDING_CHECKS", 2)
+    listing_closed = threading.Event()
+
+    def iter_subjects(prefix=None, pattern=None):
+        try:
+            for i in range(1000):
+                yield f"subject-{i}"
+        finally:
+            listing_closed.set()
+
+    registry.iter_subjects.side_effect = iter_subjects
+
+    stream = orchestrator.iter_bulk_check_compatibility(["test"], CompatibilityMode.BACKWARD)
+    await stream.__anext__()
+    await stream.aclose()
+
+    assert await asyncio.to_thread(listing_closed.wait, 5)
+
+
+def test_bulk_check_counts_listing_failures(orchestrator, registry):
+    """Test a registry that cannot be listed counts as one error."""
+    registry.iter_subjects.return_value = iter(["orders-value"])
+    broken = mock.Mock()
+    broken.iter_subjects.side_effect = ConnectionError("registry down")
+    orchestrator.active_registries["broken"] = broken
+
+    result = orchestrator.bulk_check_compatibility(["broken", "test"], CompatibilityMode.BACKWARD)
+
+    assert result.total_checked == 1
+    assert result.compatible == 1
+    assert result.errors == 1
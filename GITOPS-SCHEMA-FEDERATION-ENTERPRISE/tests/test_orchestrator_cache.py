@@ -0,0 +1,194 @@
+"""
+Tests for the orchestrator's cached registry lookups.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+from cachetools import TTLCache
+
+from src.core import MultiBackendOrchestrator, RegistryType, Schema, SchemaFormat
+from src.core.plugin_registry import PluginRegistry
+
+
+SCHEMA = Schema(
+    id=7,
+    subject="orders-value",
+    version=1,
+    schema_content="{}",
+    schema_format=SchemaFormat.AVRO,
+    registry_type=RegistryType.CONFLUENT
+)
+
+
+class FakeClock:
+    """Manually advanced timer for TTL caches."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def registry():
+    """Create a registry double answering every lookup with SCHEMA."""
+    registry = mock.Mock()
+    registry.get_schema_by_id.return_value = SCHEMA
+    registry.get_latest_schema.return_value = SCHEMA
+    registry.register_schema.return_value = SCHEMA
+    return registry
+
+
+@pytest.fixture
+def orchestrator(registry):
+    """Create an orchestrator with the registry double as "test"."""
+    orchestrator = MultiBackendOrchestrator(PluginRegistry())
+    orchestrator.active_registries["test"] = registry
+    yield orchestrator
+    orchestrator.shutdown()
+
+
+def test_repeated_lookup_is_served_from_cache(orchestrator, registry):
+    """Test a second lookup of the same schema skips the backend."""
+    first = orchestrator.get_schema_by_id("test", 7)
+    second = orchestrator.get_schema_by_id("test", 7)
+
+    assert first is second is SCHEMA
+    registry.get_schema_by_id.assert_called_once_with(7)
+
+
+def test_entries_expire_after_ttl(orchestrator, registry):
+    """Test a lookup goes back to the backend once its entry expires."""
+    clock = FakeClock()
+    orchestrator._latest_cache = TTLCache(maxsize=10, ttl=60, timer=clock)
+
+    orchestrator._cached_get_latest_schema("test", "orders-value")
+    clock.now = 59
+    orchestrator._cached_get_latest_schema("test", "orders-value")
+    assert registry.get_latest_schema.call_count == 1
+
+    clock.now = 61
+    orchestrator._cached_get_latest_schema("test", "orders-value")
+    assert registry.get_latest_schema.call_count == 2
+
+
+def test_register_schema_invalidates_subject(orchestrator, registry):
+    """Test registering a version drops the subject's cached lookups."""
+    orchestrator._cached_get_latest_schema("test", "orders-value")
+    orchestrator._cached_get_latest_schema("test", "users-value")
+
+    orchestrator.register_schema("test", "orders-value", "{}", SchemaFormat.AVRO)
+    orchestrator._cached_get_latest_schema("test", "orders-value")
+    orchestrator._cached_get_latest_schema("test", "users-value")
+
+    assert [c.args[0] for c in registry.get_latest_schema.call_args_list] == [
+        "orders-value", "users-value", "orders-value"
+    ]
+
+
+def test_register_during_load_discards_loaded_value(orchestrator, registry):
+    """Test a load overtaken by a write doesn't cache its stale result."""
+    stale = SCHEMA
+    fresh = Schema(
+        id=8,
+        subject="orders-value",
+        version=2,
+        schema_content="{}",
+        schema_format=SchemaFormat.AVRO,
+        registry_type=RegistryType.CONFLUENT
+    )
+    loading = threading.Event()
+    release = threading.Event()
+
+    def slow_stale_lookup(subject):
+        loading.set()
+        release.wait(5)
+        return stale
+
+    registry.get_latest_schema.side_effect = slow_stale_lookup
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        reader = pool.submit(orchestrator._cached_get_latest_schema, "test", "orders-value")
+        assert loading.wait(5)
+        orchestrator.register_schema("test", "orders-value", "{}", SchemaFormat.AVRO)
+        release.set()
+        assert reader.result(5) is stale
+
+    registry.get_latest_schema.side_effect = None
+    registry.get_latest_schema.return_value = fresh
+
+    assert orchestrator._cached_get_latest_schema("test", "orders-value") is fresh
+    assert not orchestrator._inflight
+
+
+def test_failed_delete_still_invalidates_subject(orchestrator, registry):
+    """Test a delete that raises still drops the subject's cached lookups."""
+    registry.delete_schema_version.side_effect = TimeoutError("no response")
+    orchestrator._cached_get_latest_schema("test", "orders-value")
+
+    with pytest.raises(TimeoutError):
+        orchestrator.delete_schema_version("test", "orders-value", 1)
+    orchestrator._cached_get_latest_schema("test", "orders-value")
+
+    assert registry.get_latest_schema.call_count == 2
+
+
+def test_concurrent_misses_load_once(orchestrator, registry):
+    """Test concurrent misses on one key reach the backend only once."""
+    loading = threading.Event()
+    release = threading.Event()
+
+    def slow_lookup(schema_id):
+        loading.set()
+        release.wait(5)
+        return SCHEMA
+
+    registry.get_schema_by_id.side_effect = slow_lookup
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        leader = pool.submit(orchestrator.get_schema_by_id, "test", 7)
+        assert loading.wait(5)
+        followers = [
+            pool.submit(orchestrator.get_schema_by_id, "test", 7)
+            for _ in range(7)
+        ]
+        # Hold the load until every follower has started its lookup
+        while not all(f.running() for f in followers):
+            time.sleep(0.001)
+        release.set()
+
+        results = [leader.result(5)] + [f.result(5) for f in followers]
+
+    assert all(result is SCHEMA for result in results)
+    registry.get_schema_by_id.assert_called_once_with(7)
+
+
+def test_concurrent_misses_share_the_failure(orchestrator, registry):
+    """Test waiters see the leader's exception and nothing is cached."""
+    loading = threading.Event()
+    release = threading.Event()
+
+    def failing_lookup(schema_id):
+        loading.set()
+        release.wait(5)
+        raise KeyError(schema_id)
+
+    registry.get_schema_by_id.side_effect = failing_lookup
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(orchestrator.get_schema_by_id, "test", 7)
+        assert loading.wait(5)
+        follower = pool.submit(orchestrator.get_schema_by_id, "test", 7)
+        release.set()
+
+        for future in (leader, follower):
+            with pytest.raises(KeyError):
+                future.result(5)
+
+    assert ("test", 7) not in orchestrator._schema_cache
+    assert not orchestrator._inflight
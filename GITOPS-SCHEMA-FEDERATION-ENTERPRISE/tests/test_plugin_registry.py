@@ -0,0 +1,68 @@
+"""
+Tests for the plugin registry.
+"""
+
+import pytest
+
+from src.core import RegistryConfig, RegistryType
+from src.core.plugin_registry import PluginRegistry
+from src.plugins.unity_catalog import UnityCatalogPlugin
+
+
+def uc_config(**overrides):
+    """Create a Unity Catalog configuration, with optional field overrides."""
+    settings = {
+        "id": "uc",
+        "type": RegistryType.UNITY_CATALOG,
+        "url": "https://workspace.example.com",
+        "auth": {"token": "t"},
+        "metadata": {"catalog": "main", "cache_ttl": 30}
+    }
+    settings.update(overrides)
+    return RegistryConfig(**settings)
+
+
+@pytest.fixture
+def registry():
+    """Create a plugin registry with the Unity Catalog plugin registered."""
+    registry = PluginRegistry()
+    registry.register_plugin(RegistryType.UNITY_CATALOG, UnityCatalogPlugin)
+    return registry
+
+
+def test_equivalent_configs_share_instance(registry):
+    """Test configs differing only in id and key order reuse one instance."""
+    first = registry.get_or_create_instance(uc_config(id="uc-a"))
+    second = registry.get_or_create_instance(uc_config(
+        id="uc-b",
+        metadata={"cache_ttl": 30, "catalog": "main"}
+    ))
+
+    assert first is second
+
+
+def test_configs_with_different_catalogs_do_not_share(registry):
+    """Test the catalog in metadata is part of the instance identity."""
+    main = registry.get_or_create_instance(uc_config())
+    sales = registry.get_or_create_instance(uc_config(
+        metadata={"catalog": "sales", "cache_ttl": 30}
+    ))
+
+    assert main is not sales
+    assert main.catalog == "main"
+    assert sales.catalog == "sales"
+
+
+@pytest.mark.parametrize("overrides", [
+    {"ssl_config": {"verify": False}},
+    {"timeout": 5},
+    {"max_retries": 0},
+    {"pool_size": 4},
+    {"auth": {"token": "other"}},
+])
+def test_configs_with_different_settings_do_not_share(registry, overrides):
+    """Test every behaviour-affecting field is part of the instance identity."""
+    base = registry.get_or_create_instance(uc_config())
+    other = registry.get_or_create_instance(uc_config(**overrides))
+
+    assert base is not other
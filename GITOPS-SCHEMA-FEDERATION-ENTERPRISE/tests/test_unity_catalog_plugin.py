@@ -0,0 +1,297 @@
+"""
+Tests for the Unity Catalog plugin.
+"""
+
+from unittest import mock
+
+import httpx
+import orjson
+import pytest
+import requests
+import responses
+from cachetools import TTLCache
+from responses import matchers
+
+from src.core import RegistryConfig, RegistryType, Schema, SchemaFormat
+from src.plugins.unity_catalog import UnityCatalogPlugin
+from src.plugins.unity_catalog import plugin as uc_plugin
+
+
+# Canned workspace: one readable table, one missing and one failing
+TABLES = {
+    "main.sales.orders": {
+        "name": "orders",
+        "catalog_name": "main",
+        "schema_name": "sales",
+        "columns": [
+            {"name": "id", "type_name": "LONG", "nullable": False, "position": 0},
+            {"name": "amount", "type_name": "DOUBLE", "nullable": True, "position": 1}
+        ]
+    }
+}
+
+BASE_URL = "https://workspace.example.com"
+TABLES_URL = BASE_URL + "/api/2.1/unity-catalog/tables"
+
+# The orders table as Iceberg, pretty-printed with keys in another order
+# than the compact form the plugin stores
+ORDERS_ICEBERG = orjson.dumps({
+    "fields": [
+        {"type": "long", "name": "id", "id": 0, "required": True, "doc": ""},
+        {"type": "double", "name": "amount", "id": 1, "required": False, "doc": ""}
+    ],
+    "type": "struct"
+}, option=orjson.OPT_INDENT_2).decode()
+
+
+class FakeClock:
+    """Manually advanced timer for TTL caches."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def listed_table(schema_name, name):
+    """Create a table listing entry, with columns the listing must skip."""
+    return {
+        "catalog_name": "main",
+        "schema_name": schema_name,
+        "name": name,
+        "columns": [{"name": "id", "type_name": "LONG", "position": 0}]
+    }
+
+
+def uc_config(**metadata):
+    """Create a Unity Catalog configuration with extra metadata."""
+    return RegistryConfig(
+        id="uc",
+        type=RegistryType.UNITY_CATALOG,
+        url=BASE_URL,
+        auth={"token": "t"},
+        pool_size=5,
+        metadata={"catalog": "main", **metadata}
+    )
+
+
+@pytest.fixture
+def requests_seen():
+    """Collect the table paths the mock workspace was asked for."""
+    return []
+
+
+@pytest.fixture
+def plugin(monkeypatch, requests_seen):
+    """Create an async_http plugin whose client talks to the canned workspace."""
+    def handler(request):
+        requests_seen.append(request.url.path)
+        full_name = request.url.path.rsplit("/", 1)[-1]
+        if full_name == "main.sales.broken":
+            return httpx.Response(500, json={"message": "internal error"})
+        if full_name not in TABLES:
+            return httpx.Response(404, json={"error_code": "TABLE_DOES_NOT_EXIST"})
+        return httpx.Response(200, json=TABLES[full_name])
+
+    plugin = UnityCatalogPlugin(uc_config(async_http=True))
+    monkeypatch.setattr(plugin, "_new_async_client", lambda: httpx.AsyncClient(
+        base_url=plugin.base_url,
+        transport=httpx.MockTransport(handler)
+    ))
+    return plugin
+
+
+def test_async_client_applies_pool_size():
+    """Test the connection limit reaches the async transport's pool."""
+    plugin = UnityCatalogPlugin(uc_config(async_http=True))
+
+    client = plugin._new_async_client()
+
+    assert client._transport._pool._max_connections == 5
+    assert client.headers["Authorization"] == "Bearer t"
+
+
+def test_get_latest_schemas_returns_per_subject_errors(plugin):
+    """Test failing tables come back as exceptions next to the good ones."""
+    results = plugin.get_latest_schemas(
+        ["main.sales.orders", "main.sales.missing", "main.sales.broken"]
+    )
+
+    assert isinstance(results["main.sales.orders"], Schema)
+    assert results["main.sales.orders"].subject == "main.sales.orders"
+    assert isinstance(results["main.sales.missing"], KeyError)
+    assert isinstance(results["main.sales.broken"], httpx.HTTPStatusError)
+
+
+def test_get_latest_schemas_shares_schema_cache(plugin, requests_seen):
+    """Test async lookups fill and reuse the cache the sync path reads."""
+    first = plugin.get_latest_schemas(["main.sales.orders"])
+    assert len(requests_seen) == 1
+
+    second = plugin.get_latest_schemas(["main.sales.orders"])
+    cached = plugin.get_latest_schema("main.sales.orders")
+
+    assert len(requests_seen) == 1
+    assert second["main.sales.orders"] is first["main.sales.orders"]
+    assert cached is first["main.sales.orders"]
+
+
+@responses.activate
+def test_unchanged_schema_skips_parsing_and_refetching():
+    """Test identical content is compatible without parsing, then cached."""
+    responses.add(responses.GET, TABLES_URL + "/main.sales.orders",
+                  json=TABLES["main.sales.orders"])
+    plugin = UnityCatalogPlugin(uc_config())
+
+    with mock.patch.object(uc_plugin, "_ICEBERG_DECODER") as decoder, \
+            mock.patch.object(plugin, "_check_iceberg_evolution") as evolution:
+        first = plugin.check_compatibility("main.sales.orders", ORDERS_ICEBERG, SchemaFormat.ICEBERG)
+        second = plugin.check_compatibility("main.sales.orders", ORDERS_ICEBERG, SchemaFormat.ICEBERG)
+
+    assert first.is_compatible
+    assert second is first
+    decoder.decode.assert_not_called()
+    evolution.assert_not_called()
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_clear_schema_cache_drops_compatibility_result():
+    """Test clearing a table's cache forces the next check to refetch it."""
+    responses.add(responses.GET, TABLES_URL + "/main.sales.orders",
+                  json=TABLES["main.sales.orders"])
+    plugin = UnityCatalogPlugin(uc_config())
+
+    first = plugin.check_compatibility("main.sales.orders", ORDERS_ICEBERG, SchemaFormat.ICEBERG)
+    plugin.clear_schema_cache("main.sales.orders")
+    second = plugin.check_compatibility("main.sales.orders", ORDERS_ICEBERG, SchemaFormat.ICEBERG)
+
+    assert second is not first
+    assert second.is_compatible
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_schema_cache_hit_and_expiry():
+    """Test table schemas are reused until the cache TTL passes."""
+    responses.add(responses.GET, TABLES_URL + "/main.sales.orders",
+                  json=TABLES["main.sales.orders"])
+    plugin = UnityCatalogPlugin(uc_config(cache_ttl=5))
+    clock = FakeClock()
+    plugin._schema_cache = TTLCache(maxsize=10, ttl=plugin._schema_cache.ttl, timer=clock)
+
+    first = plugin.get_latest_schema("main.sales.orders")
+    clock.now = 4
+    second = plugin.get_latest_schema("main.sales.orders")
+    assert second is first
+    assert len(responses.calls) == 1
+
+    clock.now = 6
+    third = plugin.get_latest_schema("main.sales.orders")
+    assert third is not first
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_listing_cache_hit_and_expiry():
+    """Test listings are reused until the cache TTL passes."""
+    responses.add(responses.GET, TABLES_URL,
+                  json={"tables": [listed_table("sales", "orders")]})
+    plugin = UnityCatalogPlugin(uc_config(cache_ttl=5))
+    clock = FakeClock()
+    plugin._subjects_cache = TTLCache(maxsize=10, ttl=plugin._subjects_cache.ttl, timer=clock)
+
+    assert plugin.list_subjects() == ["main.sales.orders"]
+    clock.now = 4
+    assert plugin.list_subjects() == ["main.sales.orders"]
+    assert len(responses.calls) == 1
+
+    clock.now = 6
+    assert plugin.list_subjects() == ["main.sales.orders"]
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_list_subjects_follows_page_tokens():
+    """Test every page of a streamed listing is read, skipping column names."""
+    first_page = {"catalog_name": "main", "max_results": "1000"}
+    responses.add(responses.GET, TABLES_URL, json={
+        "tables": [listed_table("sales", "orders"), listed_table("sales", "refunds")],
+        "next_page_token": "page-2"
+    }, match=[matchers.query_param_matcher(first_page)])
+    responses.add(responses.GET, TABLES_URL, json={
+        "tables": [listed_table("crm", "users")]
+    }, match=[matchers.query_param_matcher({**first_page, "page_token": "page-2"})])
+    plugin = UnityCatalogPlugin(uc_config())
+
+    subjects = plugin.list_subjects()
+
+    assert subjects == ["main.sales.orders", "main.sales.refunds", "main.crm.users"]
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_list_subjects_filters_schema_prefix_server_side():
+    """Test a "catalog.schema." prefix is sent as a schema filter."""
+    responses.add(responses.GET, TABLES_URL, json={
+        "tables": [listed_table("sales", "orders"), listed_table("sales", "order_lines")]
+    }, match=[matchers.query_param_matcher({
+        "catalog_name": "main",
+        "max_results": "1000",
+        "schema_name": "sales"
+    })])
+    plugin = UnityCatalogPlugin(uc_config())
+
+    assert plugin.list_subjects(prefix="main.sales.order_") == ["main.sales.order_lines"]
+    assert plugin.list_subjects(prefix="other.sales.") == []
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_changed_schema_is_decoded_to_structs():
+    """Test a changed schema is checked as Iceberg structs, not dicts."""
+    responses.add(responses.GET, TABLES_URL + "/main.sales.orders",
+                  json=TABLES["main.sales.orders"])
+    plugin = UnityCatalogPlugin(uc_config())
+    changed = orjson.dumps({"type": "struct", "fields": [
+        {"id": 0, "name": "id", "type": "string", "required": True},
+        {"id": 1, "name": "amount", "type": "double"}
+    ]}).decode()
+
+    with mock.patch.object(plugin, "_check_iceberg_evolution",
+                           wraps=plugin._check_iceberg_evolution) as evolution:
+        result = plugin.check_compatibility("main.sales.orders", changed, SchemaFormat.ICEBERG)
+
+    current, new = evolution.call_args.args
+    assert isinstance(current, uc_plugin.IcebergSchema)
+    assert isinstance(new, uc_plugin.IcebergSchema)
+    assert isinstance(new.fields[0], uc_plugin.IcebergField)
+    assert not result.is_compatible
+    assert result.errors == ["Incompatible type change for field 'id': long → string"]
+
+
+@responses.activate
+def test_register_schemas_returns_per_subject_errors():
+    """Test concurrent registration reports failing tables next to the good ones."""
+    def create_table(request):
+        payload = orjson.loads(request.body)
+        if payload["name"] == "rejected":
+            return 400, {}, orjson.dumps({"error_code": "INVALID_PARAMETER_VALUE"})
+        return 200, {}, orjson.dumps({"table_id": "tid-" + payload["name"]})
+
+    responses.add_callback(responses.POST, TABLES_URL, callback=create_table)
+    plugin = UnityCatalogPlugin(uc_config())
+
+    results = plugin.register_schemas([
+        {"subject": subject, "schema_content": ORDERS_ICEBERG, "schema_format": SchemaFormat.ICEBERG}
+        for subject in ("main.sales.orders", "main.sales.rejected")
+    ])
+
+    assert isinstance(results["main.sales.orders"], Schema)
+    assert results["main.sales.orders"].metadata["table_id"] == "tid-orders"
+    assert isinstance(results["main.sales.rejected"], requests.exceptions.HTTPError)
+    payloads = sorted((orjson.loads(c.request.body) for c in responses.calls),
+                      key=lambda p: p["name"])
+    assert [p["name"] for p in payloads] == ["orders", "rejected"]
+    assert [c["type_name"] for c in payloads[0]["columns"]] == ["LONG", "DOUBLE"]